@@ -27,7 +27,12 @@ from core.constants import K
 from core.interactions import handle_interaction
 from core.io_utils import read_json, read_text
 from core.paths import resolve_repo_path
-from core.utils import dt_to_iso, iso_to_dt, safe_int, sanitize_text, utcnow
+from core.report_storage import close_all as close_report_stores
+from core.roles_storage import close_all as close_roles_stores
+from core.sync_protection import close_sync_protection
+from core.trust_storage import close_all as close_trust_stores
+from core.utility_storage import close_all as close_utility_stores, get_utility_store
+from core.utils import dt_to_iso, hash_backend, iso_to_dt, safe_int, sanitize_text, utcnow
 from core.help_system import help_system
 from modules.auto_responder import (
     handle_auto_responder,
@@ -161,6 +166,8 @@ class DiscBot(discord.Client):
 
     async def setup_hook(self) -> None:
         """Called when the bot is starting up."""
+        logger.info("Image hashing: SHA-256 via %s", hash_backend())
+
         # Register interaction handlers
         setup_verification()
         setup_moderation()
@@ -250,6 +257,12 @@ class DiscBot(discord.Client):
         """Cleanup when shutting down."""
         for state in list(self.guild_states.values()):
             await state.stop()
+
+        await close_report_stores()
+        await close_roles_stores()
+        await close_sync_protection()
+        await close_trust_stores()
+        await close_utility_stores()
         
         # Cancel and await background tasks
         tasks_to_cancel = []
@@ -335,9 +348,7 @@ class DiscBot(discord.Client):
         try:
             content_l = (message.content or "").strip().lower()
             if not content_l.startswith("afk"):
-                from core.utility_storage import UtilityStore
-
-                store = UtilityStore(message.author.id)
+                store = get_utility_store(message.author.id)
                 await store.initialize()
                 is_afk, _afk_msg = await store.is_afk()
                 if is_afk:
@@ -514,12 +525,11 @@ class DiscBot(discord.Client):
 
         # Notify when mentioning AFK users
         if message.mentions:
-            from core.utility_storage import UtilityStore
             afk_lines: list[str] = []
             for user in message.mentions:
                 if user.bot:
                     continue
-                store = UtilityStore(user.id)
+                store = get_utility_store(user.id)
                 await store.initialize()
                 is_afk, afk_message = await store.is_afk()
                 if not is_afk:
@@ -568,7 +578,7 @@ class DiscBot(discord.Client):
         if scanner_on:
             jobs = state.job_factory.build_jobs_for_message(message)
             for job in jobs:
-                await state.enqueue_job(job.to_dict())
+                await state.enqueue_job(job)
 
     # ─── Interaction Events ───────────────────────────────────────────────────
 
@@ -829,11 +839,10 @@ class DiscBot(discord.Client):
         bot_top_role = bot_member.top_role if bot_member else None
         
         for shard in shards:
-            data = await state.storage._read_shard_file(state.storage.shard_path(shard))
-            parsed_ids: list[tuple[int, str]] = [
-                (safe_int(uid), uid) for uid in data.keys() if safe_int(uid) is not None  # type: ignore
-            ]
-            parsed_ids.sort(key=lambda item: item[0])
+            data = await state.storage.read_shard(shard)
+            parsed_ids: list[tuple[int, str]] = sorted(
+                (int(uid), uid) for uid in data if uid.isdecimal()
+            )
             
             for user_id_int, user_id in parsed_ids:
                 if shard == start_shard and after_int is not None and user_id_int is not None and user_id_int <= after_int:
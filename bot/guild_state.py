@@ -7,14 +7,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import discord
 
 from core.constants import K
 from core.hashes import load_hashes
 from core.queueing import QueueProcessor, QueueStore
-from core.storage import SuspicionStore
+from core.storage import create_suspicion_store
+from core.trust_storage import get_trust_store
+from core.types import ScanJob
 from core.utils import build_cdn_regex, utcnow
 from services.enforcement import EnforcementService
 from services.job_factory import JobFactory
@@ -46,8 +48,13 @@ class GuildState:
         self.hashes: set[str] = set()
         
         # Storage and queuing
-        self.storage = SuspicionStore(self.guild_id, cache_size=3)
+        self.storage = create_suspicion_store(
+            self.guild_id, config.get(K.SUSPICION_BACKEND), cache_size=3
+        )
         self.queue_store = QueueStore(self.storage.root)
+        # Registers the guild's shared TrustStore with the configured backend
+        # before any trust command or service asks for it.
+        self.trust_store = get_trust_store(self.guild_id, config.get(K.TRUST_BACKEND))
         self.queue_processor = QueueProcessor(bot, self.queue_store, self.storage, config)
         
         # Services
@@ -130,10 +137,12 @@ class GuildState:
         # Stop processor and flush storage
         await self.queue_processor.stop()
         await self.storage.flush_all()
+        await self.storage.close()
         await self.queue_store.update_state(
             self.queue_processor.read_offset_bytes,
             self.queue_processor.queued_jobs,
         )
+        await self.queue_store.close()
         
         logger.info("Guild %s state stopped", self.guild_id)
 
@@ -261,7 +270,7 @@ class GuildState:
             not self.queue_processor.stop_event.is_set()
         )
 
-    async def enqueue_job(self, job: dict[str, Any]) -> bool:
+    async def enqueue_job(self, job: Union[ScanJob, dict[str, Any]]) -> bool:
         """
         Enqueue a scan job.
         
@@ -6,6 +6,7 @@ Provides per-artist, per-guild storage for commission data with async-safe opera
 from __future__ import annotations
 
 import asyncio
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -94,7 +95,7 @@ class CommissionStore:
         """Add a new commission to the queue."""
         async with self._lock:
             data = await self._read_queue()
-            data["commissions"][commission.id] = commission.to_dict()
+            data["commissions"][commission.id] = asdict(commission)
 
             # Update available slots
             active_count = len(data["commissions"])
@@ -215,7 +216,7 @@ class CommissionStore:
         """Add commission to history."""
         async with self._lock:
             data = await self._read_history()
-            data["commissions"].append(commission.to_dict())
+            data["commissions"].append(asdict(commission))
             await self._write_history(data)
 
     async def _get_commission_from_history(self, commission_id: str) -> Optional[Commission]:
@@ -263,7 +264,7 @@ class CommissionStore:
         """Add entry to waitlist."""
         async with self._lock:
             data = await self._read_waitlist()
-            data["entries"].append(entry.to_dict())
+            data["entries"].append(asdict(entry))
             # Update positions
             for i, e in enumerate(data["entries"]):
                 e["position"] = i + 1
@@ -49,6 +49,8 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "snapshot_members_per_run": 200,
     "enforcement_scan_max_users_per_run": 200,
     "queue_max_jobs": 1_000,
+    "suspicion_backend": "json",
+    "trust_backend": "json",
     "queue_compact_threshold_bytes": 5_000_000,
     "worker_count": 2,
     "worker_job_timeout_seconds": 15,
@@ -79,6 +81,8 @@ CONFIG_SCHEMA: Dict[str, Tuple[str, bool]] = {
     "snapshot_members_per_run": ("pos_int", True),
     "enforcement_scan_max_users_per_run": ("pos_int", True),
     "queue_max_jobs": ("pos_int", True),
+    "suspicion_backend": ("str_or_none", False),
+    "trust_backend": ("str_or_none", False),
     "queue_compact_threshold_bytes": ("pos_int", True),
     "worker_count": ("pos_int", True),
     "worker_job_timeout_seconds": ("pos_int", True),
@@ -204,6 +208,12 @@ def validate_and_normalize_config(data: Dict[str, Any]) -> Dict[str, Any]:
     allowed_domains = normalized.get("allowed_discord_cdn_domains") or []
     normalized["allowed_discord_cdn_domains"] = [d.lower() for d in allowed_domains]
 
+    if normalized.get("suspicion_backend") not in (None, "json", "sqlite"):
+        raise ConfigError('suspicion_backend must be "json" or "sqlite"')
+
+    if normalized.get("trust_backend") not in (None, "json", "sqlite"):
+        raise ConfigError('trust_backend must be "json" or "sqlite"')
+
     if OWNER_ID in (normalized.get("exemptions") or []):
         raise ConfigError("OWNER_ID must not appear in config files")
 
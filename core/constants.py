@@ -47,6 +47,10 @@ class ConfigKey:
     QUEUE_STATE_FLUSH_INTERVAL_SECONDS = "queue_state_flush_interval_seconds"
     ENFORCEMENT_INTERVAL_SECONDS = "enforcement_interval_seconds"
     
+    # Storage
+    SUSPICION_BACKEND = "suspicion_backend"
+    TRUST_BACKEND = "trust_backend"
+    
     # Workers
     WORKER_COUNT = "worker_count"
     WORKER_JOB_TIMEOUT_SECONDS = "worker_job_timeout_seconds"
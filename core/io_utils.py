@@ -6,20 +6,115 @@ Provides async-safe JSON reading/writing and text file operations.
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import json
+import mmap
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import Any, AsyncIterator, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Stdlib json hook so dataclass records serialize like they do under orjson."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json_line(data: Any) -> str:
+    """Serialize data (dataclass records included) as one newline-terminated JSON line (for .jsonl files)."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(data, ensure_ascii=True, default=_json_default) + "\n"
+
+
+def dumps_json(data: Any) -> str:
+    """Serialize data as a compact JSON string (dataclass records included)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, ensure_ascii=True, separators=(",", ":"), default=_json_default)
+
+
+def loads_json(text: Union[str, bytes]) -> Any:
+    """Parse a JSON document, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+class AsyncRWLock:
+    """
+    Readers-writer lock for asyncio.
+
+    Any number of readers may hold the lock together; a writer waits for
+    them to drain and excludes everyone. A waiting writer holds the gate,
+    so new readers queue behind it instead of starving it. Not reentrant.
+    """
+
+    def __init__(self) -> None:
+        self._gate = asyncio.Lock()
+        self._readers = 0
+        self._no_readers = asyncio.Event()
+        self._no_readers.set()
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[None]:
+        async with self._gate:
+            self._readers += 1
+            self._no_readers.clear()
+        try:
+            yield
+        finally:
+            self._readers -= 1
+            if self._readers == 0:
+                self._no_readers.set()
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[None]:
+        async with self._gate:
+            await self._no_readers.wait()
+            yield
+
+
+def _dumps_json_file(data: Any, compact: bool = False) -> bytes:
+    """Serialize data for a .json file (2-space indent unless compact, trailing newline)."""
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            # Types orjson rejects but stdlib json coerces; fall through.
+            pass
+    if compact:
+        text = json.dumps(data, ensure_ascii=True, separators=(",", ":"), default=_json_default)
+    else:
+        text = json.dumps(data, ensure_ascii=True, indent=2, default=_json_default)
+    return (text + "\n").encode("utf-8")
+
+
+def dumps_json_document(data: Any) -> bytes:
+    """Serialize data (dataclass records included) as an indented JSON document, ready to write."""
+    return _dumps_json_file(data)
 
 
 async def read_json(path: Path, default: Any = None) -> Any:
     def _read() -> Any:
         try:
-            with path.open("r", encoding="utf-8") as handle:
-                return json.load(handle)
+            with path.open("rb") as handle:
+                return loads_json(handle.read())
         except FileNotFoundError:
             return default
-        except (json.JSONDecodeError, OSError) as e:
+        except (ValueError, OSError) as e:
             import logging
             logger = logging.getLogger(__name__)
             logger.error("Failed to read JSON from %s: %s", path, e)
@@ -28,7 +123,34 @@ async def read_json(path: Path, default: Any = None) -> Any:
     return await asyncio.to_thread(_read)
 
 
-async def write_json_atomic(path: Path, data: Any) -> None:
+# Below this size a plain read beats the cost of setting up a mapping.
+MMAP_MIN_BYTES = 4096
+
+
+async def read_json_mapped(path: Path, default: Any = None) -> Any:
+    """Like read_json, but large files are parsed straight from an mmap when orjson is available."""
+    def _read() -> Any:
+        try:
+            with path.open("rb") as handle:
+                size = os.fstat(handle.fileno()).st_size
+                if orjson is None or size < MMAP_MIN_BYTES:
+                    return loads_json(handle.read())
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        return orjson.loads(view)
+        except FileNotFoundError:
+            return default
+        except (ValueError, OSError) as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error("Failed to read JSON from %s: %s", path, e)
+            return default
+
+    return await asyncio.to_thread(_read)
+
+
+async def write_json_atomic(path: Path, data: Any, compact: bool = False) -> None:
+    """Atomically replace path with data as JSON; compact=True skips indentation for machine-only files."""
     def _write() -> None:
         import secrets
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -36,8 +158,9 @@ async def write_json_atomic(path: Path, data: Any) -> None:
         tmp_suffix = f".tmp.{os.getpid()}.{secrets.token_hex(8)}"
         tmp_path = path.with_suffix(path.suffix + tmp_suffix)
         try:
-            with tmp_path.open("w", encoding="utf-8") as handle:
-                json.dump(data, handle, ensure_ascii=True, indent=2)
+            payload = _dumps_json_file(data, compact)
+            with tmp_path.open("wb") as handle:
+                handle.write(payload)
             os.replace(tmp_path, path)
         finally:
             # Clean up temp file if replace failed
@@ -50,6 +173,18 @@ async def write_json_atomic(path: Path, data: Any) -> None:
     await asyncio.to_thread(_write)
 
 
+async def stat_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for path, or None if it doesn't exist."""
+    def _stat() -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    return await asyncio.to_thread(_stat)
+
+
 async def read_text(path: Path) -> Optional[str]:
     def _read() -> Optional[str]:
         try:
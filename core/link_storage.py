@@ -323,6 +323,9 @@ class LinkStorage:
             data["protection"] = protection
             await self._write_guild_links(guild_id, data)
 
+        from .sync_protection import invalidate_guild_thresholds
+        invalidate_guild_thresholds(guild_id)
+
     async def remove_parent_link(self, guild_id: int, parent_guild_id: int) -> bool:
         """
         Remove a parent link.
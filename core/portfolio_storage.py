@@ -6,10 +6,11 @@ Provides per-user (global) storage for portfolio entries with async-safe operati
 from __future__ import annotations
 
 import asyncio
+from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from .io_utils import read_json, write_json_atomic
+from .io_utils import read_json, stat_signature, write_json_atomic
 from .paths import BASE_DIR
 from .utils import utcnow, dt_to_iso
 from .types import PortfolioEntry
@@ -25,6 +26,10 @@ class PortfolioStore:
         self.user_id = user_id
         self.portfolio_path = PORTFOLIO_DIR / f"{user_id}.json"
         self._lock = asyncio.Lock()
+        # Parsed portfolio plus the (mtime_ns, size) it was read at; external
+        # edits change the signature and force a re-read.
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_sig: Optional[Tuple[int, int]] = None
 
     async def initialize(self) -> None:
         """Ensure storage directory exists."""
@@ -48,6 +53,9 @@ class PortfolioStore:
                 "image": None,
             },
         }
+        sig = await stat_signature(self.portfolio_path)
+        if sig is not None and self._cache is not None and sig == self._cache_sig:
+            return self._cache
         data = await read_json(self.portfolio_path, default=default)
         if not isinstance(data, dict):
             return default
@@ -55,11 +63,22 @@ class PortfolioStore:
         for key in default:
             if key not in data:
                 data[key] = default[key]
+        if sig is not None:
+            self._cache = data
+            self._cache_sig = sig
         return data
 
     async def _write_portfolio(self, data: Dict[str, Any]) -> None:
         """Write portfolio file."""
-        await write_json_atomic(self.portfolio_path, data)
+        try:
+            await write_json_atomic(self.portfolio_path, data)
+        except Exception:
+            # Callers mutate the cached dict in place; drop it if disk didn't take the change.
+            self._cache = None
+            self._cache_sig = None
+            raise
+        self._cache = data
+        self._cache_sig = await stat_signature(self.portfolio_path)
 
     # ─── Entries ──────────────────────────────────────────────────────────────
 
@@ -67,7 +86,7 @@ class PortfolioStore:
         """Add a new portfolio entry."""
         async with self._lock:
             data = await self._read_portfolio()
-            data["entries"].append(entry.to_dict())
+            data["entries"].append(asdict(entry))
             await self._write_portfolio(data)
 
     async def get_entry(self, entry_id: str) -> Optional[PortfolioEntry]:
@@ -233,7 +252,7 @@ class PortfolioStore:
         """Get list of categories."""
         async with self._lock:
             data = await self._read_portfolio()
-            return data["categories"]
+            return list(data["categories"])
 
     async def add_category(self, category: str) -> None:
         """Add a new category."""
@@ -293,7 +312,7 @@ class PortfolioStore:
         """Get all commission rates."""
         async with self._lock:
             data = await self._read_portfolio()
-            return data.get("rates", {})
+            return dict(data.get("rates", {}))
 
     async def set_rate(self, name: str, price: float, description: str = "", image: str = None) -> None:
         """Set a commission rate."""
@@ -350,7 +369,10 @@ class PortfolioStore:
         """Get rate card display settings."""
         async with self._lock:
             data = await self._read_portfolio()
-            return data.get("rate_card_settings", {
+            settings = data.get("rate_card_settings")
+            if settings is not None:
+                return dict(settings)
+            return {
                 "title": "Commission Rates",
                 # Keep subtitle empty by default; templates render it but do not
                 # inject placeholder copy unless the user sets it.
@@ -358,7 +380,7 @@ class PortfolioStore:
                 "status": "open",
                 "currency": "$",
                 "template": "minimal",
-            })
+            }
 
     async def update_rate_card_settings(self, settings: Dict[str, Any]) -> None:
         """Update rate card display settings."""
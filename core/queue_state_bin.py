@@ -0,0 +1,80 @@
+"""
+Binary queue state file.
+
+Stores the queue read offset, queued job count and compaction counter in a
+fixed-size header that is updated in place through mmap, so hot state
+updates are a struct pack instead of a temp-file write + rename.
+"""
+from __future__ import annotations
+
+import mmap
+import struct
+from pathlib import Path
+from typing import BinaryIO, Optional, Tuple
+
+MAGIC = b"DBQS"
+# magic, read_offset_bytes, queued_jobs, compactions
+STATE_STRUCT = struct.Struct("<4sQQQ")
+
+
+class BinaryQueueState:
+    """Memory-mapped fixed-length queue state header."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._handle: Optional[BinaryIO] = None
+        self._mm: Optional[mmap.mmap] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._mm is not None
+
+    def open(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Map the state file, creating it if needed.
+
+        Returns (read_offset_bytes, queued_jobs, compactions) when the file held
+        a valid header, or None for a new/corrupt file.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        mode = "r+b" if self.path.exists() else "w+b"
+        handle = self.path.open(mode)
+        try:
+            handle.seek(0, 2)
+            if handle.tell() != STATE_STRUCT.size:
+                handle.truncate(STATE_STRUCT.size)
+            self._mm = mmap.mmap(handle.fileno(), STATE_STRUCT.size)
+        except Exception:
+            handle.close()
+            raise
+        self._handle = handle
+        magic, read_offset, queued_jobs, compactions = STATE_STRUCT.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            return None
+        return read_offset, queued_jobs, compactions
+
+    def write(self, read_offset: int, queued_jobs: int, compactions: int) -> None:
+        if self._mm is None:
+            raise RuntimeError("queue state file is not open")
+        STATE_STRUCT.pack_into(
+            self._mm,
+            0,
+            MAGIC,
+            max(0, int(read_offset)),
+            max(0, int(queued_jobs)),
+            max(0, int(compactions)),
+        )
+
+    def sync(self) -> None:
+        """Flush the mapped header to disk (msync)."""
+        if self._mm is not None:
+            self._mm.flush()
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.flush()
+            self._mm.close()
+            self._mm = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
@@ -6,47 +6,182 @@ Provides persistent queue storage and worker-based processing.
 from __future__ import annotations
 
 import asyncio
-import json
+import heapq
+import logging
 from collections import deque
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 
 import aiohttp
 import discord
+from yarl import URL
 
 from .permissions import is_module_enabled
 from .io_utils import (
     append_text,
+    dumps_json_line,
+    loads_json,
     read_json,
     read_queue_lines,
     rewrite_queue_file,
     write_json_atomic,
 )
+from .queue_state_bin import BinaryQueueState
 from .storage import SuspicionStore
-from .utils import build_cdn_regex, hash_bytes, magic_bytes_valid, safe_int
+from .types import ScanJob
+from .utils import hash_bytes, magic_bytes_valid, new_hasher, safe_int
 
 if TYPE_CHECKING:
     from bot.client import DiscBot
 
+logger = logging.getLogger("discbot.queue")
+
+# Bytes buffered from the start of a streamed download for magic-byte sniffing.
+MAGIC_HEAD_BYTES = 32
+
+
+def _validate_and_hash(data: bytes) -> Optional[str]:
+    """Magic-byte check plus SHA-256 in one call, meant to run off the event loop."""
+    if not magic_bytes_valid(data):
+        return None
+    return hash_bytes(data)
+
 
 class QueueStore:
+    # State changes are buffered in memory and written by a background flusher.
+    # Routine flushes only update the mmap'd binary header; the JSON copy (kept
+    # for debugging/legacy) is rewritten on durable flushes such as shutdown.
+    FLUSH_INTERVAL_SECONDS = 0.05
+    FLUSH_MAX_PENDING_CHANGES = 256
+
     def __init__(self, root: Path) -> None:
         self.queue_path = root / "queue.jsonl"
         self.state_path = root / "queue.state.json"
+        self.state_bin = BinaryQueueState(root / "queue.state.bin")
         self.state_lock = asyncio.Lock()
         self.state: Dict[str, Any] = {}
+        self._state_dirty = False
+        self._json_stale = False
+        self._pending_changes = 0
+        self._dirty_event = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def initialize(self) -> None:
-        data = await read_json(self.state_path, default=None)
-        if data is None:
-            data = {"read_offset_bytes": 0, "queued_jobs": 0, "compactions": 0}
-            await write_json_atomic(self.state_path, data)
+        stored = None
+        if not self.state_bin.is_open:
+            try:
+                stored = await asyncio.to_thread(self.state_bin.open)
+            except (OSError, ValueError) as e:
+                logger.warning("Binary queue state unavailable, using JSON only: %s", e)
+        if stored is not None:
+            read_offset, queued_jobs, compactions = stored
+            data = {
+                "read_offset_bytes": read_offset,
+                "queued_jobs": queued_jobs,
+                "compactions": compactions,
+            }
+        else:
+            data = await read_json(self.state_path, default=None)
+            if data is None:
+                data = {"read_offset_bytes": 0, "queued_jobs": 0, "compactions": 0}
+                await write_json_atomic(self.state_path, data)
         self.state = data
         if "queued_jobs" not in self.state:
             await self.rebuild_queue_length()
+        elif stored is None and self.state_bin.is_open:
+            self._write_state_bin()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def close(self) -> None:
+        """Stop the background flusher and persist any buffered state."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush(durable=True)
+        await asyncio.to_thread(self.state_bin.close)
+
+    async def flush(self, durable: bool = False) -> None:
+        """
+        Persist buffered state if anything changed since the last flush.
+
+        Routine flushes update the mmap'd binary header only; ``durable`` also
+        msyncs it and rewrites the JSON state file.
+        """
+        async with self.state_lock:
+            await self._flush_locked(durable)
+
+    def _write_state_bin(self) -> None:
+        self.state_bin.write(
+            int(self.state.get("read_offset_bytes", 0)),
+            int(self.state.get("queued_jobs", 0)),
+            int(self.state.get("compactions", 0)),
+        )
+
+    async def _flush_locked(self, durable: bool = False) -> None:
+        if self._state_dirty:
+            self._state_dirty = False
+            self._pending_changes = 0
+            if self.state_bin.is_open:
+                self._write_state_bin()
+            self._json_stale = True
+        if not self._json_stale:
+            return
+        if self.state_bin.is_open and not durable:
+            return
+        self._json_stale = False
+        try:
+            if self.state_bin.is_open:
+                await asyncio.to_thread(self.state_bin.sync)
+            await write_json_atomic(self.state_path, dict(self.state))
+        except Exception:
+            self._json_stale = True
+            raise
+
+    async def _flush_loop(self) -> None:
+        while True:
+            # Sleep until something changes, then give concurrent acks a moment to coalesce.
+            await self._dirty_event.wait()
+            await asyncio.sleep(self.FLUSH_INTERVAL_SECONDS)
+            self._dirty_event.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error("Failed to flush queue state: %s", e)
+
+    def mark_dirty(self, read_offset: int, queued_jobs: int) -> None:
+        """
+        Record a new read offset and queue length without writing to disk.
+
+        The background flusher persists the latest values shortly afterwards.
+        """
+        read_offset = int(read_offset)
+        queued_jobs = max(0, int(queued_jobs))
+        if (
+            int(self.state.get("read_offset_bytes", 0)) == read_offset
+            and int(self.state.get("queued_jobs", 0)) == queued_jobs
+        ):
+            return
+        self.state["read_offset_bytes"] = read_offset
+        self.state["queued_jobs"] = queued_jobs
+        self._state_dirty = True
+        self._pending_changes += 1
+        self._dirty_event.set()
+
+    async def _mark_state_dirty_locked(self) -> None:
+        self._state_dirty = True
+        self._pending_changes += 1
+        self._dirty_event.set()
+        if self._pending_changes >= self.FLUSH_MAX_PENDING_CHANGES:
+            await self._flush_locked()
 
     async def rebuild_queue_length(self) -> None:
+        async with self.state_lock:
+            await self._rebuild_queue_length_locked()
+
+    async def _rebuild_queue_length_locked(self) -> None:
+        """Recount queued_jobs from the queue file; caller must hold state_lock."""
         read_offset = int(self.state.get("read_offset_bytes", 0))
 
         def _count_from_offset() -> int:
@@ -60,11 +195,11 @@ class QueueStore:
             return count
 
         remaining = await asyncio.to_thread(_count_from_offset)
-        async with self.state_lock:
-            self.state["queued_jobs"] = max(0, remaining)
-            await write_json_atomic(self.state_path, self.state)
+        self.state["queued_jobs"] = max(0, remaining)
+        self._state_dirty = True
+        await self._flush_locked(durable=True)
 
-    async def enqueue(self, job: Dict[str, Any], max_jobs: int) -> bool:
+    async def enqueue(self, job: Union[ScanJob, Dict[str, Any]], max_jobs: int) -> bool:
         async with self.state_lock:
             queued = int(self.state.get("queued_jobs", 0))
             if queued >= max_jobs:
@@ -72,40 +207,63 @@ class QueueStore:
             
             try:
                 # Write to queue file first
-                await append_text(self.queue_path, json.dumps(job, ensure_ascii=True) + "\n")
+                await append_text(self.queue_path, dumps_json_line(job))
                 
                 # Then update state (this way if append fails, state isn't incremented)
                 self.state["queued_jobs"] = queued + 1
-                await write_json_atomic(self.state_path, self.state)
+                await self._mark_state_dirty_locked()
             except Exception as e:
-                import logging
-                logger = logging.getLogger("discbot.queue")
                 logger.error("Failed to enqueue job, rebuilding state: %s", e)
-                # Rebuild queued_jobs count from file
-                await self.rebuild_state_from_file()
+                # Rebuild queued_jobs count from file (state_lock is already held)
+                await self._rebuild_queue_length_locked()
                 return False
         return True
 
-    async def update_state(self, read_offset: int, queued_jobs: int) -> None:
+    async def update_state(self, read_offset: int, queued_jobs: int, flush: bool = False) -> None:
+        """
+        Update the persisted read offset and queue length.
+
+        Set ``flush`` for updates that must hit disk immediately (e.g. after the
+        queue file has been compacted and offsets were rebased).
+        """
         async with self.state_lock:
             read_offset = int(read_offset)
             queued_jobs = max(0, int(queued_jobs))
             if (
-                int(self.state.get("read_offset_bytes", 0)) == read_offset
-                and int(self.state.get("queued_jobs", 0)) == queued_jobs
+                int(self.state.get("read_offset_bytes", 0)) != read_offset
+                or int(self.state.get("queued_jobs", 0)) != queued_jobs
             ):
-                return
-            self.state["read_offset_bytes"] = read_offset
-            self.state["queued_jobs"] = queued_jobs
-            await write_json_atomic(self.state_path, self.state)
+                self.state["read_offset_bytes"] = read_offset
+                self.state["queued_jobs"] = queued_jobs
+                await self._mark_state_dirty_locked()
+            if flush:
+                await self._flush_locked(durable=True)
+
+    async def compact(self, read_offset: int, queued_jobs: int) -> None:
+        """
+        Drop consumed bytes from the queue file and rebase the read offset to 0.
+
+        Holds the state lock so no enqueue can append mid-rewrite, and flushes
+        durably because the old offset is meaningless for the new file.
+        """
+        async with self.state_lock:
+            await rewrite_queue_file(self.queue_path, read_offset)
+            self.state["read_offset_bytes"] = 0
+            self.state["queued_jobs"] = max(0, int(queued_jobs))
+            self.state["compactions"] = int(self.state.get("compactions", 0)) + 1
+            self._state_dirty = True
+            await self._flush_locked(durable=True)
 
     async def increment_compactions(self) -> None:
         async with self.state_lock:
             self.state["compactions"] = int(self.state.get("compactions", 0)) + 1
-            await write_json_atomic(self.state_path, self.state)
+            await self._mark_state_dirty_locked()
 
 
 class QueueProcessor:
+    READ_BATCH_LINES = 200
+    IDLE_WAIT_SECONDS = 5.0
+
     def __init__(
         self,
         bot: "DiscBot",
@@ -124,8 +282,11 @@ class QueueProcessor:
         self.queue: asyncio.Queue[Tuple[Dict[str, Any], int]] = asyncio.Queue(
             maxsize=max(1, int(config.get("queue_max_jobs", 1000)))
         )
-        self.pending_order: Deque[int] = deque()
-        self.pending_done: Dict[int, bool] = {}
+        # End offsets of in-flight jobs in enqueue (file) order, plus a min-heap of
+        # offsets that finished out of order. The committed read offset advances
+        # while the heap's smallest entry is the oldest outstanding job.
+        self._enqueue_order: Deque[int] = deque()
+        self._completed_heap: List[int] = []
         self.read_offset_bytes = int(store.state.get("read_offset_bytes", 0))
         self.next_read_offset = self.read_offset_bytes
         self.queued_jobs = int(store.state.get("queued_jobs", 0))
@@ -133,10 +294,15 @@ class QueueProcessor:
         self.stop_event = asyncio.Event()
         self.stop_event.set()  # Initially stopped - must be explicitly started
         self.reader_task: Optional[asyncio.Task] = None
+        self.compaction_task: Optional[asyncio.Task] = None
+        self._compaction_requested = asyncio.Event()
+        # Held by the reader while dispatching a batch and by compaction while rewriting.
+        self._compaction_lock = asyncio.Lock()
+        # Set by enqueue() so the reader picks up new jobs without polling.
+        self._wakeup = asyncio.Event()
         self.worker_tasks: List[asyncio.Task] = []
         self.session: Optional[aiohttp.ClientSession] = None
-        self.cdn_regex = build_cdn_regex(config.get("allowed_discord_cdn_domains", []))
-        self.allowed_cdn_domains = {d.lower() for d in config.get("allowed_discord_cdn_domains", [])}
+        self._set_allowed_domains(config.get("allowed_discord_cdn_domains", []))
         # Lock for ACK processing to prevent concurrent state modification
         self.ack_lock = asyncio.Lock()
 
@@ -147,15 +313,30 @@ class QueueProcessor:
         self.worker_timeout = float(config.get("worker_job_timeout_seconds", 15))
         self.worker_count = int(config.get("worker_count", 1))
         self.compact_threshold = int(config.get("queue_compact_threshold_bytes", 0))
-        self.cdn_regex = build_cdn_regex(config.get("allowed_discord_cdn_domains", []))
-        self.allowed_cdn_domains = {d.lower() for d in config.get("allowed_discord_cdn_domains", [])}
+        self._set_allowed_domains(config.get("allowed_discord_cdn_domains", []))
+
+    def _set_allowed_domains(self, domains: List[str]) -> None:
+        self.allowed_cdn_domains = frozenset(d.lower() for d in domains)
+        self._allowed_suffixes = tuple("." + d for d in self.allowed_cdn_domains)
+
+    def _allowed_host(self, host: str) -> bool:
+        """Exact or subdomain match against the allowed CDN domains (no regex)."""
+        return host in self.allowed_cdn_domains or host.endswith(self._allowed_suffixes)
 
     async def start(self) -> None:
         if self.session is None:
             timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            # Reuse keep-alive connections and cached DNS for the handful of CDN hosts.
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+            )
+            self.session = aiohttp.ClientSession(timeout=timeout, connector=connector)
         self.stop_event.clear()
         self.reader_task = asyncio.create_task(self._reader_loop())
+        self.compaction_task = asyncio.create_task(self._compaction_loop())
         self.worker_tasks = [
             asyncio.create_task(self._worker_loop(i))
             for i in range(self.worker_count)
@@ -165,78 +346,89 @@ class QueueProcessor:
         self.stop_event.set()
         if self.reader_task:
             self.reader_task.cancel()
+        if self.compaction_task:
+            self.compaction_task.cancel()
         for task in self.worker_tasks:
             task.cancel()
-        await asyncio.gather(*(t for t in [self.reader_task, *self.worker_tasks] if t), return_exceptions=True)
+        await asyncio.gather(
+            *(t for t in [self.reader_task, self.compaction_task, *self.worker_tasks] if t),
+            return_exceptions=True,
+        )
         if self.session:
             await self.session.close()
             self.session = None
 
-    async def enqueue(self, job: Dict[str, Any]) -> bool:
+    async def enqueue(self, job: Union[ScanJob, Dict[str, Any]]) -> bool:
         ok = await self.store.enqueue(job, int(self.config.get("queue_max_jobs", 1000)))
         if ok:
             self.queued_jobs += 1
+            self._wakeup.set()
         return ok
 
+    async def _wait_for_work(self) -> None:
+        """Sleep until an enqueue signals new work (or the idle timeout passes)."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.IDLE_WAIT_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
     async def _reader_loop(self) -> None:
-        empty_reads = 0
         while not self.stop_event.is_set():
-            if self.queue.full():
-                await asyncio.sleep(0.2)
-                continue
+            # Compaction rewrites the queue file and rebases offsets; never overlap a read batch.
+            async with self._compaction_lock:
+                dispatched = await self._read_batch()
+            if not dispatched:
+                await self._wait_for_work()
+
+    async def _read_batch(self) -> bool:
+        """Dispatch the next batch of queued lines to workers. Returns False when idle."""
+        # Avoid spinning up a thread to read the queue file when there's nothing new to read.
+        # When idle, the repeated `asyncio.to_thread()` calls in `read_queue_lines()` can add
+        # measurable CPU overhead, especially across multiple guilds.
+        try:
+            if not self.store.queue_path.exists():
+                return False
+            size = self.store.queue_path.stat().st_size
+        except OSError:
+            return False
 
-            # Avoid spinning up a thread to read the queue file when there's nothing new to read.
-            # When idle, the repeated `asyncio.to_thread()` calls in `read_queue_lines()` can add
-            # measurable CPU overhead, especially across multiple guilds.
-            try:
-                if not self.store.queue_path.exists():
-                    empty_reads = min(empty_reads + 1, 6)
-                    await asyncio.sleep(min(0.5 * (2 ** (empty_reads - 1)), 5.0))
-                    continue
-                size = self.store.queue_path.stat().st_size
-            except OSError:
-                empty_reads = min(empty_reads + 1, 6)
-                await asyncio.sleep(min(0.5 * (2 ** (empty_reads - 1)), 5.0))
-                continue
+        if size < self.next_read_offset and not self._enqueue_order:
+            # Queue file was truncated/rotated unexpectedly; reset to start to avoid being stuck.
+            # Wait for in-flight jobs first so offsets stay monotonic for ack ordering.
+            self.next_read_offset = 0
 
-            if size < self.next_read_offset:
-                # Queue file was truncated/rotated unexpectedly; reset to start to avoid being stuck.
-                self.next_read_offset = 0
+        if size <= self.next_read_offset:
+            return False
 
-            if size <= self.next_read_offset:
-                empty_reads = min(empty_reads + 1, 6)
-                await asyncio.sleep(min(0.5 * (2 ** (empty_reads - 1)), 5.0))
+        lines = await read_queue_lines(
+            self.store.queue_path, self.next_read_offset, max_lines=self.READ_BATCH_LINES
+        )
+        if not lines:
+            return False
+        for line, end_offset in lines:
+            if not line.strip():
+                self.next_read_offset = end_offset
                 continue
-
-            lines = await read_queue_lines(self.store.queue_path, self.next_read_offset)
-            if not lines:
-                # Back off when idle to reduce CPU/IO churn.
-                empty_reads = min(empty_reads + 1, 6)
-                await asyncio.sleep(min(0.5 * (2 ** (empty_reads - 1)), 5.0))
+            try:
+                job = loads_json(line)
+                if not isinstance(job, dict):
+                    raise ValueError("job not dict")
+            except Exception:
+                self.next_read_offset = end_offset
+                self._enqueue_order.append(end_offset)
+                await self._ack_processed(end_offset)
                 continue
-            empty_reads = 0
-            for line, end_offset in lines:
-                if not line.strip():
-                    self.next_read_offset = end_offset
-                    continue
-                try:
-                    job = json.loads(line)
-                    if not isinstance(job, dict):
-                        raise ValueError("job not dict")
-                except Exception:
-                    self.next_read_offset = end_offset
-                    self.pending_order.append(end_offset)
-                    self.pending_done[end_offset] = True
-                    await self._ack_processed(end_offset)
-                    continue
+            # Only yield to the event loop when workers are actually behind.
+            try:
+                self.queue.put_nowait((job, end_offset))
+            except asyncio.QueueFull:
                 await self.queue.put((job, end_offset))
-                self.pending_order.append(end_offset)
-                self.pending_done[end_offset] = False
-                self.next_read_offset = end_offset
+            self._enqueue_order.append(end_offset)
+            self.next_read_offset = end_offset
+        return True
 
     async def _worker_loop(self, worker_id: int) -> None:
-        import logging
-        logger = logging.getLogger("discbot.queue")
         while not self.stop_event.is_set():
             try:
                 job, end_offset = await self.queue.get()
@@ -271,32 +463,52 @@ class QueueProcessor:
     async def _ack_processed(self, end_offset: int) -> None:
         # Serialize ACK processing to prevent concurrent state corruption
         async with self.ack_lock:
-            if end_offset not in self.pending_done:
-                return
-            self.pending_done[end_offset] = True
+            order = self._enqueue_order
+            heap = self._completed_heap
             progressed = False
-            while self.pending_order and self.pending_done.get(self.pending_order[0]):
-                done_offset = self.pending_order.popleft()
-                self.pending_done.pop(done_offset, None)
+            if order and order[0] == end_offset:
+                # In-order completion (the common case): advance without touching the heap.
+                order.popleft()
+                self.read_offset_bytes = end_offset
+                self.queued_jobs = max(0, self.queued_jobs - 1)
+                progressed = True
+            else:
+                heapq.heappush(heap, end_offset)
+            while heap and order and heap[0] == order[0]:
+                done_offset = heapq.heappop(heap)
+                order.popleft()
                 self.read_offset_bytes = done_offset
                 self.queued_jobs = max(0, self.queued_jobs - 1)
                 progressed = True
             if progressed:
-                await self.store.update_state(self.read_offset_bytes, self.queued_jobs)
+                self.store.mark_dirty(self.read_offset_bytes, self.queued_jobs)
+                if self._compaction_due():
+                    self._compaction_requested.set()
+
+    def _compaction_due(self) -> bool:
+        return (
+            self.compact_threshold > 0
+            and self.read_offset_bytes >= self.compact_threshold
+            and not self._enqueue_order
+        )
+
+    async def _compaction_loop(self) -> None:
+        while not self.stop_event.is_set():
+            await self._compaction_requested.wait()
+            self._compaction_requested.clear()
+            try:
                 await self._maybe_compact()
+            except Exception as e:
+                logger.error("Queue compaction failed: %s", e)
 
     async def _maybe_compact(self) -> None:
-        if self.compact_threshold <= 0:
-            return
-        if self.read_offset_bytes < self.compact_threshold:
-            return
-        if self.pending_order:
-            return
-        await rewrite_queue_file(self.store.queue_path, self.read_offset_bytes)
-        self.read_offset_bytes = 0
-        self.next_read_offset = 0
-        await self.store.increment_compactions()
-        await self.store.update_state(self.read_offset_bytes, self.queued_jobs)
+        async with self._compaction_lock:
+            async with self.ack_lock:
+                if not self._compaction_due():
+                    return
+                await self.store.compact(self.read_offset_bytes, self.queued_jobs)
+                self.read_offset_bytes = 0
+                self.next_read_offset = 0
 
     async def _process_job(self, job: Dict[str, Any]) -> None:
         guild_id = safe_int(job.get("guild_id"), default=0)
@@ -369,25 +581,17 @@ class QueueProcessor:
             if isinstance(attachment_info, dict):
                 url = attachment_info.get("url")
                 if url:
-                    data = await self._download_url(url)
-        if not data:
+                    return await self._stream_and_hash(url)
             return None
         if len(data) > max_bytes:
             return None
-        if not magic_bytes_valid(data):
-            return None
-        return hash_bytes(data)
+        return await asyncio.to_thread(_validate_and_hash, data)
 
     async def _hash_from_url_job(self, job: Dict[str, Any]) -> Optional[str]:
         url = job.get("url")
         if not isinstance(url, str):
             return None
-        data = await self._download_url(url)
-        if not data:
-            return None
-        if not magic_bytes_valid(data):
-            return None
-        return hash_bytes(data)
+        return await self._stream_and_hash(url)
 
     async def _hash_from_link_job(self, job: Dict[str, Any]) -> Optional[str]:
         linked = job.get("linked")
@@ -423,25 +627,60 @@ class QueueProcessor:
             return None
         if len(data) > max_bytes:
             return None
-        if not magic_bytes_valid(data):
+        return await asyncio.to_thread(_validate_and_hash, data)
+
+    async def _stream_and_hash(self, url: str) -> Optional[str]:
+        """
+        Download url and hash it chunk by chunk without buffering the body.
+
+        The first MAGIC_HEAD_BYTES are kept for magic-byte validation; the
+        download is abandoned as soon as they show the payload isn't an image.
+        """
+        hasher = new_hasher()
+        head = bytearray()
+
+        def _sink(chunk: bytes) -> bool:
+            if len(head) < MAGIC_HEAD_BYTES:
+                head.extend(chunk[: MAGIC_HEAD_BYTES - len(head)])
+                if len(head) >= MAGIC_HEAD_BYTES and not magic_bytes_valid(bytes(head)):
+                    return False
+            hasher.update(chunk)
+            return True
+
+        if not await self._download_url(url, _sink):
+            return None
+        if not head or not magic_bytes_valid(bytes(head)):
             return None
-        return hash_bytes(data)
+        return hasher.hexdigest()
 
-    async def _download_url(self, url: str) -> Optional[bytes]:
-        import logging
-        logger = logging.getLogger("discbot.queue")
-        
-        if not self.session:
-            logger.debug("Download failed: no session")
+    def _check_url(self, url: str) -> Optional[str]:
+        """Return the lowercased host if url is an HTTPS link to an allowed CDN, else None."""
+        if url[:8].lower() != "https://":
+            return None
+        try:
+            host = URL(url).host
+        except (TypeError, ValueError):
             return None
-        parsed = urlparse(url)
-        if parsed.scheme.lower() != "https":
-            logger.debug("Download failed: non-HTTPS scheme %s", parsed.scheme)
+        if not host:
             return None
-        host = (parsed.hostname or "").lower()
-        if host not in self.allowed_cdn_domains:
-            logger.debug("Download failed: blocked domain %s", host)
+        host = host.lower()
+        if not self._allowed_host(host):
             return None
+        return host
+
+    async def _download_url(self, url: str, sink: Callable[[bytes], bool]) -> bool:
+        """
+        Stream an allowed CDN url into sink, enforcing max_image_bytes.
+
+        sink returns False to abort the download. Returns True only when the
+        full body was delivered.
+        """
+        if not self.session:
+            logger.debug("Download failed: no session")
+            return False
+        if self._check_url(url) is None:
+            logger.debug("Download failed: not an allowed HTTPS CDN url %s", url)
+            return False
         max_bytes = self.max_image_bytes
         current_url = url
         for _ in range(3):
@@ -450,27 +689,25 @@ class QueueProcessor:
                     if 300 <= resp.status < 400:
                         location = resp.headers.get("Location")
                         if not location:
-                            return None
-                        next_url = location
-                        parsed_next = urlparse(next_url)
-                        if parsed_next.scheme.lower() != "https":
-                            return None
-                        if (parsed_next.hostname or "").lower() not in self.allowed_cdn_domains:
-                            return None
-                        current_url = next_url
+                            return False
+                        if self._check_url(location) is None:
+                            return False
+                        current_url = location
                         continue
                     if resp.status != 200:
-                        return None
+                        return False
                     content_length = resp.headers.get("Content-Length")
                     if content_length and content_length.isdigit():
                         if int(content_length) > max_bytes:
-                            return None
-                    data = bytearray()
+                            return False
+                    total = 0
                     async for chunk in resp.content.iter_chunked(8192):
-                        data.extend(chunk)
-                        if len(data) > max_bytes:
-                            return None
-                    return bytes(data)
+                        total += len(chunk)
+                        if total > max_bytes:
+                            return False
+                        if not sink(chunk):
+                            return False
+                    return total > 0
             except Exception:
-                return None
-        return None
+                return False
+        return False
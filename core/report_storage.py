@@ -6,35 +6,96 @@ Provides per-guild storage for report data with async-safe operations.
 from __future__ import annotations
 
 import asyncio
+import bisect
+import logging
+import os
+from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-from .io_utils import read_json, write_json_atomic
+from .io_utils import AsyncRWLock, dumps_json_line, loads_json, read_json, stat_signature, write_json_atomic
 from .paths import BASE_DIR
-from .utils import utcnow, dt_to_iso
+from .utils import utcnow, dt_to_iso, dt_to_iso_now, iso_sort_key
 from .types import UserReport
 
+logger = logging.getLogger("discbot.report_storage")
+
+_EMPTY_REPORTER_STATS: Mapping[str, Any] = MappingProxyType({
+    "total": 0,
+    "upheld": 0,
+    "dismissed": 0,
+    "flagged": False,
+})
+
 # Storage directory
 REPORT_DIR = BASE_DIR / "data" / "moderation"
 
 
+# Journal compaction thresholds
+JOURNAL_MAX_LINES = 500
+JOURNAL_MAX_BYTES = 1024 * 1024
+# Mutations within this window are appended to the journal together
+FLUSH_DELAY_SECONDS = 0.05
+
+
 class ReportStore:
-    """Per-guild storage for user reports."""
+    """Per-guild storage for user reports.
+
+    reports.json is a snapshot; mutations are applied in memory, appended
+    to reports.log.jsonl in debounced batches (call flush() on shutdown)
+    and folded back into the snapshot once the journal grows past
+    JOURNAL_MAX_LINES / JOURNAL_MAX_BYTES. Journal ops carry full values
+    (not deltas) so replaying a line that is already in the snapshot is
+    harmless.
+    """
 
     def __init__(self, guild_id: int) -> None:
         self.guild_id = guild_id
         self.root = REPORT_DIR / str(guild_id)
         self.reports_path = self.root / "reports.json"
-        self._lock = asyncio.Lock()
+        self.journal_path = self.root / "reports.log.jsonl"
+        self._initialized = False
+        self._lock = AsyncRWLock()
+        # Config is read on every auto-close sweep; it gets its own lock so those
+        # reads don't queue behind report writes. Acquire after _lock when taking both.
+        self._config_lock = AsyncRWLock()
+        # Snapshot + replayed journal, plus the (mtime_ns, size) of both files it reflects.
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_sig: Optional[Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]] = None
+        self._journal_lines = 0
+        # Reporter ids whose stats are flagged; swapped atomically, read without locking.
+        self._flagged_ids: frozenset[str] = frozenset()
+        # Serialized journal ops not yet appended; written by a debounced flush task.
+        self._pending_lines: List[str] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_delay = FLUSH_DELAY_SECONDS
+        # Side indexes over the data dict in _index_src: (created_at ISO string, report id)
+        # sorted ascending, and report ids bucketed by status / category.
+        self._created_index: List[Tuple[str, str]] = []
+        self._by_status: Dict[str, Dict[str, None]] = {}
+        self._by_category: Dict[str, Dict[str, None]] = {}
+        self._index_src: Optional[Dict[str, Any]] = None
 
     async def initialize(self) -> None:
         """Ensure storage directory exists."""
+        if self._initialized:
+            return
         await asyncio.to_thread(self.root.mkdir, parents=True, exist_ok=True)
+        self._initialized = True
 
     # ─── Reports ──────────────────────────────────────────────────────────────
 
+    async def _files_signature(
+        self,
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        return (
+            await stat_signature(self.reports_path),
+            await stat_signature(self.journal_path),
+        )
+
     async def _read_reports(self) -> Dict[str, Any]:
-        """Read reports file."""
+        """Read reports snapshot and replay the journal on top of it."""
         default = {
             "reports": {},
             "reporter_stats": {},
@@ -50,24 +111,196 @@ class ReportStore:
                 ],
             },
         }
+        if self._pending_lines and self._cache is not None:
+            # In-memory data is ahead of disk until the queued ops are flushed.
+            return self._cache
+        sig = await self._files_signature()
+        if self._cache is not None and sig == self._cache_sig:
+            return self._cache
         data = await read_json(self.reports_path, default=default)
         if not isinstance(data, dict):
-            return default
+            data = default
         # Ensure all keys exist
         for key in default:
             if key not in data:
                 data[key] = default[key]
+        ops = await asyncio.to_thread(self._load_journal)
+        for op in ops:
+            self._apply_op(data, op)
+        self._freeze_config(data["config"])
+        self._flagged_ids = frozenset(
+            reporter_id
+            for reporter_id, stats in data["reporter_stats"].items()
+            if isinstance(stats, dict) and stats.get("flagged")
+        )
+        self._journal_lines = len(ops)
+        self._cache = data
+        self._cache_sig = sig
         return data
 
-    async def _write_reports(self, data: Dict[str, Any]) -> None:
-        """Write reports file."""
-        await write_json_atomic(self.reports_path, data)
+    @staticmethod
+    def _freeze_config(config: Dict[str, Any]) -> None:
+        """Store list-valued config as tuples so it can be handed out without copying."""
+        categories = config.get("categories")
+        if isinstance(categories, list):
+            config["categories"] = tuple(categories)
+
+    def _load_journal(self) -> List[Dict[str, Any]]:
+        ops: List[Dict[str, Any]] = []
+        try:
+            with self.journal_path.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        op = loads_json(line)
+                    except ValueError:
+                        # Torn final line from a crash mid-append.
+                        continue
+                    if isinstance(op, dict):
+                        ops.append(op)
+        except FileNotFoundError:
+            pass
+        return ops
+
+    @staticmethod
+    def _apply_op(data: Dict[str, Any], op: Dict[str, Any]) -> None:
+        """Apply one journal op to data."""
+        kind = op.get("op")
+        if kind == "add":
+            report = op.get("report")
+            if isinstance(report, dict) and "id" in report:
+                data["reports"][report["id"]] = report
+        elif kind == "update":
+            report = data["reports"].get(op.get("id"))
+            if report is not None:
+                report.update(op.get("fields") or {})
+        elif kind == "stats":
+            data["reporter_stats"][str(op.get("reporter_id"))] = op.get("stats") or {}
+        elif kind == "config":
+            data["config"].update(op.get("fields") or {})
+
+    def _commit(self, data: Dict[str, Any], ops: List[Dict[str, Any]]) -> None:
+        """Queue journal ops (already applied to data) for the next debounced flush."""
+        self._cache = data
+        self._pending_lines.extend(dumps_json_line(op) for op in ops)
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(self._flush_delay)
+        async with self._lock.writer():
+            try:
+                await self._flush_locked()
+            except Exception as e:
+                # Ops stay queued in memory; the next mutation or flush() retries.
+                logger.error("Failed to flush reports journal for guild %s: %s", self.guild_id, e)
+
+    async def flush(self) -> None:
+        """Write any queued journal ops now (call on shutdown)."""
+        task = self._flush_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        async with self._lock.writer():
+            await self._flush_locked()
+
+    async def _flush_locked(self) -> None:
+        """Append queued ops to the journal with one fsync, compacting when it grows large."""
+        if not self._pending_lines:
+            return
+        lines, self._pending_lines = self._pending_lines, []
+        payload = "".join(lines)
+
+        def _append() -> int:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.journal_path.open("a", encoding="utf-8") as handle:
+                handle.write(payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+                return handle.tell()
+
+        try:
+            journal_size = await asyncio.to_thread(_append)
+        except BaseException:
+            # Replaying a line twice is harmless, so requeue even if it may have landed.
+            self._pending_lines[:0] = lines
+            raise
+        self._journal_lines += len(lines)
+        if self._cache is not None and (
+            self._journal_lines >= JOURNAL_MAX_LINES or journal_size >= JOURNAL_MAX_BYTES
+        ):
+            await self._compact(self._cache)
+            return
+        self._cache_sig = await self._files_signature()
+
+    async def _compact(self, data: Dict[str, Any]) -> None:
+        """Write data as the new snapshot and truncate the journal."""
+        try:
+            await write_json_atomic(self.reports_path, data)
+            await asyncio.to_thread(self._truncate_journal)
+        except Exception:
+            self._cache = None
+            self._cache_sig = None
+            raise
+        self._journal_lines = 0
+        self._cache = data
+        self._cache_sig = await self._files_signature()
+
+    def _truncate_journal(self) -> None:
+        with self.journal_path.open("w", encoding="utf-8"):
+            pass
+
+    @staticmethod
+    def _created_key(report_data: Dict[str, Any]) -> Optional[str]:
+        return iso_sort_key(report_data.get("created_at"))
+
+    def _ensure_indexes(self, data: Dict[str, Any]) -> None:
+        """Rebuild the side indexes if data is not the dict they were built from."""
+        if self._index_src is data:
+            return
+        index = []
+        for report_id, report_data in data["reports"].items():
+            ts = self._created_key(report_data)
+            if ts is not None:
+                index.append((ts, report_id))
+        index.sort()
+        self._created_index = index
+        self._by_status = {}
+        self._by_category = {}
+        for report_id, report_data in data["reports"].items():
+            self._bucket_report(report_id, report_data)
+        self._index_src = data
+
+    def _bucket_report(self, report_id: str, report_data: Dict[str, Any]) -> None:
+        self._by_status.setdefault(report_data.get("status"), {})[report_id] = None
+        self._by_category.setdefault(report_data.get("category"), {})[report_id] = None
+
+    def _unbucket_report(self, report_id: str, report_data: Dict[str, Any]) -> None:
+        self._by_status.get(report_data.get("status"), {}).pop(report_id, None)
+        self._by_category.get(report_data.get("category"), {}).pop(report_id, None)
 
     async def add_report(self, report: UserReport) -> None:
         """Add a new report."""
-        async with self._lock:
+        async with self._lock.writer():
             data = await self._read_reports()
-            data["reports"][report.id] = report.to_dict()
+            self._ensure_indexes(data)
+            report_data = asdict(report)
+            if report.id in data["reports"]:
+                self._index_src = None
+            data["reports"][report.id] = report_data
+            if self._index_src is data:
+                ts = self._created_key(report_data)
+                if ts is not None:
+                    bisect.insort(self._created_index, (ts, report.id))
+                self._bucket_report(report.id, report_data)
 
             # Update reporter stats
             reporter_id = str(report.reporter_id)
@@ -81,21 +314,52 @@ class ReportStore:
 
             data["reporter_stats"][reporter_id]["total"] += 1
 
-            await self._write_reports(data)
+            self._commit(data, [
+                {"op": "add", "report": report_data},
+                {"op": "stats", "reporter_id": reporter_id, "stats": data["reporter_stats"][reporter_id]},
+            ])
 
     async def get_report(self, report_id: str) -> Optional[UserReport]:
         """Get a specific report by ID."""
-        async with self._lock:
+        async with self._lock.reader():
             data = await self._read_reports()
             report_data = data["reports"].get(report_id)
             if not report_data:
                 return None
             return UserReport.from_dict(report_data)
 
+    def _select_report_dicts(
+        self,
+        data: Dict[str, Any],
+        status: Optional[str],
+        category: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """Raw report dicts matching the filters, most recent first."""
+        self._ensure_indexes(data)
+        all_reports = data["reports"]
+
+        if status and category:
+            by_status = self._by_status.get(status, {})
+            by_category = self._by_category.get(category, {})
+            small, large = sorted((by_status, by_category), key=len)
+            report_ids = [rid for rid in small if rid in large]
+        elif status:
+            report_ids = list(self._by_status.get(status, {}))
+        elif category:
+            report_ids = list(self._by_category.get(category, {}))
+        else:
+            report_ids = list(all_reports)
+
+        report_dicts = [all_reports[rid] for rid in report_ids]
+        # Sort by created_at (most recent first); ISO-8601 UTC strings sort chronologically.
+        report_dicts.sort(key=lambda r: r.get("created_at") or "", reverse=True)
+        return report_dicts
+
     async def get_reports(
         self,
         status: Optional[str] = None,
         category: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> List[UserReport]:
         """
         Get reports with optional filters.
@@ -103,26 +367,48 @@ class ReportStore:
         Args:
             status: Filter by status (open/assigned/resolved/dismissed)
             category: Filter by category
+            limit: Only build the first N (most recent) reports
 
         Returns:
             List of reports
         """
-        async with self._lock:
+        async with self._lock.reader():
             data = await self._read_reports()
-            reports = []
+            report_dicts = self._select_report_dicts(data, status, category)
+            if limit is not None:
+                report_dicts = report_dicts[:limit]
+            return [UserReport.from_dict(r) for r in report_dicts]
 
-            for report_data in data["reports"].values():
-                # Apply filters
-                if status and report_data.get("status") != status:
-                    continue
-                if category and report_data.get("category") != category:
-                    continue
+    async def get_report_dicts(
+        self,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Like get_reports, but returns the stored dicts without building UserReport objects.
 
-                reports.append(UserReport.from_dict(report_data))
+        The dicts are the live cached records; treat them as read-only.
+        """
+        async with self._lock.reader():
+            data = await self._read_reports()
+            return self._select_report_dicts(data, status, category)
 
-            # Sort by created_at (most recent first)
-            reports.sort(key=lambda r: r.created_at, reverse=True)
-            return reports
+    async def find_report(self, id_prefix: str) -> Optional[UserReport]:
+        """Get a report by exact ID, else the most recent report whose ID starts with id_prefix."""
+        async with self._lock.reader():
+            data = await self._read_reports()
+            report_data = data["reports"].get(id_prefix)
+            if report_data is None:
+                best_key = None
+                for report_id, candidate in data["reports"].items():
+                    if not report_id.startswith(id_prefix):
+                        continue
+                    key = candidate.get("created_at") or ""
+                    if best_key is None or key > best_key:
+                        best_key, report_data = key, candidate
+            if report_data is None:
+                return None
+            return UserReport.from_dict(report_data)
 
     async def update_report(self, report_id: str, updates: Dict[str, Any]) -> bool:
         """
@@ -130,14 +416,20 @@ class ReportStore:
 
         Returns True if updated, False if not found.
         """
-        async with self._lock:
+        async with self._lock.writer():
             data = await self._read_reports()
 
-            if report_id not in data["reports"]:
+            report = data["reports"].get(report_id)
+            if report is None:
                 return False
 
-            data["reports"][report_id].update(updates)
-            await self._write_reports(data)
+            self._ensure_indexes(data)
+            self._unbucket_report(report_id, report)
+            report.update(updates)
+            self._bucket_report(report_id, report)
+            if "created_at" in updates:
+                self._index_src = None
+            self._commit(data, [{"op": "update", "id": report_id, "fields": updates}])
             return True
 
     async def assign_report(self, report_id: str, mod_id: int) -> bool:
@@ -157,44 +449,82 @@ class ReportStore:
         notes: Optional[str] = None,
     ) -> bool:
         """Resolve a report."""
-        updates = {
-            "status": "resolved",
-            "resolved_at": dt_to_iso(utcnow()),
-            "outcome": outcome,
-        }
-
-        if notes:
-            async with self._lock:
-                data = await self._read_reports()
-                if report_id in data["reports"]:
-                    report = data["reports"][report_id]
-                    if "notes" not in report:
-                        report["notes"] = []
-                    report["notes"].append(notes)
-
-        success = await self.update_report(report_id, updates)
-
-        if success:
-            # Update reporter stats
-            await self._update_reporter_stats_on_resolve(report_id, outcome)
+        async with self._lock.writer():
+            data = await self._read_reports()
+            report = data["reports"].get(report_id)
+            if report is None:
+                return False
 
-        return success
+            self._ensure_indexes(data)
+            self._unbucket_report(report_id, report)
+            report.update({
+                "status": "resolved",
+                "resolved_at": dt_to_iso_now(),
+                "outcome": outcome,
+            })
+            if notes:
+                report.setdefault("notes", []).append(notes)
+            self._bucket_report(report_id, report)
+            fields = {k: report[k] for k in ("status", "resolved_at", "outcome", "notes") if k in report}
+            ops = [{"op": "update", "id": report_id, "fields": fields}]
+            ops.extend(self._apply_reporter_stats_on_resolve(data, report_id, outcome))
+
+            self._commit(data, ops)
+            return True
 
     async def dismiss_report(self, report_id: str, reason: str) -> bool:
         """Dismiss a report."""
-        success = await self.update_report(
-            report_id,
-            {
+        async with self._lock.writer():
+            data = await self._read_reports()
+            report = data["reports"].get(report_id)
+            if report is None:
+                return False
+
+            self._ensure_indexes(data)
+            self._unbucket_report(report_id, report)
+            report.update({
                 "status": "dismissed",
-                "resolved_at": dt_to_iso(utcnow()),
+                "resolved_at": dt_to_iso_now(),
                 "outcome": f"dismissed: {reason}",
-            }
-        )
+            })
+            self._bucket_report(report_id, report)
+            fields = {k: report[k] for k in ("status", "resolved_at", "outcome")}
+            ops = [{"op": "update", "id": report_id, "fields": fields}]
+            ops.extend(self._apply_reporter_stats_on_resolve(data, report_id, "dismissed"))
 
-        if success:
-            await self._update_reporter_stats_on_resolve(report_id, "dismissed")
+            self._commit(data, ops)
+            return True
 
-        return success
+    def _apply_reporter_stats_on_resolve(
+        self,
+        data: Dict[str, Any],
+        report_id: str,
+        outcome: str,
+    ) -> List[Dict[str, Any]]:
+        """Apply a resolution to the reporter's stats in data. Returns the journal ops for it."""
+        report = data["reports"].get(report_id)
+        if report is None:
+            return []
+
+        reporter_id = str(report["reporter_id"])
+        stats = data["reporter_stats"].get(reporter_id)
+        if stats is None:
+            return []
+
+        if outcome == "dismissed":
+            stats["dismissed"] += 1
+        else:
+            stats["upheld"] += 1
+
+        # Flag reporters with high false report rate
+        if stats["total"] >= 5:
+            false_rate = stats["dismissed"] / stats["total"]
+            if false_rate >= 0.6:  # 60% false reports
+                stats["flagged"] = True
+                if reporter_id not in self._flagged_ids:
+                    self._flagged_ids = self._flagged_ids | {reporter_id}
+
+        return [{"op": "stats", "reporter_id": reporter_id, "stats": stats}]
 
     async def _update_reporter_stats_on_resolve(
         self,
@@ -202,32 +532,11 @@ class ReportStore:
         outcome: str,
     ) -> None:
         """Update reporter statistics when a report is resolved."""
-        async with self._lock:
+        async with self._lock.writer():
             data = await self._read_reports()
-
-            if report_id not in data["reports"]:
-                return
-
-            report = data["reports"][report_id]
-            reporter_id = str(report["reporter_id"])
-
-            if reporter_id not in data["reporter_stats"]:
-                return
-
-            stats = data["reporter_stats"][reporter_id]
-
-            if outcome == "dismissed":
-                stats["dismissed"] += 1
-            else:
-                stats["upheld"] += 1
-
-            # Flag reporters with high false report rate
-            if stats["total"] >= 5:
-                false_rate = stats["dismissed"] / stats["total"]
-                if false_rate >= 0.6:  # 60% false reports
-                    stats["flagged"] = True
-
-            await self._write_reports(data)
+            ops = self._apply_reporter_stats_on_resolve(data, report_id, outcome)
+            if ops:
+                self._commit(data, ops)
 
     async def create_mod_thread(self, report_id: str, thread_id: int) -> bool:
         """Associate a mod thread with a report."""
@@ -238,26 +547,21 @@ class ReportStore:
 
     # ─── Reporter Stats ───────────────────────────────────────────────────────
 
-    async def get_reporter_stats(self, user_id: int) -> Dict[str, Any]:
-        """Get statistics for a reporter."""
-        async with self._lock:
+    async def get_reporter_stats(self, user_id: int) -> Mapping[str, Any]:
+        """Get statistics for a reporter (read-only view)."""
+        async with self._lock.reader():
             data = await self._read_reports()
-            user_key = str(user_id)
-
-            if user_key not in data["reporter_stats"]:
-                return {
-                    "total": 0,
-                    "upheld": 0,
-                    "dismissed": 0,
-                    "flagged": False,
-                }
-
-            return data["reporter_stats"][user_key]
+            stats = data["reporter_stats"].get(str(user_id))
+            if stats is None:
+                return _EMPTY_REPORTER_STATS
+            return MappingProxyType(stats)
 
     async def is_reporter_flagged(self, user_id: int) -> bool:
         """Check if a reporter is flagged for false reports."""
-        stats = await self.get_reporter_stats(user_id)
-        return stats.get("flagged", False)
+        if self._cache is None:
+            async with self._lock.reader():
+                await self._read_reports()
+        return str(user_id) in self._flagged_ids
 
     # ─── Auto-Close ───────────────────────────────────────────────────────────
 
@@ -272,47 +576,70 @@ class ReportStore:
             List of stale reports with status "open" or "assigned"
         """
         from datetime import timedelta
-        from .utils import iso_to_dt
 
-        async with self._lock:
+        async with self._lock.reader():
             data = await self._read_reports()
-            now = utcnow()
-            stale_threshold = now - timedelta(days=days)
+            self._ensure_indexes(data)
+            stale_threshold = dt_to_iso(utcnow() - timedelta(days=days))
 
+            # Everything before the threshold in the created_at index is old enough;
+            # only those candidates are status-checked and materialized.
+            end = bisect.bisect_left(self._created_index, (stale_threshold, ""))
+            reports = data["reports"]
             stale_reports = []
-
-            for report_data in data["reports"].values():
-                status = report_data.get("status")
-                if status not in ["open", "assigned"]:
-                    continue
-
-                created_at = iso_to_dt(report_data.get("created_at"))
-                if created_at and created_at < stale_threshold:
+            for _, report_id in self._created_index[:end]:
+                report_data = reports.get(report_id)
+                if report_data and report_data.get("status") in ("open", "assigned"):
                     stale_reports.append(UserReport.from_dict(report_data))
 
             return stale_reports
 
     # ─── Configuration ────────────────────────────────────────────────────────
 
-    async def get_config(self) -> Dict[str, Any]:
-        """Get report configuration."""
-        async with self._lock:
+    async def get_config(self) -> Mapping[str, Any]:
+        """Get report configuration (read-only view)."""
+        async with self._config_lock.reader():
+            if self._cache is not None:
+                # Served from loaded data without waiting on report writers.
+                return MappingProxyType(self._cache["config"])
+        async with self._lock.reader(), self._config_lock.reader():
             data = await self._read_reports()
-            return data["config"]
+            return MappingProxyType(data["config"])
 
     async def update_config(self, updates: Dict[str, Any]) -> None:
         """Update report configuration."""
-        async with self._lock:
+        async with self._lock.writer(), self._config_lock.writer():
             data = await self._read_reports()
             data["config"].update(updates)
-            await self._write_reports(data)
+            self._freeze_config(data["config"])
+            self._commit(data, [{"op": "config", "fields": updates}])
 
     async def get_auto_close_days(self) -> int:
         """Get auto-close days setting."""
         config = await self.get_config()
         return config.get("auto_close_days", 14)
 
-    async def get_categories(self) -> List[str]:
+    async def get_categories(self) -> Tuple[str, ...]:
         """Get available report categories."""
         config = await self.get_config()
-        return config.get("categories", [])
+        return tuple(config.get("categories", ()))
+
+
+_report_stores: Dict[int, ReportStore] = {}
+
+
+def get_report_store(guild_id: int) -> ReportStore:
+    """Get the process-wide ReportStore for a guild, so its caches and locks are shared."""
+    store = _report_stores.get(guild_id)
+    if store is None:
+        store = _report_stores[guild_id] = ReportStore(guild_id)
+    return store
+
+
+async def close_all() -> None:
+    """Flush pending journal writes for every ReportStore (call on shutdown)."""
+    for store in list(_report_stores.values()):
+        try:
+            await store.flush()
+        except Exception as e:
+            logger.error("Failed to flush reports for guild %s: %s", store.guild_id, e)
@@ -6,17 +6,75 @@ Provides storage for temporary roles, role requests, bundles, and reaction roles
 from __future__ import annotations
 
 import asyncio
+import bisect
+import heapq
+import logging
+import os
 import uuid
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
-from .io_utils import read_json, write_json_atomic
+from .io_utils import AsyncRWLock, dumps_json_line, loads_json, read_json, stat_signature, write_json_atomic
 from .paths import BASE_DIR
-from .utils import utcnow, dt_to_iso
+from .utils import utcnow, dt_to_iso, dt_to_iso_now, iso_sort_key
+
+logger = logging.getLogger("discbot.roles_storage")
 
 # Storage directory
 ROLES_DIR = BASE_DIR / "data" / "roles"
 
+# WAL size at which a file's snapshot is rewritten and its WAL truncated
+WAL_MAX_LINES = 500
+WAL_MAX_BYTES = 1024 * 1024
+# Changes within this window are written together
+FLUSH_DELAY_SECONDS = 0.5
+# Reaction-role shards kept in memory per store
+REACTION_ROLE_CACHE_SIZE = 512
+
+
+class _IdIndex:
+    """Sorted entry ids of one keyed collection, for O(log n) ID-prefix lookups."""
+
+    __slots__ = ("src", "ids", "key_by_id", "id_by_key")
+
+    def __init__(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        self.src = entries
+        self.key_by_id: Dict[str, str] = {}
+        self.id_by_key: Dict[str, str] = {}
+        for key, entry in entries.items():
+            entry_id = entry.get("id") if isinstance(entry, dict) else None
+            if isinstance(entry_id, str):
+                self.key_by_id[entry_id] = key
+                self.id_by_key[key] = entry_id
+        self.ids: List[str] = sorted(self.key_by_id)
+
+    def find(self, prefix: str) -> Optional[str]:
+        """Key of the entry whose id is the smallest one starting with prefix."""
+        i = bisect.bisect_left(self.ids, prefix)
+        if i < len(self.ids) and self.ids[i].startswith(prefix):
+            return self.key_by_id[self.ids[i]]
+        return None
+
+    def put(self, key: str, entry_id: Any) -> None:
+        if self.id_by_key.get(key) == entry_id:
+            return
+        self.delete(key)
+        if isinstance(entry_id, str):
+            bisect.insort(self.ids, entry_id)
+            self.key_by_id[entry_id] = key
+            self.id_by_key[key] = entry_id
+
+    def delete(self, key: str) -> None:
+        entry_id = self.id_by_key.pop(key, None)
+        if entry_id is None:
+            return
+        del self.key_by_id[entry_id]
+        i = bisect.bisect_left(self.ids, entry_id)
+        if i < len(self.ids) and self.ids[i] == entry_id:
+            del self.ids[i]
+
 
 class RolesStore:
     """Storage for role management features."""
@@ -27,26 +85,285 @@ class RolesStore:
         self.temp_roles_path = self.root / "temp_roles.json"
         self.requests_path = self.root / "requests.json"
         self.bundles_path = self.root / "bundles.json"
+        self.reaction_roles_dir = self.root / "reaction_roles"
+        # Pre-sharding single file; migrated into reaction_roles_dir on first use.
         self.reaction_roles_path = self.root / "reaction_roles.json"
-        self._lock = asyncio.Lock()
+        self._initialized = False
+        # One lock per file so unrelated features don't wait on each other.
+        self._locks: Dict[str, AsyncRWLock] = {
+            "temp": AsyncRWLock(),
+            "req": AsyncRWLock(),
+            "bundle": AsyncRWLock(),
+            "rr": AsyncRWLock(),
+        }
+        # Parsed snapshot + replayed WAL keyed by snapshot path, with the
+        # (mtime_ns, size) of both files they reflect.
+        self._cache: Dict[Path, Tuple[Any, Dict[str, Any]]] = {}
+        # Keyed collection each WAL'd file's put/del records apply to.
+        self._wal_collections: Dict[Path, str] = {
+            self.temp_roles_path: "temp_roles",
+            self.requests_path: "requests",
+            self.bundles_path: "bundles",
+        }
+        self._wal_lines: Dict[Path, int] = {}
+        # Collection name -> sorted id index over it, for ID-prefix lookups
+        self._id_indexes: Dict[str, _IdIndex] = {}
+        self._wal_locks: Dict[Path, AsyncRWLock] = {
+            self.temp_roles_path: self._locks["temp"],
+            self.requests_path: self._locks["req"],
+            self.bundles_path: self._locks["bundle"],
+        }
+        # Serialized WAL records and reaction-role shards not yet written;
+        # a debounced flush task writes them FLUSH_DELAY_SECONDS after a change.
+        self._pending_wal: Dict[Path, List[str]] = {}
+        self._rr_dirty: Set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        # Serializes WAL appends, compactions and shard writes; the per-file
+        # locks above are only held long enough to copy what gets written.
+        self._write_lock = asyncio.Lock()
+        self._bundle_names: Dict[str, str] = {}
+        self._bundle_names_src: Optional[Dict[str, Any]] = None
+        # message_id -> {emoji: role_id}, least recently used first.
+        self._rr_shards: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+        self._rr_migrated = False
+        # Min-heap of (expires ISO string, temp role key, expires_at) over the temp_roles
+        # dict in _temp_heap_src. Removed/extended entries are left in place and
+        # skipped when they surface.
+        self._temp_heap: List[Tuple[str, str, str]] = []
+        self._temp_heap_src: Optional[Dict[str, Any]] = None
 
     async def initialize(self) -> None:
         """Ensure storage directory exists."""
+        if self._initialized:
+            return
         await asyncio.to_thread(self.root.mkdir, parents=True, exist_ok=True)
+        self._initialized = True
+
+    def _wal_path(self, path: Path) -> Path:
+        return path.with_name(f"{path.stem}.wal.jsonl")
+
+    async def _read_cached(self, path: Path, default: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Read a JSON snapshot plus its write-ahead log, reusing the parsed copy
+        while neither file has changed.
+        """
+        cached = self._cache.get(path)
+        if cached is not None and self._pending_wal.get(path):
+            # In-memory data is ahead of disk until the queued records are flushed.
+            return cached[1]
+        wal_path = self._wal_path(path)
+        sig = (await stat_signature(path), await stat_signature(wal_path))
+        if cached is not None and cached[0] == sig:
+            return cached[1]
+        data = await read_json(path, default=default)
+        if not isinstance(data, dict):
+            data = default
+        collection = self._wal_collections.get(path)
+        records = await asyncio.to_thread(self._load_wal, wal_path)
+        if collection is not None and isinstance(data.get(collection), dict):
+            entries = data[collection]
+            for record in records:
+                if record.get("op") == "put":
+                    entries[record.get("key")] = record.get("value")
+                elif record.get("op") == "del":
+                    entries.pop(record.get("key"), None)
+        self._wal_lines[path] = len(records)
+        self._cache[path] = (sig, data)
+        return data
+
+    @staticmethod
+    def _load_wal(wal_path: Path) -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = []
+        try:
+            with wal_path.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = loads_json(line)
+                    except ValueError:
+                        # Torn final line from a crash mid-append.
+                        continue
+                    if isinstance(record, dict):
+                        records.append(record)
+        except FileNotFoundError:
+            pass
+        return records
+
+    async def _write_cached(self, path: Path, data: Dict[str, Any]) -> None:
+        """Write a full JSON snapshot, truncate its WAL and keep data as the cached copy."""
+        wal_path = self._wal_path(path)
+
+        def _truncate_wal() -> None:
+            if wal_path.exists():
+                with wal_path.open("w", encoding="utf-8"):
+                    pass
+
+        try:
+            await write_json_atomic(path, data)
+            await asyncio.to_thread(_truncate_wal)
+        except Exception:
+            self._cache.pop(path, None)
+            raise
+        self._wal_lines[path] = 0
+        sig = (await stat_signature(path), await stat_signature(wal_path))
+        self._cache[path] = (sig, data)
+
+    def _log_records(self, path: Path, data: Dict[str, Any], records: List[Dict[str, Any]]) -> None:
+        """Queue put/del records (already applied to data) for the next debounced WAL flush."""
+        self._cache[path] = (self._cache[path][0] if path in self._cache else None, data)
+        collection = self._wal_collections[path]
+        index = self._id_indexes.get(collection)
+        if index is not None and index.src is data.get(collection):
+            for record in records:
+                if record["op"] == "put":
+                    index.put(record["key"], record["value"].get("id"))
+                else:
+                    index.delete(record["key"])
+        self._pending_wal.setdefault(path, []).extend(dumps_json_line(r) for r in records)
+        self._schedule_flush()
+
+    async def _flush_wal(self, path: Path) -> None:
+        """
+        Append path's queued records to its WAL with one fsync, compacting into
+        the snapshot once the WAL grows past its limits.
+
+        path's lock is held only while taking the queued lines (and a copy of
+        the data when compacting), so mutators don't wait on the disk;
+        _write_lock keeps the file writes themselves in order.
+        """
+        lock = self._wal_locks[path]
+        async with self._write_lock:
+            async with lock.writer():
+                # Lines stay queued until they land, so _read_cached keeps
+                # serving memory instead of reloading a half-appended WAL.
+                lines = list(self._pending_wal.get(path) or ())
+            if not lines:
+                return
+            wal_path = self._wal_path(path)
+            payload = "".join(lines)
+
+            def _append() -> int:
+                wal_path.parent.mkdir(parents=True, exist_ok=True)
+                with wal_path.open("a", encoding="utf-8") as handle:
+                    handle.write(payload)
+                    handle.flush()
+                    os.fsync(handle.fileno())
+                    return handle.tell()
+
+            # On failure the lines are still queued; replaying a record twice is harmless.
+            wal_size = await asyncio.to_thread(_append)
+            queued = self._pending_wal.get(path, [])
+            del queued[: len(lines)]
+            if not queued:
+                self._pending_wal.pop(path, None)
+            self._wal_lines[path] = self._wal_lines.get(path, 0) + len(lines)
+            if self._wal_lines[path] >= WAL_MAX_LINES or wal_size >= WAL_MAX_BYTES:
+                async with lock.writer():
+                    snapshot = {
+                        key: dict(value) if isinstance(value, dict) else value
+                        for key, value in self._cache[path][1].items()
+                    }
+                await self._compact_wal(path, snapshot)
+            sig = (await stat_signature(path), await stat_signature(wal_path))
+            cached = self._cache.get(path)
+            if cached is not None:
+                self._cache[path] = (sig, cached[1])
+
+    async def _compact_wal(self, path: Path, snapshot: Dict[str, Any]) -> None:
+        """Replace path's snapshot with one that already has every WAL record applied, then empty the WAL."""
+        wal_path = self._wal_path(path)
+
+        def _truncate_wal() -> None:
+            with wal_path.open("w", encoding="utf-8"):
+                pass
+
+        await write_json_atomic(path, snapshot)
+        await asyncio.to_thread(_truncate_wal)
+        self._wal_lines[path] = 0
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(FLUSH_DELAY_SECONDS)
+        try:
+            await self._flush_all()
+        except Exception as e:
+            # Pending writes stay queued; the next mutation or flush() retries.
+            logger.error("Failed to flush roles storage for guild %s: %s", self.guild_id, e)
+
+    async def _flush_all(self) -> None:
+        for path in self._wal_locks:
+            if self._pending_wal.get(path):
+                await self._flush_wal(path)
+        if self._rr_dirty:
+            await self._flush_reaction_shards()
+
+    async def flush(self) -> None:
+        """Write all queued changes now (call on shutdown)."""
+        task = self._flush_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self._flush_all()
+
+    @staticmethod
+    def _put(key: str, value: Dict[str, Any]) -> Dict[str, Any]:
+        return {"op": "put", "key": key, "value": value}
+
+    @staticmethod
+    def _delete(key: str) -> Dict[str, Any]:
+        return {"op": "del", "key": key}
 
     # ─── Temporary Roles ──────────────────────────────────────────────────────
 
+    @staticmethod
+    def _temp_role_key(user_id: int, role_id: int) -> str:
+        return f"{user_id}:{role_id}"
+
     async def _read_temp_roles(self) -> Dict[str, Any]:
-        """Read temporary roles file."""
-        default = {"temp_roles": []}
-        data = await read_json(self.temp_roles_path, default=default)
-        if not isinstance(data, dict):
-            return default
+        """Read temporary roles file (temp_roles keyed by "user_id:role_id")."""
+        default = {"temp_roles": {}}
+        data = await self._read_cached(self.temp_roles_path, default)
+        temp_roles = data.get("temp_roles")
+        if not isinstance(temp_roles, dict):
+            # Legacy layout stored a list; re-key it once and persist.
+            keyed: Dict[str, Dict[str, Any]] = {}
+            for tr in temp_roles if isinstance(temp_roles, list) else []:
+                if not isinstance(tr, dict):
+                    continue
+                if not tr.get("id"):
+                    tr["id"] = str(uuid.uuid4())
+                keyed[self._temp_role_key(tr.get("user_id"), tr.get("role_id"))] = tr
+            data["temp_roles"] = keyed
+            await self._write_temp_roles(data)
         return data
 
     async def _write_temp_roles(self, data: Dict[str, Any]) -> None:
         """Write temporary roles file."""
-        await write_json_atomic(self.temp_roles_path, data)
+        await self._write_cached(self.temp_roles_path, data)
+
+    def _find_by_id_prefix(
+        self,
+        collection: str,
+        entries: Dict[str, Dict[str, Any]],
+        id_prefix: str,
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Find the (key, entry) whose "id" starts with id_prefix."""
+        index = self._id_indexes.get(collection)
+        if index is None or index.src is not entries:
+            # Built lazily and rebuilt whenever the cached dict is replaced.
+            index = self._id_indexes[collection] = _IdIndex(entries)
+        key = index.find(id_prefix)
+        if key is None:
+            return None
+        return key, entries[key]
 
     async def add_temp_role(
         self,
@@ -55,144 +372,140 @@ class RolesStore:
         expires_at: str,
         reason: str = "",
     ) -> Dict[str, Any]:
-        """Add a temporary role assignment."""
-        async with self._lock:
+        """Add a temporary role assignment (replaces any existing one for the same user/role)."""
+        async with self._locks["temp"].writer():
             data = await self._read_temp_roles()
 
             temp_role = {
                 "id": str(uuid.uuid4()),
                 "user_id": user_id,
                 "role_id": role_id,
-                "added_at": dt_to_iso(utcnow()),
+                "added_at": dt_to_iso_now(),
                 "expires_at": expires_at,
                 "reason": reason,
             }
 
-            data["temp_roles"].append(temp_role)
-            await self._write_temp_roles(data)
+            key = self._temp_role_key(user_id, role_id)
+            data["temp_roles"][key] = temp_role
+            self._log_records(self.temp_roles_path, data, [self._put(key, temp_role)])
+            self._push_temp_expiry(data["temp_roles"], key)
             return temp_role
 
     async def get_temp_roles(self) -> List[Dict[str, Any]]:
-        """Get all temporary roles (ensures each entry has an ID)."""
-        async with self._lock:
+        """Get all temporary roles."""
+        async with self._locks["temp"].reader():
             data = await self._read_temp_roles()
-            temp_roles = data.get("temp_roles", [])
-            if not isinstance(temp_roles, list):
-                temp_roles = []
-            changed = False
-            for tr in temp_roles:
-                if isinstance(tr, dict) and not tr.get("id"):
-                    tr["id"] = str(uuid.uuid4())
-                    changed = True
-            if changed:
-                data["temp_roles"] = temp_roles
-                await self._write_temp_roles(data)
-            return [tr for tr in temp_roles if isinstance(tr, dict)]
+            return list(data["temp_roles"].values())
 
     async def get_temp_role(self, temp_role_id: str) -> Optional[Dict[str, Any]]:
         """Get a temp role by ID prefix."""
-        async with self._lock:
+        async with self._locks["temp"].reader():
             data = await self._read_temp_roles()
-            temp_roles = data.get("temp_roles", [])
-            if not isinstance(temp_roles, list):
-                return None
-            for tr in temp_roles:
-                if not isinstance(tr, dict):
-                    continue
-                tr_id = tr.get("id")
-                if isinstance(tr_id, str) and tr_id.startswith(temp_role_id):
-                    return tr
-            return None
+            found = self._find_by_id_prefix("temp_roles", data["temp_roles"], temp_role_id)
+            return found[1] if found else None
 
     async def remove_temp_role_by_id(self, temp_role_id: str) -> Optional[Dict[str, Any]]:
         """Remove a temporary role entry by ID prefix. Returns removed entry if found."""
-        async with self._lock:
+        async with self._locks["temp"].writer():
             data = await self._read_temp_roles()
-            temp_roles = data.get("temp_roles", [])
-            if not isinstance(temp_roles, list):
-                return None
-
-            removed: Optional[Dict[str, Any]] = None
-            kept: list[Dict[str, Any]] = []
-            for tr in temp_roles:
-                if not isinstance(tr, dict):
-                    continue
-                tr_id = tr.get("id")
-                if removed is None and isinstance(tr_id, str) and tr_id.startswith(temp_role_id):
-                    removed = tr
-                    continue
-                kept.append(tr)
-
-            if removed is None:
+            found = self._find_by_id_prefix("temp_roles", data["temp_roles"], temp_role_id)
+            if found is None:
                 return None
-
-            data["temp_roles"] = kept
-            await self._write_temp_roles(data)
+            removed = data["temp_roles"].pop(found[0])
+            self._log_records(self.temp_roles_path, data, [self._delete(found[0])])
             return removed
 
     async def extend_temp_role(self, temp_role_id: str, expires_at: str) -> Optional[Dict[str, Any]]:
         """Update expires_at for a temp role by ID prefix. Returns updated entry if found."""
-        async with self._lock:
+        async with self._locks["temp"].writer():
             data = await self._read_temp_roles()
-            temp_roles = data.get("temp_roles", [])
-            if not isinstance(temp_roles, list):
+            found = self._find_by_id_prefix("temp_roles", data["temp_roles"], temp_role_id)
+            if found is None:
                 return None
-            for tr in temp_roles:
-                if not isinstance(tr, dict):
-                    continue
-                tr_id = tr.get("id")
-                if isinstance(tr_id, str) and tr_id.startswith(temp_role_id):
-                    tr["expires_at"] = expires_at
-                    await self._write_temp_roles(data)
-                    return tr
-            return None
+            tr = found[1]
+            tr["expires_at"] = expires_at
+            self._log_records(self.temp_roles_path, data, [self._put(found[0], tr)])
+            self._push_temp_expiry(data["temp_roles"], found[0])
+            return tr
+
+    def _ensure_temp_heap(self, temp_roles: Dict[str, Dict[str, Any]]) -> None:
+        """Rebuild the expiry heap if temp_roles is not the dict it was built from."""
+        if self._temp_heap_src is temp_roles:
+            return
+        heap = []
+        for key, temp_role in temp_roles.items():
+            expires_at = temp_role.get("expires_at")
+            ts = iso_sort_key(expires_at)
+            if ts is not None:
+                heap.append((ts, key, expires_at))
+        heapq.heapify(heap)
+        self._temp_heap = heap
+        self._temp_heap_src = temp_roles
+
+    def _push_temp_expiry(self, temp_roles: Dict[str, Dict[str, Any]], key: str) -> None:
+        if self._temp_heap_src is not temp_roles:
+            return  # rebuilt from scratch on next sweep
+        expires_at = temp_roles[key].get("expires_at")
+        ts = iso_sort_key(expires_at)
+        if ts is not None:
+            heapq.heappush(self._temp_heap, (ts, key, expires_at))
 
     async def get_expired_temp_roles(self) -> List[Dict[str, Any]]:
         """Get all expired temporary roles."""
-        from datetime import datetime
-
-        async with self._lock:
+        async with self._locks["temp"].reader():
             data = await self._read_temp_roles()
-            now = utcnow()
+            temp_roles = data["temp_roles"]
+            self._ensure_temp_heap(temp_roles)
+            heap = self._temp_heap
+            now = dt_to_iso(utcnow())
 
             expired = []
-            for temp_role in data["temp_roles"]:
-                expires_at = datetime.fromisoformat(temp_role["expires_at"].replace("Z", "+00:00"))
-                if expires_at <= now:
-                    expired.append(temp_role)
+            live = []
+            seen = set()
+            while heap and heap[0][0] <= now:
+                item = heapq.heappop(heap)
+                _, key, expires_at = item
+                temp_role = temp_roles.get(key)
+                if temp_role is None or temp_role.get("expires_at") != expires_at or key in seen:
+                    continue  # removed, extended or duplicate: drop the stale heap entry
+                seen.add(key)
+                expired.append(temp_role)
+                live.append(item)
+            # Expired entries stay indexed until remove_temp_role drops them from the file.
+            for item in live:
+                heapq.heappush(heap, item)
 
             return expired
 
     async def remove_temp_role(self, user_id: int, role_id: int) -> bool:
         """Remove a temporary role entry."""
-        async with self._lock:
+        async with self._locks["temp"].writer():
             data = await self._read_temp_roles()
-            original_len = len(data["temp_roles"])
-
-            data["temp_roles"] = [
-                tr for tr in data["temp_roles"]
-                if not (tr["user_id"] == user_id and tr["role_id"] == role_id)
-            ]
-
-            if len(data["temp_roles"]) < original_len:
-                await self._write_temp_roles(data)
-                return True
-
-            return False
+            key = self._temp_role_key(user_id, role_id)
+            if data["temp_roles"].pop(key, None) is None:
+                return False
+            self._log_records(self.temp_roles_path, data, [self._delete(key)])
+            return True
 
     # ─── Role Requests ────────────────────────────────────────────────────────
 
     async def _read_requests(self) -> Dict[str, Any]:
-        """Read role requests file."""
-        default = {"requests": [], "config": {"requestable_roles": []}}
-        data = await read_json(self.requests_path, default=default)
-        if not isinstance(data, dict):
-            return default
+        """Read role requests file (requests keyed by ID)."""
+        default = {"requests": {}, "config": {"requestable_roles": []}}
+        data = await self._read_cached(self.requests_path, default)
+        requests = data.get("requests")
+        if not isinstance(requests, dict):
+            data["requests"] = {
+                r["id"]: r
+                for r in (requests if isinstance(requests, list) else [])
+                if isinstance(r, dict) and r.get("id")
+            }
+            await self._write_requests(data)
         return data
 
     async def _write_requests(self, data: Dict[str, Any]) -> None:
         """Write role requests file."""
-        await write_json_atomic(self.requests_path, data)
+        await self._write_cached(self.requests_path, data)
 
     async def add_role_request(
         self,
@@ -202,7 +515,7 @@ class RolesStore:
         reason: str = "",
     ) -> Dict[str, Any]:
         """Add a role request."""
-        async with self._lock:
+        async with self._locks["req"].writer():
             data = await self._read_requests()
 
             request = {
@@ -211,12 +524,12 @@ class RolesStore:
                 "role_id": role_id,
                 "reason": reason,
                 "status": "pending",
-                "created_at": dt_to_iso(utcnow()),
+                "created_at": dt_to_iso_now(),
                 "reviewed_by": None,
             }
 
-            data["requests"].append(request)
-            await self._write_requests(data)
+            data["requests"][request_id] = request
+            self._log_records(self.requests_path, data, [self._put(request_id, request)])
             return request
 
     async def update_request_status(
@@ -225,38 +538,69 @@ class RolesStore:
         status: str,
         reviewer_id: int,
     ) -> Optional[Dict[str, Any]]:
-        """Update role request status. Returns updated request if found."""
-        async with self._lock:
+        """Update role request status (by ID or ID prefix). Returns updated request if found."""
+        async with self._locks["req"].writer():
             data = await self._read_requests()
 
-            for request in data["requests"]:
-                if request["id"].startswith(request_id):
-                    request["status"] = status
-                    request["reviewed_by"] = reviewer_id
-                    await self._write_requests(data)
-                    return request
-
-            return None
+            key = request_id
+            request = data["requests"].get(key)
+            if request is None:
+                found = self._find_by_id_prefix("requests", data["requests"], request_id)
+                if found is None:
+                    return None
+                key, request = found
+
+            request["status"] = status
+            request["reviewed_by"] = reviewer_id
+            self._log_records(self.requests_path, data, [self._put(key, request)])
+            return request
 
     async def get_pending_requests(self) -> List[Dict[str, Any]]:
         """Get all pending role requests."""
-        async with self._lock:
+        async with self._locks["req"].reader():
             data = await self._read_requests()
-            return [r for r in data["requests"] if r["status"] == "pending"]
+            return [r for r in data["requests"].values() if r["status"] == "pending"]
 
     # ─── Role Bundles ─────────────────────────────────────────────────────────
 
     async def _read_bundles(self) -> Dict[str, Any]:
-        """Read role bundles file."""
-        default = {"bundles": []}
-        data = await read_json(self.bundles_path, default=default)
-        if not isinstance(data, dict):
-            return default
+        """Read role bundles file (bundles keyed by ID)."""
+        default = {"bundles": {}}
+        data = await self._read_cached(self.bundles_path, default)
+        bundles = data.get("bundles")
+        if not isinstance(bundles, dict):
+            data["bundles"] = {
+                b["id"]: b
+                for b in (bundles if isinstance(bundles, list) else [])
+                if isinstance(b, dict) and b.get("id")
+            }
+            await self._write_bundles(data)
         return data
 
     async def _write_bundles(self, data: Dict[str, Any]) -> None:
         """Write role bundles file."""
-        await write_json_atomic(self.bundles_path, data)
+        await self._write_cached(self.bundles_path, data)
+
+    def _bundle_name_index(self, bundles: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """Lowercase name -> bundle ID, rebuilt only when the cached bundles dict is replaced."""
+        if self._bundle_names_src is not bundles:
+            self._bundle_names = {}
+            for bid, bundle in bundles.items():
+                name = bundle.get("name")
+                if isinstance(name, str):
+                    self._bundle_names.setdefault(name.lower(), bid)
+            self._bundle_names_src = bundles
+        return self._bundle_names
+
+    def _find_bundle_key(self, bundles: Dict[str, Dict[str, Any]], bundle_id: str) -> Optional[str]:
+        """Resolve an ID, name (case-insensitive) or ID prefix to a bundle key."""
+        if bundle_id in bundles:
+            return bundle_id
+        key = self._bundle_name_index(bundles).get(bundle_id.lower())
+        if key is not None and key in bundles:
+            return key
+        found = self._find_by_id_prefix("bundles", bundles, bundle_id)
+        return found[0] if found else None
 
     async def add_bundle(
         self,
@@ -265,79 +609,137 @@ class RolesStore:
         role_ids: List[int],
     ) -> Dict[str, Any]:
         """Add a role bundle."""
-        async with self._lock:
+        async with self._locks["bundle"].writer():
             data = await self._read_bundles()
 
             bundle = {
                 "id": bundle_id,
                 "name": name,
                 "role_ids": role_ids,
-                "created_at": dt_to_iso(utcnow()),
+                "created_at": dt_to_iso_now(),
             }
 
-            data["bundles"].append(bundle)
-            await self._write_bundles(data)
+            data["bundles"][bundle_id] = bundle
+            self._bundle_name_index(data["bundles"]).setdefault(name.lower(), bundle_id)
+            self._log_records(self.bundles_path, data, [self._put(bundle_id, bundle)])
             return bundle
 
     async def get_bundle(self, bundle_id: str) -> Optional[Dict[str, Any]]:
-        """Get a role bundle."""
-        async with self._lock:
+        """Get a role bundle by ID, ID prefix or name."""
+        async with self._locks["bundle"].reader():
             data = await self._read_bundles()
-            for bundle in data["bundles"]:
-                if bundle["id"].startswith(bundle_id) or bundle["name"].lower() == bundle_id.lower():
-                    return bundle
-            return None
+            key = self._find_bundle_key(data["bundles"], bundle_id)
+            return data["bundles"][key] if key is not None else None
 
     async def get_all_bundles(self) -> List[Dict[str, Any]]:
         """Get all role bundles."""
-        async with self._lock:
+        async with self._locks["bundle"].reader():
             data = await self._read_bundles()
-            return data["bundles"]
+            return list(data["bundles"].values())
 
     async def remove_bundle(self, bundle_id: str) -> Optional[Dict[str, Any]]:
         """Remove a role bundle by ID prefix or name. Returns removed bundle if found."""
-        async with self._lock:
+        async with self._locks["bundle"].writer():
             data = await self._read_bundles()
-            bundles = data.get("bundles", [])
-            if not isinstance(bundles, list):
-                return None
-
-            removed: Optional[Dict[str, Any]] = None
-            kept: list[Dict[str, Any]] = []
-            for bundle in bundles:
-                if not isinstance(bundle, dict):
-                    continue
-                bid = bundle.get("id", "")
-                name = bundle.get("name", "")
-                matches = (
-                    (isinstance(bid, str) and bid.startswith(bundle_id))
-                    or (isinstance(name, str) and name.lower() == bundle_id.lower())
-                )
-                if removed is None and matches:
-                    removed = bundle
-                    continue
-                kept.append(bundle)
-
-            if removed is None:
+            key = self._find_bundle_key(data["bundles"], bundle_id)
+            if key is None:
                 return None
-
-            data["bundles"] = kept
-            await self._write_bundles(data)
+            removed = data["bundles"].pop(key)
+            # Names may be shared between bundles; rebuild the index on next lookup.
+            self._bundle_names_src = None
+            self._log_records(self.bundles_path, data, [self._delete(key)])
             return removed
 
     # ─── Reaction Roles ───────────────────────────────────────────────────────
 
-    async def _read_reaction_roles(self) -> Dict[str, Any]:
-        """Read reaction roles file."""
-        default = {"reaction_roles": {}}
-        data = await read_json(self.reaction_roles_path, default=default)
-        if not isinstance(data, dict):
-            return default
-        return data
-
-    async def _write_reaction_roles(self, data: Dict[str, Any]) -> None:
-        """Write reaction roles file."""
-        await write_json_atomic(self.reaction_roles_path, data)
+    def _reaction_shard_path(self, msg_key: str) -> Path:
+        return self.reaction_roles_dir / f"{msg_key}.json"
+
+    async def _migrate_reaction_roles(self) -> None:
+        """Split a legacy single-file reaction_roles.json into per-message shards."""
+        legacy = await read_json(self.reaction_roles_path, default=None)
+        if not isinstance(legacy, dict):
+            self._rr_migrated = True
+            return
+        for msg_key, mappings in (legacy.get("reaction_roles") or {}).items():
+            if not isinstance(mappings, dict) or not mappings:
+                continue
+            shard_path = self._reaction_shard_path(str(msg_key))
+            if not await asyncio.to_thread(shard_path.exists):
+                await write_json_atomic(shard_path, mappings)
+        try:
+            await asyncio.to_thread(
+                self.reaction_roles_path.replace,
+                self.reaction_roles_path.with_suffix(".json.migrated"),
+            )
+        except FileNotFoundError:
+            pass  # a concurrent reader finished the migration first
+        self._rr_migrated = True
+
+    async def _read_reaction_shard(self, message_id: int) -> Dict[str, int]:
+        """Read the emoji -> role_id mappings for one message (LRU cached)."""
+        if not self._rr_migrated:
+            await self._migrate_reaction_roles()
+        msg_key = str(message_id)
+        shard = self._rr_shards.get(msg_key)
+        if shard is not None:
+            self._rr_shards.move_to_end(msg_key)
+            return shard
+        shard = await read_json(self._reaction_shard_path(msg_key), default=None)
+        if not isinstance(shard, dict):
+            shard = {}
+        # Empty shards are cached too: most reaction events are on unmapped messages.
+        self._cache_reaction_shard(msg_key, shard)
+        return shard
+
+    def _cache_reaction_shard(self, msg_key: str, shard: Dict[str, int]) -> None:
+        self._rr_shards[msg_key] = shard
+        self._rr_shards.move_to_end(msg_key)
+        if len(self._rr_shards) > REACTION_ROLE_CACHE_SIZE:
+            # Evict the least recently used shard that has no unwritten changes.
+            for key in self._rr_shards:
+                if key not in self._rr_dirty:
+                    del self._rr_shards[key]
+                    break
+
+    def _write_reaction_shard(self, message_id: int, shard: Dict[str, int]) -> None:
+        """Mark one message's mappings for the next debounced flush."""
+        msg_key = str(message_id)
+        self._cache_reaction_shard(msg_key, shard)
+        self._rr_dirty.add(msg_key)
+        self._schedule_flush()
+
+    async def _flush_reaction_shards(self) -> None:
+        """
+        Write dirty shards, deleting empty ones. Copies are taken under the "rr"
+        lock and written without it; a shard stays dirty (and so cached) if it
+        changed again while its copy was being written.
+        """
+        async with self._write_lock:
+            async with self._locks["rr"].writer():
+                batch = {key: dict(self._rr_shards.get(key, {})) for key in self._rr_dirty}
+            for msg_key, shard in batch.items():
+                path = self._reaction_shard_path(msg_key)
+                if shard:
+                    await write_json_atomic(path, shard)
+                else:
+                    await asyncio.to_thread(path.unlink, missing_ok=True)
+                if self._rr_shards.get(msg_key, {}) == shard:
+                    self._rr_dirty.discard(msg_key)
+
+    async def _lookup_reaction_shard(self, message_id: int) -> Dict[str, int]:
+        """
+        Shard for a reaction lookup. Cached shards are only changed between
+        awaits by writers holding the "rr" lock, so a cache hit needs no lock;
+        only a miss waits on it to load from disk.
+        """
+        msg_key = str(message_id)
+        shard = self._rr_shards.get(msg_key) if self._rr_migrated else None
+        if shard is not None:
+            self._rr_shards.move_to_end(msg_key)
+            return shard
+        async with self._locks["rr"].reader():
+            return await self._read_reaction_shard(message_id)
 
     async def add_reaction_role(
         self,
@@ -346,32 +748,20 @@ class RolesStore:
         role_id: int,
     ) -> bool:
         """Add a reaction role mapping."""
-        async with self._lock:
-            data = await self._read_reaction_roles()
-
-            msg_key = str(message_id)
-            if msg_key not in data["reaction_roles"]:
-                data["reaction_roles"][msg_key] = {}
-
-            data["reaction_roles"][msg_key][emoji] = role_id
-            await self._write_reaction_roles(data)
+        async with self._locks["rr"].writer():
+            shard = await self._read_reaction_shard(message_id)
+            shard[emoji] = role_id
+            self._write_reaction_shard(message_id, shard)
             return True
 
     async def remove_reaction_role(self, message_id: int, emoji: str) -> bool:
         """Remove a reaction role mapping."""
-        async with self._lock:
-            data = await self._read_reaction_roles()
-            msg_key = str(message_id)
-            mappings = data.get("reaction_roles", {}).get(msg_key)
-            if not isinstance(mappings, dict):
-                return False
-            if emoji not in mappings:
+        async with self._locks["rr"].writer():
+            shard = await self._read_reaction_shard(message_id)
+            if emoji not in shard:
                 return False
-            del mappings[emoji]
-            if not mappings:
-                # Remove empty message mapping
-                data.get("reaction_roles", {}).pop(msg_key, None)
-            await self._write_reaction_roles(data)
+            del shard[emoji]
+            self._write_reaction_shard(message_id, shard)
             return True
 
     async def get_reaction_role(
@@ -380,17 +770,33 @@ class RolesStore:
         emoji: str,
     ) -> Optional[int]:
         """Get role ID for a reaction."""
-        async with self._lock:
-            data = await self._read_reaction_roles()
-            msg_key = str(message_id)
-            return data["reaction_roles"].get(msg_key, {}).get(emoji)
+        shard = await self._lookup_reaction_shard(message_id)
+        return shard.get(emoji)
 
     async def get_all_reaction_roles(
         self,
         message_id: int,
-    ) -> Dict[str, int]:
-        """Get all reaction roles for a message."""
-        async with self._lock:
-            data = await self._read_reaction_roles()
-            msg_key = str(message_id)
-            return data["reaction_roles"].get(msg_key, {})
+    ) -> Mapping[str, int]:
+        """Get all reaction roles for a message (read-only view)."""
+        shard = await self._lookup_reaction_shard(message_id)
+        return MappingProxyType(shard)
+
+
+_roles_stores: Dict[int, RolesStore] = {}
+
+
+def get_roles_store(guild_id: int) -> RolesStore:
+    """Get the process-wide RolesStore for a guild, so its caches and locks are shared."""
+    store = _roles_stores.get(guild_id)
+    if store is None:
+        store = _roles_stores[guild_id] = RolesStore(guild_id)
+    return store
+
+
+async def close_all() -> None:
+    """Flush queued writes for every RolesStore (call on shutdown)."""
+    for store in list(_roles_stores.values()):
+        try:
+            await store.flush()
+        except Exception as e:
+            logger.error("Failed to flush roles storage for guild %s: %s", store.guild_id, e)
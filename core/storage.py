@@ -1,25 +1,42 @@
 """
 Persistent storage for user suspicion records.
 
-Provides sharded JSON storage with caching and atomic writes.
+Provides sharded JSON storage with caching and atomic writes, and an
+optional SQLite backend with the same interface.
 """
 from __future__ import annotations
 
 import asyncio
+import bisect
+import logging
+import sqlite3
 from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from .config import ConfigError
-from .io_utils import read_json, write_json_atomic
+from .io_utils import AsyncRWLock, loads_json, read_json, read_json_mapped, write_json_atomic
 from .paths import BASE_DIR
 from .utils import dt_to_iso, iso_to_dt, safe_int, utcnow
 
+logger = logging.getLogger("discbot.storage")
+
+# Shards read concurrently per step of list_records, so a page that fills
+# early doesn't pay for reading all 100 shards.
+LIST_READ_BATCH = 10
+# record_message calls are coalesced per shard and applied this long after
+# the first one in a batch.
+MESSAGE_BATCH_DELAY_SECONDS = 0.5
+
 
 class SuspicionStore:
     def __init__(self, guild_id: int, cache_size: int = 3) -> None:
         self.guild_id = guild_id
         self.root = BASE_DIR / ".suspicion" / str(guild_id)
+        self._shard_paths: Dict[str, Path] = {
+            f"{i:02d}": self.root / f"{i:02d}.json" for i in range(100)
+        }
         self.lock_path = self.root / "lock.json"
         self.state_path = self.root / "state.json"
         self.queue_path = self.root / "queue.jsonl"
@@ -28,11 +45,16 @@ class SuspicionStore:
         self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self.cache_meta: Dict[str, Dict[str, Any]] = {}
         self.cache_lock = asyncio.Lock()
-        self.shard_locks: Dict[str, asyncio.Lock] = {}
-        self.locked_shards: set[str] = set()
+        self.shard_locks: Dict[str, AsyncRWLock] = {}
+        # shard -> number of operations holding it; pinned shards aren't evicted.
+        self.locked_shards: Dict[str, int] = {}
         self.state_lock = asyncio.Lock()
         self.state_data: Dict[str, Any] = {}
         self.lock_data: Dict[str, Any] = {}
+        # shard -> user id -> [latest message ISO, messages not yet applied]
+        self._pending_messages: Dict[str, Dict[str, List[Any]]] = {}
+        self._message_task: Optional[asyncio.Task] = None
+        self._message_drain_lock = asyncio.Lock()
 
     @staticmethod
     def shard_for(user_id: str) -> str:
@@ -40,13 +62,26 @@ class SuspicionStore:
         return shard.zfill(2)
 
     def shard_path(self, shard: str) -> Path:
-        return self.root / f"{shard}.json"
+        path = self._shard_paths.get(shard)
+        return path if path is not None else self.root / f"{shard}.json"
 
-    def _get_shard_lock(self, shard: str) -> asyncio.Lock:
+    def _get_shard_lock(self, shard: str) -> AsyncRWLock:
         if shard not in self.shard_locks:
-            self.shard_locks[shard] = asyncio.Lock()
+            self.shard_locks[shard] = AsyncRWLock()
         return self.shard_locks[shard]
 
+    async def _pin_shard(self, shard: str) -> None:
+        async with self.cache_lock:
+            self.locked_shards[shard] = self.locked_shards.get(shard, 0) + 1
+
+    async def _unpin_shard(self, shard: str) -> None:
+        async with self.cache_lock:
+            remaining = self.locked_shards.get(shard, 0) - 1
+            if remaining > 0:
+                self.locked_shards[shard] = remaining
+            else:
+                self.locked_shards.pop(shard, None)
+
     async def initialize(self) -> None:
         await asyncio.to_thread(self.root.mkdir, parents=True, exist_ok=True)
         await self._load_lock()
@@ -96,26 +131,59 @@ class SuspicionStore:
             await write_json_atomic(self.lock_path, self.lock_data)
 
     async def _read_shard_file(self, path: Path) -> Dict[str, Any]:
-        data = await read_json(path, default={})
+        data = await read_json_mapped(path, default={})
         if not isinstance(data, dict):
             return {}
         return data
 
+    async def _peek_shard(self, shard: str) -> Dict[str, Any]:
+        """Cached shard if loaded (it may hold unflushed edits), else a disk read that isn't cached."""
+        data = self.cache.get(shard)
+        if data is not None:
+            return data
+        return await self._read_shard_file(self.shard_path(shard))
+
+    async def read_shard(self, shard: str) -> Dict[str, Any]:
+        """All records of one shard keyed by user id string (treat as read-only)."""
+        return await self._peek_shard(shard)
+
+    async def close(self) -> None:
+        """Release backend resources; callers flush_all() first."""
+        task = self._message_task
+        if task is not None and not task.done():
+            task.cancel()
+
+    def _sorted_ids(self, shard: str, data: Dict[str, Any]) -> List[Tuple[int, str]]:
+        """(int id, key) pairs of a shard in id order; memoized in cache_meta while the shard is cached."""
+        meta = self.cache_meta.get(shard) if self.cache.get(shard) is data else None
+        if meta is not None:
+            cached = meta.get("sorted_ids")
+            if cached is not None:
+                return cached
+        # Keys are written as str(int); isdecimal() keeps int() from raising.
+        parsed_ids = [(int(user_id), user_id) for user_id in data if user_id.isdecimal()]
+        parsed_ids.sort()
+        if meta is not None:
+            meta["sorted_ids"] = parsed_ids
+        return parsed_ids
+
     async def _write_shard_file(self, shard: str, data: Dict[str, Any]) -> None:
-        await write_json_atomic(self.shard_path(shard), data)
+        # write_json_atomic serializes in a worker thread, so concurrent shard
+        # flushes already encode in parallel. Hand it a shallow copy: flushes
+        # don't take shard locks, and records added meanwhile would otherwise
+        # resize the dict under the encoder.
+        await write_json_atomic(self.shard_path(shard), dict(data), compact=True)
 
     async def _evict_if_needed(self) -> None:
         if len(self.cache) <= self.cache_size:
             return
-        for shard, data in list(self.cache.items()):
-            if shard in self.locked_shards:
-                continue
-            meta = self.cache_meta.get(shard, {})
-            if meta.get("dirty"):
-                await self._write_shard_file(shard, data)
-            self.cache.pop(shard, None)
-            self.cache_meta.pop(shard, None)
-            break
+        oldest = next((shard for shard in self.cache if shard not in self.locked_shards), None)
+        if oldest is None:
+            return
+        data = self.cache.pop(oldest)
+        meta = self.cache_meta.pop(oldest, {})
+        if meta.get("dirty"):
+            await self._write_shard_file(oldest, data)
 
     async def _get_shard_data(self, shard: str) -> Dict[str, Any]:
         async with self.cache_lock:
@@ -134,15 +202,32 @@ class SuspicionStore:
         async with self.cache_lock:
             meta = self.cache_meta.setdefault(shard, {})
             meta["dirty"] = True
+            meta.pop("sorted_ids", None)
 
     async def flush_dirty_shards(self) -> None:
+        await self.drain_message_batch()
         async with self.cache_lock:
-            shards = list(self.cache.items())
-        for shard, data in shards:
-            meta = self.cache_meta.get(shard, {})
-            if meta.get("dirty"):
-                await self._write_shard_file(shard, data)
-                meta["dirty"] = False
+            to_write = [
+                (shard, data)
+                for shard, data in self.cache.items()
+                if self.cache_meta.get(shard, {}).get("dirty")
+            ]
+            # Clear before writing so edits made while the writes are in
+            # flight re-mark the shard instead of being lost.
+            for shard, _ in to_write:
+                self.cache_meta[shard]["dirty"] = False
+        if not to_write:
+            return
+        results = await asyncio.gather(
+            *(self._write_shard_file(shard, data) for shard, data in to_write),
+            return_exceptions=True,
+        )
+        failed = [(shard, result) for (shard, _), result in zip(to_write, results) if isinstance(result, BaseException)]
+        if failed:
+            async with self.cache_lock:
+                for shard, _ in failed:
+                    self.cache_meta.setdefault(shard, {})["dirty"] = True
+            raise failed[0][1]
 
     async def flush_all(self) -> None:
         await self.flush_dirty_shards()
@@ -161,67 +246,124 @@ class SuspicionStore:
             "grace_until": None,
         }
 
-    async def read_record(self, user_id: int) -> Optional[Dict[str, Any]]:
+    async def read_record(self, user_id: int) -> Optional[Mapping[str, Any]]:
+        """Read-only live view of a user's record; change it through update_record()."""
         user_str = str(user_id)
         shard = self.shard_for(user_str)
-        lock = self._get_shard_lock(shard)
-        async with lock:
-            async with self.cache_lock:
-                self.locked_shards.add(shard)
+        # Readers share the shard; writers wait until the lookup below is done.
+        async with self._get_shard_lock(shard).reader():
+            await self._pin_shard(shard)
             try:
                 data = await self._get_shard_data(shard)
                 record = data.get(user_str)
-                return dict(record) if isinstance(record, dict) else None
+                return MappingProxyType(record) if isinstance(record, dict) else None
             finally:
-                async with self.cache_lock:
-                    self.locked_shards.discard(shard)
+                await self._unpin_shard(shard)
 
-    async def update_record(self, user_id: int, updater: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+    async def update_record(self, user_id: int, updater: Callable[[Dict[str, Any]], None]) -> Mapping[str, Any]:
+        """Apply updater to the user's record (created from default_record()) and return a read-only view."""
         user_str = str(user_id)
         shard = self.shard_for(user_str)
-        lock = self._get_shard_lock(shard)
-        async with lock:
-            async with self.cache_lock:
-                self.locked_shards.add(shard)
+        async with self._get_shard_lock(shard).writer():
+            await self._pin_shard(shard)
             try:
                 data = await self._get_shard_data(shard)
                 record = data.get(user_str)
                 if not isinstance(record, dict):
                     record = self.default_record()
                     data[user_str] = record
+                    before = None
+                else:
+                    # Values are primitives, so a tuple of items is a full snapshot.
+                    before = tuple(record.items())
                 updater(record)
-                await self._mark_dirty(shard)
-                return dict(record)
+                if before is None or tuple(record.items()) != before:
+                    await self._mark_dirty(shard)
+                return MappingProxyType(record)
             finally:
-                async with self.cache_lock:
-                    self.locked_shards.discard(shard)
+                await self._unpin_shard(shard)
 
     async def delete_record(self, user_id: int) -> None:
         user_str = str(user_id)
         shard = self.shard_for(user_str)
-        lock = self._get_shard_lock(shard)
-        async with lock:
-            async with self.cache_lock:
-                self.locked_shards.add(shard)
+        async with self._get_shard_lock(shard).writer():
+            await self._pin_shard(shard)
             try:
                 data = await self._get_shard_data(shard)
                 if user_str in data:
                     del data[user_str]
                     await self._mark_dirty(shard)
             finally:
-                async with self.cache_lock:
-                    self.locked_shards.discard(shard)
+                await self._unpin_shard(shard)
 
     async def record_message(self, user_id: int, when: dt.datetime) -> None:
+        """
+        Count a message for user_id. Queued and applied with the rest of its
+        shard's batch MESSAGE_BATCH_DELAY_SECONDS later (or on flush), so a
+        burst takes each shard lock once.
+        """
+        user_str = str(user_id)
         when_iso = dt_to_iso(when)
+        updates = self._pending_messages.setdefault(self.shard_for(user_str), {})
+        pending = updates.get(user_str)
+        if pending is None:
+            updates[user_str] = [when_iso, 1]
+        else:
+            pending[0] = when_iso
+            pending[1] += 1
+        if self._message_task is None or self._message_task.done():
+            self._message_task = asyncio.create_task(self._delayed_message_drain())
+
+    async def _delayed_message_drain(self) -> None:
+        await asyncio.sleep(MESSAGE_BATCH_DELAY_SECONDS)
+        try:
+            await self.drain_message_batch()
+        except Exception as e:
+            # Unapplied updates were requeued; the next batch or flush retries.
+            logger.error("Failed to apply message batch for guild %s: %s", self.guild_id, e)
+
+    async def drain_message_batch(self) -> None:
+        """Apply every queued record_message update now."""
+        async with self._message_drain_lock:
+            batch, self._pending_messages = self._pending_messages, {}
+            shards = list(batch)
+            for i, shard in enumerate(shards):
+                try:
+                    await self._apply_message_batch(shard, batch[shard])
+                except BaseException:
+                    self._requeue_messages({key: batch[key] for key in shards[i:]})
+                    raise
+
+    def _requeue_messages(self, batch: Dict[str, Dict[str, List[Any]]]) -> None:
+        for shard, updates in batch.items():
+            queued = self._pending_messages.setdefault(shard, {})
+            for user_str, (when_iso, count) in updates.items():
+                newer = queued.get(user_str)
+                if newer is None:
+                    queued[user_str] = [when_iso, count]
+                else:
+                    newer[1] += count
 
-        def _update(record: Dict[str, Any]) -> None:
-            record["last_message_at"] = when_iso
-            record["nonexcluded_messages"] = int(record.get("nonexcluded_messages", 0)) + 1
-            if record["nonexcluded_messages"] >= 1:
-                record["cleared"] = True
-
-        await self.update_record(user_id, _update)
+    @staticmethod
+    def _apply_messages(record: Dict[str, Any], when_iso: str, count: int) -> None:
+        record["last_message_at"] = when_iso
+        record["nonexcluded_messages"] = int(record.get("nonexcluded_messages", 0)) + count
+        if record["nonexcluded_messages"] >= 1:
+            record["cleared"] = True
+
+    async def _apply_message_batch(self, shard: str, updates: Dict[str, List[Any]]) -> None:
+        async with self._get_shard_lock(shard).writer():
+            await self._pin_shard(shard)
+            try:
+                data = await self._get_shard_data(shard)
+                for user_str, (when_iso, count) in updates.items():
+                    record = data.get(user_str)
+                    if not isinstance(record, dict):
+                        record = data[user_str] = self.default_record()
+                    self._apply_messages(record, when_iso, count)
+                await self._mark_dirty(shard)
+            finally:
+                await self._unpin_shard(shard)
 
     async def ensure_joined_at(self, user_id: int, joined_at: Optional[dt.datetime]) -> None:
         joined_iso = dt_to_iso(joined_at)
@@ -280,28 +422,25 @@ class SuspicionStore:
         shards = shards[shards.index(start_shard) :] + shards[: shards.index(start_shard)]
         start_after_int = safe_int(start_after) if start_after else None
 
-        for shard in shards:
-            data = await self._read_shard_file(self.shard_path(shard))
-            parsed_ids: List[Tuple[int, str]] = []
-            for user_id in data.keys():
-                user_int = safe_int(user_id)
-                if user_int is None:
-                    continue
-                parsed_ids.append((user_int, user_id))
-            parsed_ids.sort(key=lambda item: item[0])
-            for user_id_int, user_id in parsed_ids:
-                if start_after_int is not None and shard == start_shard and user_id_int <= start_after_int:
-                    continue
-                record = data.get(user_id)
-                if not isinstance(record, dict):
-                    continue
-                if filter_func(record):
-                    results.append((user_id, record))
-                    if len(results) >= limit:
-                        next_cursor = user_id
-                        return results, next_cursor
-            start_after = None
-            start_after_int = None
+        for offset in range(0, len(shards), LIST_READ_BATCH):
+            batch = shards[offset : offset + LIST_READ_BATCH]
+            batch_data = await asyncio.gather(*(self._peek_shard(shard) for shard in batch))
+            for shard, data in zip(batch, batch_data):
+                parsed_ids = self._sorted_ids(shard, data)
+                start = 0
+                if start_after_int is not None and shard == start_shard:
+                    start = bisect.bisect_left(parsed_ids, (start_after_int + 1,))
+                for _, user_id in parsed_ids[start:]:
+                    record = data.get(user_id)
+                    if not isinstance(record, dict):
+                        continue
+                    if filter_func(record):
+                        results.append((user_id, record))
+                        if len(results) >= limit:
+                            next_cursor = user_id
+                            return results, next_cursor
+                start_after = None
+                start_after_int = None
         return results, next_cursor
 
     async def summary_counts(self) -> Dict[str, int]:
@@ -310,7 +449,7 @@ class SuspicionStore:
         
         # Read all shards concurrently for better performance
         shard_data_list = await asyncio.gather(
-            *[self._read_shard_file(self.shard_path(shard)) for shard in shards],
+            *[self._peek_shard(shard) for shard in shards],
             return_exceptions=True
         )
         
@@ -330,3 +469,237 @@ class SuspicionStore:
                 if record.get("enforced"):
                     counts["enforced"] += 1
         return counts
+
+
+_RECORD_COLUMNS = (
+    "joined_at",
+    "last_message_at",
+    "nonexcluded_messages",
+    "cleared",
+    "enforced",
+    "grace_until",
+)
+_BOOL_COLUMNS = frozenset({"cleared", "enforced"})
+# Rows fetched per query while list_records applies its Python filter.
+SQLITE_LIST_PAGE = 500
+
+
+class SuspicionStoreSqlite(SuspicionStore):
+    """
+    SuspicionStore backed by one SQLite database per guild.
+
+    A record update is a single-row write instead of a shard rewrite, and
+    counts and cursor pagination run as indexed queries. lock.json and
+    state.json stay JSON files. On first open, existing JSON shards are
+    imported. sqlite3 calls run in a worker thread, serialized by db_lock.
+    """
+
+    def __init__(self, guild_id: int, cache_size: int = 3) -> None:
+        super().__init__(guild_id, cache_size)
+        self.db_path = self.root / "records.sqlite3"
+        self.db_lock = asyncio.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    async def initialize(self) -> None:
+        await super().initialize()
+        async with self.db_lock:
+            await asyncio.to_thread(self._open_db)
+
+    def _open_db(self) -> None:
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            "user_id INTEGER PRIMARY KEY, shard TEXT NOT NULL, "
+            "joined_at TEXT, last_message_at TEXT, "
+            "nonexcluded_messages INTEGER NOT NULL DEFAULT 0, "
+            "cleared INTEGER NOT NULL DEFAULT 0, enforced INTEGER NOT NULL DEFAULT 0, "
+            "grace_until TEXT)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS records_shard ON records(shard, user_id)")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.commit()
+        self._conn = conn
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'json_imported'").fetchone() is None:
+            self._import_json_shards()
+
+    def _import_json_shards(self) -> None:
+        conn = self._conn
+        assert conn is not None
+        imported = 0
+        with conn:
+            for path in sorted(self.root.glob("[0-9][0-9].json")):
+                try:
+                    data = loads_json(path.read_bytes())
+                except (ValueError, OSError) as e:
+                    logger.error("Skipping unreadable shard %s during import: %s", path, e)
+                    continue
+                if not isinstance(data, dict):
+                    continue
+                rows = [
+                    self._to_row(user_id, record)
+                    for user_id, record in data.items()
+                    if isinstance(record, dict) and safe_int(user_id) is not None
+                ]
+                conn.executemany(self._UPSERT_SQL, rows)
+                imported += len(rows)
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_imported', ?)", (dt_to_iso(utcnow()),))
+        if imported:
+            logger.info("Imported %s suspicion records for guild %s into SQLite", imported, self.guild_id)
+
+    _UPSERT_SQL = (
+        "INSERT OR REPLACE INTO records (user_id, shard, joined_at, last_message_at, "
+        "nonexcluded_messages, cleared, enforced, grace_until) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    _SELECT_SQL = "SELECT user_id, " + ", ".join(_RECORD_COLUMNS) + " FROM records"
+
+    def _to_row(self, user_id: str, record: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (
+            int(user_id),
+            self.shard_for(user_id),
+            record.get("joined_at"),
+            record.get("last_message_at"),
+            int(record.get("nonexcluded_messages", 0) or 0),
+            1 if record.get("cleared") else 0,
+            1 if record.get("enforced") else 0,
+            record.get("grace_until"),
+        )
+
+    @staticmethod
+    def _from_row(row: Tuple[Any, ...]) -> Tuple[str, Dict[str, Any]]:
+        record = {
+            column: bool(value) if column in _BOOL_COLUMNS else value
+            for column, value in zip(_RECORD_COLUMNS, row[1:])
+        }
+        return str(row[0]), record
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        async with self.db_lock:
+            if self._conn is None:
+                await asyncio.to_thread(self._open_db)
+            return await asyncio.to_thread(func, *args)
+
+    async def close(self) -> None:
+        await super().close()
+        async with self.db_lock:
+            conn, self._conn = self._conn, None
+            if conn is not None:
+                await asyncio.to_thread(conn.close)
+
+    async def flush_dirty_shards(self) -> None:
+        # Other writes commit on their own; only message batches are buffered.
+        await self.drain_message_batch()
+
+    async def _apply_message_batch(self, shard: str, updates: Dict[str, List[Any]]) -> None:
+        def _apply() -> None:
+            assert self._conn is not None
+            rows = []
+            for user_str, (when_iso, count) in updates.items():
+                record = self._fetch_one(int(user_str)) or self.default_record()
+                self._apply_messages(record, when_iso, count)
+                rows.append(self._to_row(user_str, record))
+            with self._conn:
+                self._conn.executemany(self._UPSERT_SQL, rows)
+
+        await self._run(_apply)
+
+    def _fetch_one(self, user_id: int) -> Optional[Dict[str, Any]]:
+        assert self._conn is not None
+        row = self._conn.execute(self._SELECT_SQL + " WHERE user_id = ?", (user_id,)).fetchone()
+        return self._from_row(row)[1] if row else None
+
+    async def read_record(self, user_id: int) -> Optional[Mapping[str, Any]]:
+        record = await self._run(self._fetch_one, int(user_id))
+        return MappingProxyType(record) if record is not None else None
+
+    async def update_record(self, user_id: int, updater: Callable[[Dict[str, Any]], None]) -> Mapping[str, Any]:
+        user_str = str(user_id)
+
+        def _update() -> Mapping[str, Any]:
+            assert self._conn is not None
+            record = self._fetch_one(int(user_str))
+            before = tuple(record.items()) if record is not None else None
+            if record is None:
+                record = self.default_record()
+            updater(record)
+            if before is None or tuple(record.items()) != before:
+                with self._conn:
+                    self._conn.execute(self._UPSERT_SQL, self._to_row(user_str, record))
+            return MappingProxyType(record)
+
+        return await self._run(_update)
+
+    async def delete_record(self, user_id: int) -> None:
+        def _delete() -> None:
+            assert self._conn is not None
+            with self._conn:
+                self._conn.execute("DELETE FROM records WHERE user_id = ?", (int(user_id),))
+
+        await self._run(_delete)
+
+    async def read_shard(self, shard: str) -> Dict[str, Any]:
+        def _select() -> Dict[str, Any]:
+            assert self._conn is not None
+            rows = self._conn.execute(self._SELECT_SQL + " WHERE shard = ? ORDER BY user_id", (shard,))
+            return dict(self._from_row(row) for row in rows)
+
+        return await self._run(_select)
+
+    async def list_records(
+        self,
+        filter_func: Callable[[Dict[str, Any]], bool],
+        limit: int,
+        cursor: Optional[str],
+    ) -> Tuple[List[Tuple[str, Dict[str, Any]]], Optional[str]]:
+        # Same order as the JSON store: by shard, then numeric id, starting
+        # after the cursor and wrapping round to the shards before it.
+        results: List[Tuple[str, Dict[str, Any]]] = []
+        start_shard = self.shard_for(cursor) if cursor else "00"
+        after_int = safe_int(cursor) if cursor else None
+        if after_int is None:
+            after_int = -1
+
+        def _page(wrapped: bool, shard: str, after: int) -> List[Tuple[Any, ...]]:
+            assert self._conn is not None
+            if wrapped:
+                sql = " WHERE shard < ? AND (shard, user_id) > (?, ?)"
+                params: Tuple[Any, ...] = (start_shard, shard, after)
+            else:
+                sql = " WHERE (shard, user_id) > (?, ?)"
+                params = (shard, after)
+            return self._conn.execute(
+                self._SELECT_SQL + sql + " ORDER BY shard, user_id LIMIT ?",
+                (*params, SQLITE_LIST_PAGE),
+            ).fetchall()
+
+        for wrapped, shard, after in ((False, start_shard, after_int), (True, "", -1)):
+            while True:
+                rows = await self._run(_page, wrapped, shard, after)
+                for row in rows:
+                    user_id, record = self._from_row(row)
+                    if filter_func(record):
+                        results.append((user_id, record))
+                        if len(results) >= limit:
+                            return results, user_id
+                if len(rows) < SQLITE_LIST_PAGE:
+                    break
+                shard, after = self.shard_for(str(rows[-1][0])), rows[-1][0]
+        return results, None
+
+    async def summary_counts(self) -> Dict[str, int]:
+        def _counts() -> Tuple[int, int, int]:
+            assert self._conn is not None
+            return self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(cleared), 0), COALESCE(SUM(enforced), 0) FROM records"
+            ).fetchone()
+
+        total, cleared, enforced = await self._run(_counts)
+        return {"total": total, "cleared": cleared, "enforced": enforced, "uncleared": total - cleared}
+
+
+def create_suspicion_store(guild_id: int, backend: Optional[str] = None, cache_size: int = 3) -> SuspicionStore:
+    """Build the suspicion store for a guild; backend is "json" (default) or "sqlite"."""
+    if backend == "sqlite":
+        return SuspicionStoreSqlite(guild_id, cache_size=cache_size)
+    return SuspicionStore(guild_id, cache_size=cache_size)
@@ -10,41 +10,68 @@ affected servers must approve to resume. Protects against:
 from __future__ import annotations
 
 import asyncio
+import logging
+import time
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import timedelta
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Literal
+from typing import Any, Deque, Dict, List, Optional, Set
 
 from .io_utils import read_json, write_json_atomic
+from .link_storage import get_link_storage
 from .paths import BASE_DIR
 from .utils import utcnow, dt_to_iso, iso_to_dt
 
-# Storage directory
+logger = logging.getLogger("discbot.sync_protection")
+
+# Storage directories: one history file per guild, one file per circuit
 PROTECTION_DIR = BASE_DIR / "data" / "protection"
+HISTORY_DIR = PROTECTION_DIR / "action_history"
+CIRCUITS_DIR = PROTECTION_DIR / "circuits"
+
+# Mutations are coalesced into one state write this long after the first.
+SAVE_DELAY_SECONDS = 0.5
 
 # Default thresholds (can be overridden per-guild)
 DEFAULT_WINDOW_SECONDS = 300  # 5 minutes
 DEFAULT_MAX_ACTIONS = 10  # Actions before triggering protection
+# Actions kept (and persisted) per guild; older ones fall off as new ones arrive
+ACTION_HISTORY_MAX = 100
 
-# All action types that are tracked
-TRACKED_ACTIONS = {"ban", "unban", "kick", "mute", "unmute", "warning"}
-
-# Circuit breaker states
-CircuitState = Literal["closed", "open", "pending_approval"]
+# How long per-guild thresholds are cached; settings updates also invalidate.
+THRESHOLD_CACHE_TTL_SECONDS = 60.0
 
-
-@dataclass
+# All action types that are tracked
+TRACKED_ACTIONS: frozenset[str] = frozenset({"ban", "unban", "kick", "mute", "unmute", "warning"})
+
+# Circuit breaker states; held as ints in memory, persisted by name.
+CIRCUIT_CLOSED = 0
+CIRCUIT_OPEN = 1
+CIRCUIT_PENDING_APPROVAL = 2
+CIRCUIT_STATE_NAMES = ("closed", "open", "pending_approval")
+_CIRCUIT_STATE_BY_NAME = {name: state for state, name in enumerate(CIRCUIT_STATE_NAMES)}
+# is_sync_allowed answer per circuit state: (allowed, blocked-reason template)
+_SYNC_STATE_TABLE = (
+    (True, None),
+    (False, " Sync blocked: {}. Declined by admin."),
+    (False, " Protection triggered: {}. Awaiting approval."),
+)
+
+
+@dataclass(slots=True)
 class ActionRecord:
     """Record of an action for burst detection."""
     action_type: str
     user_id: int
-    timestamp: str
+    # Wall-clock epoch seconds; stored as ISO on disk, parsed once on load.
+    ts: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreaker:
     """Circuit breaker state for a link between two guilds."""
-    state: CircuitState = "closed"
+    state: int = CIRCUIT_CLOSED
     triggered_at: Optional[str] = None
     trigger_reason: Optional[str] = None
     approval_message_id: Optional[int] = None
@@ -55,86 +82,290 @@ class SyncProtection:
     """Handles burst detection and circuit breaker for sync."""
 
     def __init__(self) -> None:
-        self._lock = asyncio.Lock()
-        self._action_history: Dict[int, List[ActionRecord]] = {}
+        # Per-circuit and per-guild-history locks, so unrelated links don't
+        # queue behind each other. Lock order: circuit before history.
+        self._circuit_locks: Dict[str, asyncio.Lock] = {}
+        self._history_locks: Dict[int, asyncio.Lock] = {}
+        # Oldest first; record_action only appends, so expired entries are at the head.
+        self._action_history: Dict[int, Deque[ActionRecord]] = {}
+        # Monotonic timestamps of the same actions, all check_burst needs.
+        # In memory only; seeded from _action_history on load.
+        self._burst_counters: Dict[int, Deque[float]] = {}
         self._circuit_breakers: Dict[str, CircuitBreaker] = {}  # "parent_id:child_id" -> state
+        # Entries changed since the last save; the debounced saver rewrites only these.
+        self._dirty_guilds: Set[int] = set()
+        self._dirty_circuits: Set[str] = set()
+        self._save_task: Optional[asyncio.Task] = None
+        self._save_lock = asyncio.Lock()
+        # Indexes over circuits in "pending_approval": key -> (from_id, to_id,
+        # approval message), to_id -> {key: from_id}, approval message -> key.
+        self._pending_index: Dict[str, tuple[int, int, Optional[int]]] = {}
+        self._pending_by_to: Dict[int, Dict[str, int]] = {}
+        self._pending_by_msg: Dict[int, str] = {}
+        # key -> (CIRCUIT_* state, trigger_reason) for circuits that aren't closed. Replaced
+        # whole by mutators, so is_sync_allowed can read it without the lock.
+        self._cb_snapshot: Dict[str, tuple[int, Optional[str]]] = {}
+        # guild_id -> (window_seconds, max_actions, monotonic expiry)
+        self._threshold_cache: Dict[int, tuple[int, int, float]] = {}
 
     async def initialize(self) -> None:
-        """Ensure storage directory exists and load state."""
-        await asyncio.to_thread(PROTECTION_DIR.mkdir, parents=True, exist_ok=True)
-        await self._load_state()
-
-    def _state_path(self) -> Path:
+        """Ensure storage directories exist and load state."""
+        # Loading tolerates missing directories (and writes create them), so
+        # neither has to wait for the other.
+        await asyncio.gather(
+            asyncio.to_thread(HISTORY_DIR.mkdir, parents=True, exist_ok=True),
+            asyncio.to_thread(CIRCUITS_DIR.mkdir, parents=True, exist_ok=True),
+            self._load_state(),
+        )
+
+    def _legacy_state_path(self) -> Path:
         return PROTECTION_DIR / "protection_state.json"
 
+    def _history_path(self, guild_id: int) -> Path:
+        return HISTORY_DIR / f"{guild_id}.json"
+
+    def _circuit_path(self, key: str) -> Path:
+        # ":" isn't portable in file names.
+        return CIRCUITS_DIR / f"{key.replace(':', '_')}.json"
+
     def _circuit_key(self, from_guild: int, to_guild: int) -> str:
         """Create a unique key for a directional link."""
         return f"{from_guild}:{to_guild}"
 
+    def _circuit_lock(self, key: str) -> asyncio.Lock:
+        lock = self._circuit_locks.get(key)
+        if lock is None:
+            lock = self._circuit_locks[key] = asyncio.Lock()
+        return lock
+
+    def _history_lock(self, guild_id: int) -> asyncio.Lock:
+        lock = self._history_locks.get(guild_id)
+        if lock is None:
+            lock = self._history_locks[guild_id] = asyncio.Lock()
+        return lock
+
+    @staticmethod
+    def _parse_actions(actions: Any) -> Deque[ActionRecord]:
+        records: Deque[ActionRecord] = deque(maxlen=ACTION_HISTORY_MAX)
+        for a in actions:
+            if not isinstance(a, dict):
+                continue
+            parsed = iso_to_dt(a.get("timestamp"))
+            records.append(ActionRecord(
+                action_type=a.get("action_type", ""),
+                user_id=a.get("user_id", 0),
+                ts=parsed.timestamp() if parsed else 0.0,
+            ))
+        return records
+
+    @staticmethod
+    def _parse_circuit(cb_data: Dict[str, Any]) -> CircuitBreaker:
+        return CircuitBreaker(
+            state=_CIRCUIT_STATE_BY_NAME.get(cb_data.get("state"), CIRCUIT_CLOSED),
+            triggered_at=cb_data.get("triggered_at"),
+            trigger_reason=cb_data.get("trigger_reason"),
+            approval_message_id=cb_data.get("approval_message_id"),
+            queued_actions=cb_data.get("queued_actions", []),
+        )
+
     async def _load_state(self) -> None:
-        """Load protection state from disk."""
-        data = await read_json(self._state_path(), default={})
+        """Load per-guild history and per-circuit files, migrating the old single-file state."""
+        def _list(directory: Path) -> List[Path]:
+            return sorted(directory.glob("*.json"))
+
+        history_paths, circuit_paths = await asyncio.gather(
+            asyncio.to_thread(_list, HISTORY_DIR),
+            asyncio.to_thread(_list, CIRCUITS_DIR),
+        )
+        loaded = await asyncio.gather(
+            *(read_json(path, default=None) for path in (*history_paths, *circuit_paths))
+        )
+        history_data = loaded[:len(history_paths)]
+        circuit_data = loaded[len(history_paths):]
+
+        for path, actions in zip(history_paths, history_data):
+            try:
+                guild_id = int(path.stem)
+            except ValueError:
+                continue
+            if isinstance(actions, list):
+                self._action_history[guild_id] = self._parse_actions(actions)
+
+        for path, cb_data in zip(circuit_paths, circuit_data):
+            if isinstance(cb_data, dict) and isinstance(cb_data.get("key"), str):
+                self._circuit_breakers[cb_data["key"]] = self._parse_circuit(cb_data)
+                self._reindex_circuit(cb_data["key"])
+
+        await self._migrate_legacy_state()
+
+        offset = time.monotonic() - time.time()
+        for guild_id, actions in self._action_history.items():
+            self._burst_counters[guild_id] = deque(a.ts + offset for a in actions)
+
+    async def _migrate_legacy_state(self) -> None:
+        """Split a pre-sharding protection_state.json into per-guild/per-circuit files."""
+        legacy_path = self._legacy_state_path()
+        data = await read_json(legacy_path, default=None)
+        if not isinstance(data, dict):
+            return
 
         if isinstance(data.get("action_history"), dict):
             for guild_id_str, actions in data["action_history"].items():
                 try:
                     guild_id = int(guild_id_str)
-                    self._action_history[guild_id] = [
-                        ActionRecord(
-                            action_type=a.get("action_type", ""),
-                            user_id=a.get("user_id", 0),
-                            timestamp=a.get("timestamp", ""),
-                        )
-                        for a in actions if isinstance(a, dict)
-                    ]
                 except (ValueError, TypeError):
-                    pass
+                    continue
+                if guild_id not in self._action_history and isinstance(actions, list):
+                    self._action_history[guild_id] = self._parse_actions(actions)
+                    self._dirty_guilds.add(guild_id)
 
         if isinstance(data.get("circuit_breakers"), dict):
             for key, cb_data in data["circuit_breakers"].items():
-                if isinstance(cb_data, dict):
-                    self._circuit_breakers[key] = CircuitBreaker(
-                        state=cb_data.get("state", "closed"),
-                        triggered_at=cb_data.get("triggered_at"),
-                        trigger_reason=cb_data.get("trigger_reason"),
-                        approval_message_id=cb_data.get("approval_message_id"),
-                        queued_actions=cb_data.get("queued_actions", []),
-                    )
+                if key not in self._circuit_breakers and isinstance(cb_data, dict):
+                    self._circuit_breakers[key] = self._parse_circuit(cb_data)
+                    self._reindex_circuit(key)
+                    self._dirty_circuits.add(key)
+
+        await self._save_state()
+        try:
+            await asyncio.to_thread(legacy_path.replace, legacy_path.with_suffix(".json.migrated"))
+        except FileNotFoundError:
+            pass
+
+    def _mark_guild_dirty(self, guild_id: int) -> None:
+        self._dirty_guilds.add(guild_id)
+        self._schedule_save()
+
+    def _mark_circuit_dirty(self, key: str) -> None:
+        """Reindex a changed circuit and schedule its file for the next save."""
+        self._reindex_circuit(key)
+        self._dirty_circuits.add(key)
+        self._schedule_save()
+
+    def _reindex_circuit(self, key: str) -> None:
+        """Bring the circuit snapshot and pending indexes in line with the current state of key."""
+        old = self._pending_index.pop(key, None)
+        if old is not None:
+            _, to_id, message_id = old
+            by_to = self._pending_by_to.get(to_id)
+            if by_to is not None:
+                by_to.pop(key, None)
+                if not by_to:
+                    del self._pending_by_to[to_id]
+            if message_id is not None and self._pending_by_msg.get(message_id) == key:
+                del self._pending_by_msg[message_id]
+
+        cb = self._circuit_breakers.get(key)
+        if cb is None or cb.state == CIRCUIT_CLOSED:
+            self._cb_snapshot.pop(key, None)
+        else:
+            self._cb_snapshot[key] = (cb.state, cb.trigger_reason)
+        if cb is None or cb.state != CIRCUIT_PENDING_APPROVAL:
+            return
+        parts = key.split(":")
+        if len(parts) != 2:
+            return
+        try:
+            from_id, to_id = int(parts[0]), int(parts[1])
+        except ValueError:
+            return
+        self._pending_index[key] = (from_id, to_id, cb.approval_message_id)
+        self._pending_by_to.setdefault(to_id, {})[key] = from_id
+        if cb.approval_message_id is not None:
+            self._pending_by_msg[cb.approval_message_id] = key
+
+    def _schedule_save(self) -> None:
+        """Schedule a save SAVE_DELAY_SECONDS from now (if none is pending)."""
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._delayed_save())
+
+    async def _delayed_save(self) -> None:
+        await asyncio.sleep(SAVE_DELAY_SECONDS)
+        try:
+            await self._save_state()
+        except Exception as e:
+            # Unwritten entries stay dirty; the next mutation or flush() retries.
+            logger.error("Failed to save sync protection state: %s", e)
+
+    async def flush(self) -> None:
+        """Write pending changes now (call on shutdown)."""
+        task = self._save_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self._save_state()
 
     async def _save_state(self) -> None:
-        """Save protection state to disk."""
-        data = {
-            "action_history": {
-                str(guild_id): [
-                    {
-                        "action_type": a.action_type,
-                        "user_id": a.user_id,
-                        "timestamp": a.timestamp,
-                    }
-                    for a in actions[-100:]  # Keep last 100 per guild
-                ]
-                for guild_id, actions in self._action_history.items()
-            },
-            "circuit_breakers": {
-                key: {
-                    "state": cb.state,
-                    "triggered_at": cb.triggered_at,
-                    "trigger_reason": cb.trigger_reason,
-                    "approval_message_id": cb.approval_message_id,
-                    "queued_actions": cb.queued_actions[-50:],  # Keep last 50 queued
-                }
-                for key, cb in self._circuit_breakers.items()
-            },
+        """Rewrite only the guild history and circuit files changed since the last save."""
+        async with self._save_lock:
+            # Built without awaiting, so it can't interleave with a mutator.
+            guilds, self._dirty_guilds = self._dirty_guilds, set()
+            circuits, self._dirty_circuits = self._dirty_circuits, set()
+            history = {
+                guild_id: self._serialize_actions(self._action_history[guild_id])
+                for guild_id in guilds
+                if guild_id in self._action_history
+            }
+            breakers = {
+                key: self._serialize_circuit(key, self._circuit_breakers[key])
+                for key in circuits
+                if key in self._circuit_breakers
+            }
+            try:
+                for guild_id in guilds:
+                    path = self._history_path(guild_id)
+                    if guild_id in history:
+                        await write_json_atomic(path, history[guild_id])
+                    else:
+                        await asyncio.to_thread(path.unlink, missing_ok=True)
+                for key in circuits:
+                    path = self._circuit_path(key)
+                    if key in breakers:
+                        await write_json_atomic(path, breakers[key])
+                    else:
+                        await asyncio.to_thread(path.unlink, missing_ok=True)
+            except BaseException:
+                # Rewriting an entry that did land is harmless.
+                self._dirty_guilds |= guilds
+                self._dirty_circuits |= circuits
+                raise
+
+    @staticmethod
+    def _serialize_actions(actions: Deque[ActionRecord]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "action_type": a.action_type,
+                "user_id": a.user_id,
+                "timestamp": dt_to_iso(datetime.fromtimestamp(a.ts, timezone.utc)),
+            }
+            for a in actions
+        ]
+
+    @staticmethod
+    def _serialize_circuit(key: str, cb: CircuitBreaker) -> Dict[str, Any]:
+        return {
+            "key": key,
+            "state": CIRCUIT_STATE_NAMES[cb.state],
+            "triggered_at": cb.triggered_at,
+            "trigger_reason": cb.trigger_reason,
+            "approval_message_id": cb.approval_message_id,
+            "queued_actions": cb.queued_actions[-50:],  # Keep last 50 queued
         }
-        await write_json_atomic(self._state_path(), data)
 
     async def get_guild_thresholds(self, guild_id: int) -> tuple[int, int]:
         """
         Get the protection thresholds for a guild.
 
-        Returns (window_seconds, max_actions).
+        Returns (window_seconds, max_actions). Cached for
+        THRESHOLD_CACHE_TTL_SECONDS or until invalidate_thresholds().
         """
-        from .link_storage import get_link_storage
+        cached = self._threshold_cache.get(guild_id)
+        if cached is not None and cached[2] > time.monotonic():
+            return cached[0], cached[1]
+
         storage = await get_link_storage()
         settings = await storage.get_protection_settings(guild_id)
 
@@ -146,20 +377,30 @@ class SyncProtection:
         if not isinstance(max_actions, int) or max_actions <= 0:
             max_actions = DEFAULT_MAX_ACTIONS
 
+        self._threshold_cache[guild_id] = (
+            window_seconds,
+            max_actions,
+            time.monotonic() + THRESHOLD_CACHE_TTL_SECONDS,
+        )
         return window_seconds, max_actions
 
+    def invalidate_thresholds(self, guild_id: int) -> None:
+        """Forget cached thresholds for a guild (its protection settings changed)."""
+        self._threshold_cache.pop(guild_id, None)
+
     def _cleanup_old_actions(self, guild_id: int, window_seconds: int) -> None:
         """Remove actions outside the detection window."""
-        if guild_id not in self._action_history:
-            return
-
-        now = utcnow()
-        cutoff = now - timedelta(seconds=window_seconds)
-
-        self._action_history[guild_id] = [
-            a for a in self._action_history[guild_id]
-            if iso_to_dt(a.timestamp) and iso_to_dt(a.timestamp) > cutoff
-        ]
+        counter = self._burst_counters.get(guild_id)
+        if counter:
+            cutoff = time.monotonic() - window_seconds
+            while counter and counter[0] <= cutoff:
+                counter.popleft()
+
+        actions = self._action_history.get(guild_id)
+        if actions:
+            cutoff = time.time() - window_seconds
+            while actions and actions[0].ts <= cutoff:
+                actions.popleft()
 
     async def record_action(
         self,
@@ -171,17 +412,21 @@ class SyncProtection:
         if action_type not in TRACKED_ACTIONS:
             return
 
-        async with self._lock:
+        async with self._history_lock(origin_guild_id):
             if origin_guild_id not in self._action_history:
-                self._action_history[origin_guild_id] = []
+                self._action_history[origin_guild_id] = deque(maxlen=ACTION_HISTORY_MAX)
 
             self._action_history[origin_guild_id].append(ActionRecord(
                 action_type=action_type,
                 user_id=user_id,
-                timestamp=dt_to_iso(utcnow()),
+                ts=time.time(),
             ))
+            counter = self._burst_counters.get(origin_guild_id)
+            if counter is None:
+                counter = self._burst_counters[origin_guild_id] = deque()
+            counter.append(time.monotonic())
 
-            await self._save_state()
+            self._mark_guild_dirty(origin_guild_id)
 
     async def check_burst(self, origin_guild_id: int) -> tuple[bool, int, int]:
         """
@@ -189,12 +434,11 @@ class SyncProtection:
 
         Returns (is_burst, action_count, threshold).
         """
-        async with self._lock:
-            window_seconds, max_actions = await self.get_guild_thresholds(origin_guild_id)
+        window_seconds, max_actions = await self.get_guild_thresholds(origin_guild_id)
+        async with self._history_lock(origin_guild_id):
             self._cleanup_old_actions(origin_guild_id, window_seconds)
 
-            actions = self._action_history.get(origin_guild_id, [])
-            count = len(actions)
+            count = len(self._burst_counters.get(origin_guild_id, ()))
 
             return count > max_actions, count, max_actions
 
@@ -204,8 +448,8 @@ class SyncProtection:
         to_guild: int,
     ) -> CircuitBreaker:
         """Get the circuit breaker state for a link."""
-        async with self._lock:
-            key = self._circuit_key(from_guild, to_guild)
+        key = self._circuit_key(from_guild, to_guild)
+        async with self._circuit_lock(key):
             if key not in self._circuit_breakers:
                 self._circuit_breakers[key] = CircuitBreaker()
             return self._circuit_breakers[key]
@@ -222,18 +466,18 @@ class SyncProtection:
 
         This pauses syncing until the receiving guild approves.
         """
-        async with self._lock:
-            key = self._circuit_key(from_guild, to_guild)
+        key = self._circuit_key(from_guild, to_guild)
+        async with self._circuit_lock(key):
 
             self._circuit_breakers[key] = CircuitBreaker(
-                state="pending_approval",
+                state=CIRCUIT_PENDING_APPROVAL,
                 triggered_at=dt_to_iso(utcnow()),
                 trigger_reason=reason,
                 approval_message_id=approval_message_id,
                 queued_actions=[],
             )
 
-            await self._save_state()
+            self._mark_circuit_dirty(key)
 
     async def set_approval_message_id(
         self,
@@ -242,13 +486,13 @@ class SyncProtection:
         message_id: int,
     ) -> None:
         """Attach an approval message ID to an existing circuit."""
-        async with self._lock:
-            key = self._circuit_key(from_guild, to_guild)
+        key = self._circuit_key(from_guild, to_guild)
+        async with self._circuit_lock(key):
             cb = self._circuit_breakers.get(key)
             if not cb:
                 return
             cb.approval_message_id = message_id
-            await self._save_state()
+            self._mark_circuit_dirty(key)
 
     async def queue_action(
         self,
@@ -257,18 +501,18 @@ class SyncProtection:
         action_data: Dict[str, Any],
     ) -> None:
         """Queue an action while circuit is open."""
-        async with self._lock:
-            key = self._circuit_key(from_guild, to_guild)
+        key = self._circuit_key(from_guild, to_guild)
+        async with self._circuit_lock(key):
 
             if key not in self._circuit_breakers:
                 return
 
             cb = self._circuit_breakers[key]
-            if cb.state != "pending_approval":
+            if cb.state != CIRCUIT_PENDING_APPROVAL:
                 return
 
             cb.queued_actions.append(action_data)
-            await self._save_state()
+            self._mark_circuit_dirty(key)
 
     async def approve_circuit(
         self,
@@ -287,23 +531,15 @@ class SyncProtection:
         Returns:
             List of queued actions if apply_queued=True, else empty list.
         """
-        async with self._lock:
-            key = self._circuit_key(from_guild, to_guild)
-
+        key = self._circuit_key(from_guild, to_guild)
+        async with self._circuit_lock(key), self._history_lock(from_guild):
             if key not in self._circuit_breakers:
                 return []
 
             cb = self._circuit_breakers[key]
             queued = cb.queued_actions if apply_queued else []
-
-            # Reset to closed state
-            self._circuit_breakers[key] = CircuitBreaker(state="closed")
-
-            # Clear action history for fresh start
-            if from_guild in self._action_history:
-                self._action_history[from_guild] = []
-
-            await self._save_state()
+            # Close the circuit and give the origin guild a fresh burst window
+            self._reset_link_state(key, from_guild)
             return queued
 
     async def decline_circuit(
@@ -314,17 +550,17 @@ class SyncProtection:
         """
         Decline the circuit - keeps it open permanently until unlinked.
         """
-        async with self._lock:
-            key = self._circuit_key(from_guild, to_guild)
+        key = self._circuit_key(from_guild, to_guild)
+        async with self._circuit_lock(key):
 
             if key not in self._circuit_breakers:
                 return
 
             cb = self._circuit_breakers[key]
-            cb.state = "open"
+            cb.state = CIRCUIT_OPEN
             cb.queued_actions = []  # Discard queued actions
 
-            await self._save_state()
+            self._mark_circuit_dirty(key)
 
     async def reset_circuit(
         self,
@@ -332,13 +568,26 @@ class SyncProtection:
         to_guild: int,
     ) -> None:
         """Reset a circuit breaker to closed state."""
-        async with self._lock:
-            key = self._circuit_key(from_guild, to_guild)
+        key = self._circuit_key(from_guild, to_guild)
+        async with self._circuit_lock(key):
+            self._reset_link_state(key)
 
-            if key in self._circuit_breakers:
-                del self._circuit_breakers[key]
+    def _reset_link_state(self, key: str, from_guild: Optional[int] = None) -> None:
+        """
+        Close circuit key in memory, and clear from_guild's action history if given.
 
-            await self._save_state()
+        A missing circuit reads as closed, so the entry is dropped rather than
+        replaced. Caller holds the circuit lock (and from_guild's history lock);
+        the changes go out with the next debounced save.
+        """
+        self._circuit_breakers.pop(key, None)
+        self._mark_circuit_dirty(key)
+        if from_guild is None:
+            return
+        self._burst_counters.pop(from_guild, None)
+        if self._action_history.get(from_guild):
+            self._action_history[from_guild] = deque(maxlen=ACTION_HISTORY_MAX)
+            self._mark_guild_dirty(from_guild)
 
     async def is_sync_allowed(
         self,
@@ -348,29 +597,23 @@ class SyncProtection:
         """
         Check if syncing is allowed between two guilds.
 
-        Returns (allowed, reason_if_blocked).
+        Returns (allowed, reason_if_blocked). Lock-free: reads the snapshot
+        mutators keep in step with the circuit breakers.
         """
-        async with self._lock:
-            key = self._circuit_key(from_guild, to_guild)
+        snapshot = self._cb_snapshot.get(self._circuit_key(from_guild, to_guild))
+        if snapshot is None:
+            return True, None
 
-            if key not in self._circuit_breakers:
-                return True, None
-
-            cb = self._circuit_breakers[key]
-
-            if cb.state == "closed":
-                return True, None
-            elif cb.state == "pending_approval":
-                return False, f" Protection triggered: {cb.trigger_reason}. Awaiting approval."
-            else:  # open
-                return False, f" Sync blocked: {cb.trigger_reason}. Declined by admin."
+        state, trigger_reason = snapshot
+        allowed, template = _SYNC_STATE_TABLE[state]
+        return allowed, None if template is None else template.format(trigger_reason)
 
     async def get_action_count(self, guild_id: int) -> int:
         """Get current action count in detection window."""
-        async with self._lock:
-            window_seconds, _ = await self.get_guild_thresholds(guild_id)
+        window_seconds, _ = await self.get_guild_thresholds(guild_id)
+        async with self._history_lock(guild_id):
             self._cleanup_old_actions(guild_id, window_seconds)
-            return len(self._action_history.get(guild_id, []))
+            return len(self._burst_counters.get(guild_id, ()))
 
     async def get_all_tripped_circuits(self, guild_id: int) -> List[tuple[int, CircuitBreaker]]:
         """
@@ -379,21 +622,11 @@ class SyncProtection:
         Returns list of (other_guild_id, circuit_breaker) for circuits
         where this guild needs to approve.
         """
-        async with self._lock:
-            results = []
-            for key, cb in self._circuit_breakers.items():
-                if cb.state != "pending_approval":
-                    continue
-
-                parts = key.split(":")
-                if len(parts) != 2:
-                    continue
-
-                from_id, to_id = int(parts[0]), int(parts[1])
-                if to_id == guild_id:
-                    results.append((from_id, cb))
-
-            return results
+        # The indexes are only changed synchronously by lock holders; no lock needed to read them.
+        return [
+            (from_id, self._circuit_breakers[key])
+            for key, from_id in self._pending_by_to.get(guild_id, {}).items()
+        ]
 
     async def find_circuit_by_message_id(
         self,
@@ -405,20 +638,13 @@ class SyncProtection:
 
         Returns (from_guild_id, to_guild_id, circuit_breaker) if found.
         """
-        async with self._lock:
-            for key, cb in self._circuit_breakers.items():
-                if cb.state != "pending_approval":
-                    continue
-                if cb.approval_message_id != message_id:
-                    continue
-                parts = key.split(":")
-                if len(parts) != 2:
-                    continue
-                from_id, to_id = int(parts[0]), int(parts[1])
-                if to_guild_id is not None and to_id != to_guild_id:
-                    continue
-                return from_id, to_id, cb
+        key = self._pending_by_msg.get(message_id)
+        if key is None:
             return None
+        from_id, to_id, _ = self._pending_index[key]
+        if to_guild_id is not None and to_id != to_guild_id:
+            return None
+        return from_id, to_id, self._circuit_breakers[key]
 
 
 # Global singleton
@@ -426,6 +652,18 @@ _protection: Optional[SyncProtection] = None
 _protection_lock = asyncio.Lock()
 
 
+def invalidate_guild_thresholds(guild_id: int) -> None:
+    """Drop a guild's cached thresholds, if the singleton has been created."""
+    if _protection is not None:
+        _protection.invalidate_thresholds(guild_id)
+
+
+async def close_sync_protection() -> None:
+    """Flush the SyncProtection singleton's pending state (call on shutdown)."""
+    if _protection is not None:
+        await _protection.flush()
+
+
 async def get_sync_protection() -> SyncProtection:
     """Get or create the global SyncProtection instance."""
     global _protection
@@ -6,20 +6,63 @@ Provides per-guild storage for trust system data with async-safe operations.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import heapq
+import logging
+import sqlite3
+from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
-from .io_utils import read_json, write_json_atomic
+from .io_utils import dumps_json, loads_json, read_json, stat_signature, write_json_atomic
 from .paths import BASE_DIR
-from .utils import utcnow, dt_to_iso
+from .utils import utcnow, dt_to_iso, safe_int
 from .types import TrustScore, Vouch
 
+logger = logging.getLogger("discbot.trust_storage")
+
 # Storage directory
 TRUST_DIR = BASE_DIR / "data" / "trust"
 
+# Writes within this window are coalesced into one write per file
+FLUSH_DELAY_SECONDS = 0.25
+
+# Cooldown bloom filter: 4 KB of bits, 3 probes per key.
+COOLDOWN_BLOOM_BITS = 4096 * 8
+COOLDOWN_BLOOM_HASHES = 3
+
+
+class _BloomFilter:
+    """Fixed-size bloom filter; a miss means the key was definitely never added."""
+
+    __slots__ = ("_bits", "_size", "_hashes")
+
+    def __init__(self, size_bits: int = COOLDOWN_BLOOM_BITS, hashes: int = COOLDOWN_BLOOM_HASHES) -> None:
+        self._bits = bytearray(size_bits // 8)
+        self._size = size_bits
+        self._hashes = hashes
+
+    def _positions(self, key: str) -> List[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        h1 = int.from_bytes(digest[:4], "little")
+        h2 = int.from_bytes(digest[4:], "little") | 1
+        return [(h1 + i * h2) % self._size for i in range(self._hashes)]
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
 
 class TrustStore:
-    """Per-guild storage for trust system data."""
+    """Per-guild storage for trust system data.
+
+    Each file is parsed once and served from memory until its (mtime_ns, size)
+    changes on disk. Mutations update the cached dict and are written back by
+    a debounced flush (call flush() on shutdown).
+    """
 
     def __init__(self, guild_id: int) -> None:
         self.guild_id = guild_id
@@ -27,24 +70,116 @@ class TrustStore:
         self.scores_path = self.root / "trust_scores.json"
         self.vouches_path = self.root / "vouches.json"
         self.events_path = self.root / "events.json"
+        self._root_ready = False
         self._lock = asyncio.Lock()
+        # Parsed file contents and the (mtime_ns, size) they reflect. Paths in
+        # _dirty are ahead of disk until the debounced flush writes them.
+        self._cache: Dict[Path, Any] = {}
+        self._cache_sig: Dict[Path, Optional[Tuple[int, int]]] = {}
+        self._dirty: Set[Path] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_delay = FLUSH_DELAY_SECONDS
+        # user id -> vouch ids (dicts used as insertion-ordered sets); only
+        # vouches.json is persisted, the indexes are rebuilt whenever it is loaded.
+        self._by_to: Dict[Any, Dict[str, None]] = {}
+        self._by_from: Dict[Any, Dict[str, None]] = {}
+        # Negative cache for check_vouch_cooldown. Seeded when vouches.json is
+        # (re)loaded and kept for the life of the guild's shared store, so a
+        # miss answers without touching disk; None until the first load.
+        self._cooldown_bloom: Optional[_BloomFilter] = None
 
     async def initialize(self) -> None:
-        """Ensure storage directory exists."""
-        await asyncio.to_thread(self.root.mkdir, parents=True, exist_ok=True)
+        """
+        Ensure storage directory exists and build the vouch indexes.
+
+        Callers share one store per guild (get_trust_store) and call this per
+        command; after the first call it is a single stat of vouches.json,
+        and the indexes are only rebuilt if the file changed.
+        """
+        async def _load_vouches() -> None:
+            async with self._lock:
+                await self._read_vouches()
+
+        if self._root_ready:
+            await _load_vouches()
+            return
+        # A missing vouches.json loads as empty and writes create the
+        # directory, so the two steps run side by side.
+        await asyncio.gather(
+            asyncio.to_thread(self.root.mkdir, parents=True, exist_ok=True),
+            _load_vouches(),
+        )
+        self._root_ready = True
+
+    # ─── Cache / Flushing ─────────────────────────────────────────────────────
+
+    async def _load(self, path: Path, normalize: Callable[[Any], Any]) -> Tuple[Any, bool]:
+        """Return (data, reloaded) for path, re-reading only if the file changed on disk."""
+        if path in self._dirty:
+            return self._cache[path], False
+        sig = await stat_signature(path)
+        if path in self._cache and sig == self._cache_sig.get(path):
+            return self._cache[path], False
+        data = normalize(await read_json(path, default=None))
+        self._cache[path] = data
+        self._cache_sig[path] = sig
+        return data, True
+
+    def _store(self, path: Path, data: Any) -> None:
+        """Cache data as the contents of path and schedule it to be written."""
+        self._cache[path] = data
+        self._dirty.add(path)
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(self._flush_delay)
+        async with self._lock:
+            try:
+                await self._flush_locked()
+            except Exception as e:
+                # Paths stay dirty; the next mutation or flush() retries.
+                logger.error("Failed to flush trust data for guild %s: %s", self.guild_id, e)
+
+    async def close(self) -> None:
+        """Flush pending writes and release resources (call on shutdown)."""
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write any cached changes now (call on shutdown)."""
+        task = self._flush_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        async with self._lock:
+            await self._flush_locked()
+
+    async def _flush_locked(self) -> None:
+        for path in list(self._dirty):
+            await write_json_atomic(path, self._cache[path])
+            self._dirty.discard(path)
+            self._cache_sig[path] = await stat_signature(path)
 
     # ─── Trust Scores ─────────────────────────────────────────────────────────
 
+    @staticmethod
+    def _normalize_scores(data: Any) -> Dict[str, Dict[str, Any]]:
+        return data if isinstance(data, dict) else {}
+
     async def _read_scores(self) -> Dict[str, Dict[str, Any]]:
         """Read trust scores file."""
-        data = await read_json(self.scores_path, default={})
-        if not isinstance(data, dict):
-            return {}
+        data, _ = await self._load(self.scores_path, self._normalize_scores)
         return data
 
-    async def _write_scores(self, data: Dict[str, Dict[str, Any]]) -> None:
+    def _write_scores(self, data: Dict[str, Dict[str, Any]]) -> None:
         """Write trust scores file."""
-        await write_json_atomic(self.scores_path, data)
+        self._store(self.scores_path, data)
 
     async def get_score(self, user_id: int) -> Optional[TrustScore]:
         """Get trust score for a user."""
@@ -59,8 +194,8 @@ class TrustStore:
         """Save trust score for a user."""
         async with self._lock:
             data = await self._read_scores()
-            data[str(score.user_id)] = score.to_dict()
-            await self._write_scores(data)
+            data[str(score.user_id)] = asdict(score)
+            self._write_scores(data)
 
     async def get_all_scores(self) -> List[TrustScore]:
         """Get all trust scores in the guild."""
@@ -70,9 +205,8 @@ class TrustStore:
 
     # ─── Vouches ──────────────────────────────────────────────────────────────
 
-    async def _read_vouches(self) -> Dict[str, Any]:
-        """Read vouches file."""
-        data = await read_json(self.vouches_path, default={"vouches": {}, "cooldowns": {}})
+    @staticmethod
+    def _normalize_vouches(data: Any) -> Dict[str, Any]:
         if not isinstance(data, dict):
             return {"vouches": {}, "cooldowns": {}}
         if "vouches" not in data:
@@ -81,16 +215,68 @@ class TrustStore:
             data["cooldowns"] = {}
         return data
 
-    async def _write_vouches(self, data: Dict[str, Any]) -> None:
+    async def _read_vouches(self) -> Dict[str, Any]:
+        """Read vouches file (rebuilding the indexes when it is reloaded from disk)."""
+        data, reloaded = await self._load(self.vouches_path, self._normalize_vouches)
+        if reloaded:
+            self._rebuild_vouch_index(data["vouches"])
+            self._seed_cooldown_bloom(data["cooldowns"])
+        return data
+
+    def _write_vouches(self, data: Dict[str, Any]) -> None:
         """Write vouches file."""
-        await write_json_atomic(self.vouches_path, data)
+        self._store(self.vouches_path, data)
+
+    def _index_vouch(self, vouch_id: str, vouch_data: Dict[str, Any]) -> None:
+        self._by_to.setdefault(vouch_data.get("to_user_id"), {})[vouch_id] = None
+        self._by_from.setdefault(vouch_data.get("from_user_id"), {})[vouch_id] = None
+
+    def _unindex_vouch(self, vouch_id: str, vouch_data: Dict[str, Any]) -> None:
+        for index, user_id in (
+            (self._by_to, vouch_data.get("to_user_id")),
+            (self._by_from, vouch_data.get("from_user_id")),
+        ):
+            ids = index.get(user_id)
+            if ids is not None:
+                ids.pop(vouch_id, None)
+                if not ids:
+                    del index[user_id]
+
+    def _rebuild_vouch_index(self, vouches: Dict[str, Dict[str, Any]]) -> None:
+        self._by_to = {}
+        self._by_from = {}
+        for vouch_id, vouch_data in vouches.items():
+            if isinstance(vouch_data, dict):
+                self._index_vouch(vouch_id, vouch_data)
+
+    def _seed_cooldown_bloom(self, cooldowns: Dict[str, Any]) -> None:
+        bloom = _BloomFilter()
+        for cooldown_key in cooldowns:
+            bloom.add(cooldown_key)
+        self._cooldown_bloom = bloom
+
+    def _lookup_vouches(
+        self, data: Dict[str, Any], index: Dict[Any, Dict[str, None]], user_id: int
+    ) -> List[Dict[str, Any]]:
+        """Resolve indexed vouch ids for user_id against the loaded vouch data."""
+        vouches = data["vouches"]
+        return [
+            vouches[vouch_id]
+            for vouch_id in index.get(user_id, ())
+            if vouch_id in vouches
+        ]
 
     async def add_vouch(self, vouch: Vouch) -> None:
         """Add a vouch."""
         async with self._lock:
             data = await self._read_vouches()
-            data["vouches"][vouch.id] = vouch.to_dict()
-            await self._write_vouches(data)
+            previous = data["vouches"].get(vouch.id)
+            if isinstance(previous, dict):
+                self._unindex_vouch(vouch.id, previous)
+            vouch_data = asdict(vouch)
+            data["vouches"][vouch.id] = vouch_data
+            self._write_vouches(data)
+            self._index_vouch(vouch.id, vouch_data)
 
     async def get_vouch(self, vouch_id: str) -> Optional[Vouch]:
         """Get a specific vouch by ID."""
@@ -105,39 +291,39 @@ class TrustStore:
         """Get all vouches received by a user."""
         async with self._lock:
             data = await self._read_vouches()
-            vouches = []
-            for vouch_data in data["vouches"].values():
-                if vouch_data.get("to_user_id") == user_id:
-                    vouches.append(Vouch.from_dict(vouch_data))
-            return vouches
+            return [
+                Vouch.from_dict(vouch_data)
+                for vouch_data in self._lookup_vouches(data, self._by_to, user_id)
+            ]
 
     async def get_vouches_given(self, user_id: int) -> List[Vouch]:
         """Get all vouches given by a user."""
         async with self._lock:
             data = await self._read_vouches()
-            vouches = []
-            for vouch_data in data["vouches"].values():
-                if vouch_data.get("from_user_id") == user_id:
-                    vouches.append(Vouch.from_dict(vouch_data))
-            return vouches
+            return [
+                Vouch.from_dict(vouch_data)
+                for vouch_data in self._lookup_vouches(data, self._by_from, user_id)
+            ]
 
     async def get_mutual_vouches(self, user_id: int) -> List[Vouch]:
         """Get all mutual vouches for a user."""
         async with self._lock:
             data = await self._read_vouches()
-            vouches = []
-            for vouch_data in data["vouches"].values():
-                if vouch_data.get("to_user_id") == user_id and vouch_data.get("mutual"):
-                    vouches.append(Vouch.from_dict(vouch_data))
-            return vouches
+            return [
+                Vouch.from_dict(vouch_data)
+                for vouch_data in self._lookup_vouches(data, self._by_to, user_id)
+                if vouch_data.get("mutual")
+            ]
 
     async def remove_vouch(self, vouch_id: str) -> bool:
         """Remove a vouch. Returns True if removed, False if not found."""
         async with self._lock:
             data = await self._read_vouches()
             if vouch_id in data["vouches"]:
-                del data["vouches"][vouch_id]
-                await self._write_vouches(data)
+                removed = data["vouches"].pop(vouch_id)
+                self._write_vouches(data)
+                if isinstance(removed, dict):
+                    self._unindex_vouch(vouch_id, removed)
                 return True
             return False
 
@@ -147,8 +333,12 @@ class TrustStore:
             data = await self._read_vouches()
             if vouch_id not in data["vouches"]:
                 return False
-            data["vouches"][vouch_id].update(updates)
-            await self._write_vouches(data)
+            vouch_data = data["vouches"][vouch_id]
+            previous = dict(vouch_data)
+            vouch_data.update(updates)
+            self._write_vouches(data)
+            self._unindex_vouch(vouch_id, previous)
+            self._index_vouch(vouch_id, vouch_data)
             return True
 
     async def check_vouch_cooldown(self, from_user_id: int, to_user_id: int) -> Optional[str]:
@@ -156,9 +346,14 @@ class TrustStore:
         Check if a vouch cooldown is active.
         Returns the cooldown expiry timestamp if active, None if not.
         """
+        cooldown_key = f"{from_user_id}_{to_user_id}"
         async with self._lock:
+            if self._cooldown_bloom is None:
+                # First use of this store: loading vouches.json seeds the filter
+                await self._read_vouches()
+            if cooldown_key not in self._cooldown_bloom:
+                return None
             data = await self._read_vouches()
-            cooldown_key = f"{from_user_id}_{to_user_id}"
             return data["cooldowns"].get(cooldown_key)
 
     async def set_vouch_cooldown(self, from_user_id: int, to_user_id: int, expires_at: str) -> None:
@@ -167,20 +362,24 @@ class TrustStore:
             data = await self._read_vouches()
             cooldown_key = f"{from_user_id}_{to_user_id}"
             data["cooldowns"][cooldown_key] = expires_at
-            await self._write_vouches(data)
+            self._write_vouches(data)
+            if self._cooldown_bloom is not None:
+                self._cooldown_bloom.add(cooldown_key)
 
     # ─── Trust Events ─────────────────────────────────────────────────────────
 
+    @staticmethod
+    def _normalize_events(data: Any) -> Dict[str, List[Dict[str, Any]]]:
+        return data if isinstance(data, dict) else {}
+
     async def _read_events(self) -> Dict[str, List[Dict[str, Any]]]:
         """Read trust events file."""
-        data = await read_json(self.events_path, default={})
-        if not isinstance(data, dict):
-            return {}
+        data, _ = await self._load(self.events_path, self._normalize_events)
         return data
 
-    async def _write_events(self, data: Dict[str, List[Dict[str, Any]]]) -> None:
+    def _write_events(self, data: Dict[str, List[Dict[str, Any]]]) -> None:
         """Write trust events file."""
-        await write_json_atomic(self.events_path, data)
+        self._store(self.events_path, data)
 
     async def add_event(
         self,
@@ -207,13 +406,13 @@ class TrustStore:
             }
 
             data[user_key].append(event)
-            await self._write_events(data)
+            self._write_events(data)
 
     async def get_events(self, user_id: int) -> List[Dict[str, Any]]:
         """Get all trust events for a user."""
         async with self._lock:
             data = await self._read_events()
-            return data.get(str(user_id), [])
+            return list(data.get(str(user_id), []))
 
     async def clear_old_events(self, user_id: int, keep_recent: int = 100) -> None:
         """Clear old trust events, keeping only the most recent N."""
@@ -226,7 +425,281 @@ class TrustStore:
 
             events = data[user_key]
             if len(events) > keep_recent:
-                # Sort by timestamp descending and keep most recent
-                events.sort(key=lambda e: e.get("timestamp", ""), reverse=True)
-                data[user_key] = events[:keep_recent]
-                await self._write_events(data)
+                # Keep the most recent N, newest first
+                data[user_key] = heapq.nlargest(
+                    keep_recent, events, key=lambda e: e.get("timestamp", "")
+                )
+                self._write_events(data)
+
+
+class TrustStoreSqlite(TrustStore):
+    """
+    TrustStore backed by one SQLite database per guild.
+
+    Vouch lookups by giver/recipient, cooldown checks and event trimming run
+    as indexed queries, and every mutation is a single-row write instead of
+    a whole-file rewrite. On first open, existing JSON files are imported.
+    sqlite3 calls run in a worker thread, serialized by db_lock.
+    """
+
+    def __init__(self, guild_id: int) -> None:
+        super().__init__(guild_id)
+        self.db_path = self.root / "trust.sqlite3"
+        self.db_lock = asyncio.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    async def initialize(self) -> None:
+        await asyncio.to_thread(self.root.mkdir, parents=True, exist_ok=True)
+        async with self.db_lock:
+            if self._conn is None:
+                await asyncio.to_thread(self._open_db)
+
+    def _open_db(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS scores (user_id INTEGER PRIMARY KEY, data TEXT NOT NULL)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS vouches ("
+            "id TEXT PRIMARY KEY, from_user_id INTEGER, to_user_id INTEGER, "
+            "mutual INTEGER NOT NULL DEFAULT 0, data TEXT NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS vouches_to ON vouches(to_user_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS vouches_from ON vouches(from_user_id)")
+        conn.execute("CREATE TABLE IF NOT EXISTS cooldowns (key TEXT PRIMARY KEY, expires_at TEXT)")
+        conn.execute("CREATE TABLE IF NOT EXISTS events (user_id INTEGER NOT NULL, ts TEXT, data TEXT NOT NULL)")
+        conn.execute("CREATE INDEX IF NOT EXISTS events_user_ts ON events(user_id, ts DESC)")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.commit()
+        self._conn = conn
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'json_imported'").fetchone() is None:
+            self._import_json_files()
+
+    def _import_json_files(self) -> None:
+        conn = self._conn
+        assert conn is not None
+
+        def _load(path: Path) -> Any:
+            try:
+                return loads_json(path.read_bytes())
+            except FileNotFoundError:
+                return None
+            except (ValueError, OSError) as e:
+                logger.error("Skipping unreadable %s during import: %s", path, e)
+                return None
+
+        scores = self._normalize_scores(_load(self.scores_path))
+        vouches = self._normalize_vouches(_load(self.vouches_path))
+        events = self._normalize_events(_load(self.events_path))
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO scores (user_id, data) VALUES (?, ?)",
+                [
+                    (safe_int(user_id), dumps_json(score))
+                    for user_id, score in scores.items()
+                    if isinstance(score, dict) and safe_int(user_id) is not None
+                ],
+            )
+            conn.executemany(
+                self._VOUCH_UPSERT_SQL,
+                [
+                    self._vouch_row(vouch_id, vouch_data)
+                    for vouch_id, vouch_data in vouches["vouches"].items()
+                    if isinstance(vouch_data, dict)
+                ],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO cooldowns (key, expires_at) VALUES (?, ?)",
+                list(vouches["cooldowns"].items()),
+            )
+            conn.executemany(
+                "INSERT INTO events (user_id, ts, data) VALUES (?, ?, ?)",
+                [
+                    (safe_int(user_id), event.get("timestamp", ""), dumps_json(event))
+                    for user_id, user_events in events.items()
+                    if safe_int(user_id) is not None and isinstance(user_events, list)
+                    for event in user_events
+                    if isinstance(event, dict)
+                ],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('json_imported', ?)",
+                (dt_to_iso(utcnow()),),
+            )
+
+    _VOUCH_UPSERT_SQL = (
+        "INSERT OR REPLACE INTO vouches (id, from_user_id, to_user_id, mutual, data) "
+        "VALUES (?, ?, ?, ?, ?)"
+    )
+
+    @staticmethod
+    def _vouch_row(vouch_id: str, vouch_data: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (
+            vouch_id,
+            vouch_data.get("from_user_id"),
+            vouch_data.get("to_user_id"),
+            1 if vouch_data.get("mutual") else 0,
+            dumps_json(vouch_data),
+        )
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        async with self.db_lock:
+            if self._conn is None:
+                await asyncio.to_thread(self._open_db)
+            return await asyncio.to_thread(func, *args)
+
+    def _query(self, sql: str, params: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+        assert self._conn is not None
+        return self._conn.execute(sql, params).fetchall()
+
+    def _write(self, sql: str, params: Tuple[Any, ...] = ()) -> int:
+        assert self._conn is not None
+        with self._conn:
+            return self._conn.execute(sql, params).rowcount
+
+    async def flush(self) -> None:
+        # Every write commits on its own; nothing is buffered.
+        return None
+
+    async def close(self) -> None:
+        async with self.db_lock:
+            conn, self._conn = self._conn, None
+            if conn is not None:
+                await asyncio.to_thread(conn.close)
+
+    # ─── Trust Scores ─────────────────────────────────────────────────────────
+
+    async def get_score(self, user_id: int) -> Optional[TrustScore]:
+        rows = await self._run(self._query, "SELECT data FROM scores WHERE user_id = ?", (int(user_id),))
+        return TrustScore.from_dict(loads_json(rows[0][0])) if rows else None
+
+    async def save_score(self, score: TrustScore) -> None:
+        await self._run(
+            self._write,
+            "INSERT OR REPLACE INTO scores (user_id, data) VALUES (?, ?)",
+            (int(score.user_id), dumps_json(score)),
+        )
+
+    async def get_all_scores(self) -> List[TrustScore]:
+        rows = await self._run(self._query, "SELECT data FROM scores ORDER BY rowid")
+        return [TrustScore.from_dict(loads_json(data)) for (data,) in rows]
+
+    # ─── Vouches ──────────────────────────────────────────────────────────────
+
+    async def _select_vouches(self, where: str, params: Tuple[Any, ...]) -> List[Vouch]:
+        rows = await self._run(self._query, f"SELECT data FROM vouches WHERE {where} ORDER BY rowid", params)
+        return [Vouch.from_dict(loads_json(data)) for (data,) in rows]
+
+    async def add_vouch(self, vouch: Vouch) -> None:
+        await self._run(self._write, self._VOUCH_UPSERT_SQL, self._vouch_row(vouch.id, asdict(vouch)))
+
+    async def get_vouch(self, vouch_id: str) -> Optional[Vouch]:
+        vouches = await self._select_vouches("id = ?", (vouch_id,))
+        return vouches[0] if vouches else None
+
+    async def get_vouches_for(self, user_id: int) -> List[Vouch]:
+        return await self._select_vouches("to_user_id = ?", (user_id,))
+
+    async def get_vouches_given(self, user_id: int) -> List[Vouch]:
+        return await self._select_vouches("from_user_id = ?", (user_id,))
+
+    async def get_mutual_vouches(self, user_id: int) -> List[Vouch]:
+        return await self._select_vouches("to_user_id = ? AND mutual = 1", (user_id,))
+
+    async def remove_vouch(self, vouch_id: str) -> bool:
+        return await self._run(self._write, "DELETE FROM vouches WHERE id = ?", (vouch_id,)) > 0
+
+    async def update_vouch(self, vouch_id: str, updates: Dict[str, Any]) -> bool:
+        def _update() -> bool:
+            rows = self._query("SELECT data FROM vouches WHERE id = ?", (vouch_id,))
+            if not rows:
+                return False
+            vouch_data = loads_json(rows[0][0])
+            vouch_data.update(updates)
+            self._write(self._VOUCH_UPSERT_SQL, self._vouch_row(vouch_id, vouch_data))
+            return True
+
+        return await self._run(_update)
+
+    async def check_vouch_cooldown(self, from_user_id: int, to_user_id: int) -> Optional[str]:
+        rows = await self._run(
+            self._query, "SELECT expires_at FROM cooldowns WHERE key = ?", (f"{from_user_id}_{to_user_id}",)
+        )
+        return rows[0][0] if rows else None
+
+    async def set_vouch_cooldown(self, from_user_id: int, to_user_id: int, expires_at: str) -> None:
+        await self._run(
+            self._write,
+            "INSERT OR REPLACE INTO cooldowns (key, expires_at) VALUES (?, ?)",
+            (f"{from_user_id}_{to_user_id}", expires_at),
+        )
+
+    # ─── Trust Events ─────────────────────────────────────────────────────────
+
+    async def add_event(
+        self,
+        user_id: int,
+        event_type: str,
+        weight: float,
+        positive: bool,
+        details: Optional[str] = None,
+    ) -> None:
+        event = {
+            "event_type": event_type,
+            "weight": weight,
+            "positive": positive,
+            "details": details,
+            "timestamp": dt_to_iso(utcnow()),
+        }
+        await self._run(
+            self._write,
+            "INSERT INTO events (user_id, ts, data) VALUES (?, ?, ?)",
+            (int(user_id), event["timestamp"], dumps_json(event)),
+        )
+
+    async def get_events(self, user_id: int) -> List[Dict[str, Any]]:
+        rows = await self._run(
+            self._query, "SELECT data FROM events WHERE user_id = ? ORDER BY rowid", (int(user_id),)
+        )
+        return [loads_json(data) for (data,) in rows]
+
+    async def clear_old_events(self, user_id: int, keep_recent: int = 100) -> None:
+        await self._run(
+            self._write,
+            "DELETE FROM events WHERE user_id = ? AND rowid NOT IN ("
+            "SELECT rowid FROM events WHERE user_id = ? ORDER BY ts DESC, rowid DESC LIMIT ?)",
+            (int(user_id), int(user_id), keep_recent),
+        )
+
+
+_trust_stores: Dict[int, TrustStore] = {}
+
+
+def get_trust_store(guild_id: int, backend: Optional[str] = None) -> TrustStore:
+    """
+    Get the process-wide TrustStore for a guild, so its caches and locks are shared.
+
+    backend is "json" (default) or "sqlite", from the guild's trust_backend
+    config; GuildState passes it when the guild starts, and it only takes
+    effect on the first call per guild.
+    """
+    cls = TrustStoreSqlite if backend == "sqlite" else TrustStore
+    store = _trust_stores.get(guild_id)
+    if store is None:
+        store = _trust_stores[guild_id] = cls(guild_id)
+    elif backend is not None and type(store) is not cls:
+        logger.warning(
+            "Trust store for guild %s already open as %s; trust_backend=%r applies after restart",
+            guild_id, type(store).__name__, backend,
+        )
+    return store
+
+
+async def close_all() -> None:
+    """Flush pending writes and close every TrustStore (call on shutdown)."""
+    for store in list(_trust_stores.values()):
+        try:
+            await store.close()
+        except Exception as e:
+            logger.error("Failed to flush trust data for guild %s: %s", store.guild_id, e)
@@ -8,64 +8,144 @@ Using dataclasses instead of raw dicts provides:
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Optional
+import sys
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, Callable, ClassVar, Optional, TypeVar
 
+R = TypeVar("R", bound="_Record")
 
-@dataclass
-class AttachmentInfo:
+
+class _Record:
+    """
+    Base for persisted records: from_dict generated from field tables.
+
+    There is no to_dict: records go to the JSON helpers as-is, and
+    dataclasses.asdict covers code that needs a plain dict. The tables and
+    the generated _from_mapping are built once per class by @_record.
+    _FALLBACKS gives the value from_dict uses for a missing key when it
+    differs from the field's own default (required fields have none);
+    _NESTED maps fields holding another record to its class; _INTERNED
+    names enum-like string fields whose loaded values are sys.intern()ed so
+    every instance shares one object per value.
+    """
+    __slots__ = ()
+
+    _FALLBACKS: ClassVar[dict[str, Any]] = {}
+    _NESTED: ClassVar[dict[str, type[_Record]]] = {}
+    _INTERNED: ClassVar[frozenset[str]] = frozenset()
+    _FIELD_NAMES: ClassVar[tuple[str, ...]] = ()
+    _FIELD_DEFAULTS: ClassVar[dict[str, Any]] = {}
+    _FIELD_FACTORIES: ClassVar[dict[str, Callable[[], Any]]] = {}
+
+    @classmethod
+    def from_dict(cls: type[R], data: dict[str, Any]) -> R:
+        return cls._from_mapping(data)
+
+    @classmethod
+    def _from_mapping(cls: type[R], data: dict[str, Any]) -> R:
+        raise NotImplementedError(f"{cls.__name__} is missing the @_record decorator")
+
+
+def _intern_str(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _compile_from_mapping(cls: type[R]) -> Callable[[type[R], dict[str, Any]], R]:
+    """
+    Generate cls._from_mapping as straight-line code.
+
+    The fast path subscripts every plain field and passes them positionally;
+    files written by this code have every key, so it is the common case. A
+    KeyError falls back to keyword construction where a missing field gets
+    its factory's result or its default. A nested record is only built from
+    a non-empty value.
+    """
+    namespace: dict[str, Any] = {"_intern": _intern_str}
+    fast_args = []
+    args = []
+    for i, name in enumerate(cls._FIELD_NAMES):
+        if name in cls._FIELD_FACTORIES:
+            namespace[f"_f{i}"] = cls._FIELD_FACTORIES[name]
+            fallback = f"_f{i}()"
+        else:
+            namespace[f"_d{i}"] = cls._FIELD_DEFAULTS.get(name)
+            fallback = f"_d{i}"
+        if name in cls._NESTED:
+            namespace[f"_n{i}"] = cls._NESTED[name]
+            value = f"(_n{i}.from_dict(_v) if (_v := data.get({name!r})) else {fallback})"
+            fast_value = value
+        elif fallback.endswith("()"):
+            value = f"(data[{name!r}] if {name!r} in data else {fallback})"
+            fast_value = f"data[{name!r}]"
+        else:
+            value = f"data.get({name!r}, {fallback})"
+            fast_value = f"data[{name!r}]"
+        if name in cls._INTERNED:
+            value = f"_intern({value})"
+            fast_value = f"_intern({fast_value})"
+        fast_args.append(f"            {fast_value},")
+        args.append(f"        {name}={value},")
+    source = "\n".join([
+        "def _from_mapping(cls, data):",
+        "    try:",
+        "        return cls(",
+        *fast_args,
+        "        )",
+        "    except KeyError:",
+        "        pass",
+        "    return cls(",
+        *args,
+        "    )",
+    ])
+    exec(compile(source, f"<{cls.__name__}._from_mapping>", "exec"), namespace)
+    return namespace["_from_mapping"]
+
+
+def _record(cls: type[R]) -> type[R]:
+    """Precompute the field tables and compile from_dict for a record class."""
+    specs = fields(cls)
+    cls._FIELD_NAMES = tuple(f.name for f in specs)
+    cls._FIELD_DEFAULTS = {f.name: f.default for f in specs if f.default is not MISSING}
+    cls._FIELD_DEFAULTS.update(cls._FALLBACKS)
+    cls._FIELD_FACTORIES = {
+        f.name: f.default_factory
+        for f in specs
+        if f.default_factory is not MISSING and f.name not in cls._FALLBACKS
+    }
+    cls._from_mapping = classmethod(_compile_from_mapping(cls))
+    if "from_dict" not in cls.__dict__:
+        # No custom pre-processing: skip the indirection through _from_mapping
+        cls.from_dict = cls._from_mapping
+    return cls
+
+
+@_record
+@dataclass(slots=True, eq=False)
+class AttachmentInfo(_Record):
     """Information about a Discord attachment."""
     url: str
     filename: str
     size: int
     content_type: Optional[str] = None
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "url": self.url,
-            "filename": self.filename,
-            "size": self.size,
-            "content_type": self.content_type,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> AttachmentInfo:
-        return cls(
-            url=data.get("url", ""),
-            filename=data.get("filename", ""),
-            size=data.get("size", 0),
-            content_type=data.get("content_type"),
-        )
+    _FALLBACKS: ClassVar[dict[str, Any]] = {"url": "", "filename": "", "size": 0}
 
 
-@dataclass
-class LinkedMessage:
+@_record
+@dataclass(slots=True, eq=False)
+class LinkedMessage(_Record):
     """Reference to a linked Discord message."""
     guild_id: Optional[str] = None
     channel_id: Optional[str] = None
     message_id: Optional[str] = None
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "guild_id": self.guild_id,
-            "channel_id": self.channel_id,
-            "message_id": self.message_id,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> LinkedMessage:
-        return cls(
-            guild_id=data.get("guild_id"),
-            channel_id=data.get("channel_id"),
-            message_id=data.get("message_id"),
-        )
-
 
-@dataclass
-class ScanJob:
+@_record
+@dataclass(slots=True, eq=False)
+class ScanJob(_Record):
     """
     A job to scan an image for hash matching.
-    
+
     Sources:
     - "attachment": Direct file attachment
     - "discord_cdn_url": URL pointing to Discord CDN
@@ -82,39 +162,21 @@ class ScanJob:
     url: Optional[str] = None
     linked: LinkedMessage = field(default_factory=LinkedMessage)
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "v": self.v,
-            "enqueued_at": self.enqueued_at,
-            "guild_id": self.guild_id,
-            "channel_id": self.channel_id,
-            "message_id": self.message_id,
-            "author_id": self.author_id,
-            "source": self.source,
-            "attachment": self.attachment.to_dict() if self.attachment else None,
-            "url": self.url,
-            "linked": self.linked.to_dict(),
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> ScanJob:
-        attachment_data = data.get("attachment")
-        linked_data = data.get("linked") or {}
-        return cls(
-            v=data.get("v", 2),
-            enqueued_at=data.get("enqueued_at", ""),
-            guild_id=data.get("guild_id", ""),
-            channel_id=data.get("channel_id", ""),
-            message_id=data.get("message_id", ""),
-            author_id=data.get("author_id", ""),
-            source=data.get("source", ""),
-            attachment=AttachmentInfo.from_dict(attachment_data) if attachment_data else None,
-            url=data.get("url"),
-            linked=LinkedMessage.from_dict(linked_data),
-        )
-
-
-@dataclass
+    _FALLBACKS: ClassVar[dict[str, Any]] = {
+        "guild_id": "",
+        "channel_id": "",
+        "message_id": "",
+        "author_id": "",
+        "source": "",
+    }
+    _NESTED: ClassVar[dict[str, type[_Record]]] = {
+        "attachment": AttachmentInfo,
+        "linked": LinkedMessage,
+    }
+    _INTERNED: ClassVar[frozenset[str]] = frozenset({"source"})
+
+
+@dataclass(slots=True, eq=False)
 class EnforcementResult:
     """Result of an enforcement action (role removal, etc.)."""
     roles_removed: int = 0
@@ -127,8 +189,9 @@ class EnforcementResult:
         return self.error is None
 
 
-@dataclass
-class TrustScore:
+@_record
+@dataclass(slots=True, eq=False)
+class TrustScore(_Record):
     """Trust score calculation for a user in a guild."""
     user_id: int
     guild_id: int
@@ -141,38 +204,24 @@ class TrustScore:
     tier: str  # untrusted/neutral/trusted/highly_trusted
     last_updated: str
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "user_id": self.user_id,
-            "guild_id": self.guild_id,
-            "children_count_score": self.children_count_score,
-            "upflow_status_score": self.upflow_status_score,
-            "vouches_score": self.vouches_score,
-            "link_age_score": self.link_age_score,
-            "approval_rate_score": self.approval_rate_score,
-            "total_score": self.total_score,
-            "tier": self.tier,
-            "last_updated": self.last_updated,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> TrustScore:
-        return cls(
-            user_id=data.get("user_id", 0),
-            guild_id=data.get("guild_id", 0),
-            children_count_score=data.get("children_count_score", 0.0),
-            upflow_status_score=data.get("upflow_status_score", 0.0),
-            vouches_score=data.get("vouches_score", 0.0),
-            link_age_score=data.get("link_age_score", 0.0),
-            approval_rate_score=data.get("approval_rate_score", 0.0),
-            total_score=data.get("total_score", 0.0),
-            tier=data.get("tier", "untrusted"),
-            last_updated=data.get("last_updated", ""),
-        )
-
-
-@dataclass
-class Commission:
+    _FALLBACKS: ClassVar[dict[str, Any]] = {
+        "user_id": 0,
+        "guild_id": 0,
+        "children_count_score": 0.0,
+        "upflow_status_score": 0.0,
+        "vouches_score": 0.0,
+        "link_age_score": 0.0,
+        "approval_rate_score": 0.0,
+        "total_score": 0.0,
+        "tier": "untrusted",
+        "last_updated": "",
+    }
+    _INTERNED: ClassVar[frozenset[str]] = frozenset({"tier"})
+
+
+@_record
+@dataclass(slots=True)
+class Commission(_Record):
     """Commission tracking information."""
     id: str
     artist_id: int
@@ -191,50 +240,25 @@ class Commission:
     notes: str = ""
     incognito: bool = False
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "id": self.id,
-            "artist_id": self.artist_id,
-            "client_id": self.client_id,
-            "guild_id": self.guild_id,
-            "stage": self.stage,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "deadline": self.deadline,
-            "revisions_used": self.revisions_used,
-            "revisions_limit": self.revisions_limit,
-            "tags": self.tags,
-            "payment_status": self.payment_status,
-            "price": self.price,
-            "currency": self.currency,
-            "notes": self.notes,
-            "incognito": self.incognito,
-        }
+    _FALLBACKS: ClassVar[dict[str, Any]] = {
+        "id": "",
+        "artist_id": 0,
+        "client_id": 0,
+        "guild_id": 0,
+        "stage": "Inquiry",
+        "created_at": "",
+        "updated_at": "",
+    }
+    _INTERNED: ClassVar[frozenset[str]] = frozenset({"stage", "payment_status", "currency"})
 
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> Commission:
-        return cls(
-            id=data.get("id", ""),
-            artist_id=data.get("artist_id", 0),
-            client_id=data.get("client_id", 0),
-            guild_id=data.get("guild_id", 0),
-            stage=data.get("stage", "Inquiry"),
-            created_at=data.get("created_at", ""),
-            updated_at=data.get("updated_at", ""),
-            deadline=data.get("deadline"),
-            revisions_used=data.get("revisions_used", 0),
-            revisions_limit=data.get("revisions_limit", 3),
-            tags=data.get("tags", []),
-            payment_status=data.get("payment_status", "pending"),
-            price=data.get("price", 0.0),
-            currency=data.get("currency", "USD"),
-            notes=data.get("notes", ""),
-            incognito=data.get("incognito", False),
-        )
-
-
-@dataclass
-class PortfolioEntry:
+
+# Legacy portfolio privacy values and what they load as
+_PRIVACY_MAP: dict[str, str] = {"federation": "private"}
+
+
+@_record
+@dataclass(slots=True)
+class PortfolioEntry(_Record):
     """Portfolio entry for an artist."""
     id: str
     user_id: int
@@ -250,47 +274,19 @@ class PortfolioEntry:
     created_at: str = ""
     views: int = 0
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "image_url": self.image_url,
-            "title": self.title,
-            "category": self.category,
-            "tags": self.tags,
-            "featured": self.featured,
-            "privacy": self.privacy,
-            "commission_example": self.commission_example,
-            "commission_type": self.commission_type,
-            "before_after": self.before_after,
-            "created_at": self.created_at,
-            "views": self.views,
-        }
+    _FALLBACKS: ClassVar[dict[str, Any]] = {"id": "", "user_id": 0, "image_url": "", "title": ""}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> PortfolioEntry:
-        privacy = data.get("privacy", "public")
-        if privacy == "federation":
-            privacy = "private"
-        return cls(
-            id=data.get("id", ""),
-            user_id=data.get("user_id", 0),
-            image_url=data.get("image_url", ""),
-            title=data.get("title", ""),
-            category=data.get("category", "general"),
-            tags=data.get("tags", []),
-            featured=data.get("featured", False),
-            privacy=privacy,
-            commission_example=data.get("commission_example", False),
-            commission_type=data.get("commission_type"),
-            before_after=data.get("before_after"),
-            created_at=data.get("created_at", ""),
-            views=data.get("views", 0),
-        )
-
-
-@dataclass
-class UserReport:
+        privacy = data.get("privacy")
+        if privacy in _PRIVACY_MAP:
+            data = {**data, "privacy": _PRIVACY_MAP[privacy]}
+        return cls._from_mapping(data)
+
+
+@_record
+@dataclass(slots=True)
+class UserReport(_Record):
     """User report for moderation."""
     id: str
     reporter_id: int
@@ -307,46 +303,20 @@ class UserReport:
     outcome: Optional[str] = None
     notes: list[str] = field(default_factory=list)
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "id": self.id,
-            "reporter_id": self.reporter_id,
-            "target_id": self.target_id,
-            "target_message_id": self.target_message_id,
-            "guild_id": self.guild_id,
-            "category": self.category,
-            "priority": self.priority,
-            "status": self.status,
-            "assigned_mod_id": self.assigned_mod_id,
-            "mod_thread_id": self.mod_thread_id,
-            "created_at": self.created_at,
-            "resolved_at": self.resolved_at,
-            "outcome": self.outcome,
-            "notes": self.notes,
-        }
+    _FALLBACKS: ClassVar[dict[str, Any]] = {
+        "id": "",
+        "reporter_id": 0,
+        "target_id": 0,
+        "target_message_id": 0,
+        "guild_id": 0,
+        "category": "other",
+    }
+    _INTERNED: ClassVar[frozenset[str]] = frozenset({"category", "priority", "status"})
 
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> UserReport:
-        return cls(
-            id=data.get("id", ""),
-            reporter_id=data.get("reporter_id", 0),
-            target_id=data.get("target_id", 0),
-            target_message_id=data.get("target_message_id", 0),
-            guild_id=data.get("guild_id", 0),
-            category=data.get("category", "other"),
-            priority=data.get("priority", "normal"),
-            status=data.get("status", "open"),
-            assigned_mod_id=data.get("assigned_mod_id"),
-            mod_thread_id=data.get("mod_thread_id"),
-            created_at=data.get("created_at", ""),
-            resolved_at=data.get("resolved_at"),
-            outcome=data.get("outcome"),
-            notes=data.get("notes", []),
-        )
-
-
-@dataclass
-class Vouch:
+
+@_record
+@dataclass(slots=True)
+class Vouch(_Record):
     """Vouch from one user to another."""
     id: str
     from_user_id: int
@@ -360,40 +330,19 @@ class Vouch:
     verified_by_mod: Optional[int] = None
     verified_at: Optional[str] = None
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "id": self.id,
-            "from_user_id": self.from_user_id,
-            "to_user_id": self.to_user_id,
-            "guild_id": self.guild_id,
-            "proof_type": self.proof_type,
-            "proof_url": self.proof_url,
-            "transaction_type": self.transaction_type,
-            "created_at": self.created_at,
-            "mutual": self.mutual,
-            "verified_by_mod": self.verified_by_mod,
-            "verified_at": self.verified_at,
-        }
+    _FALLBACKS: ClassVar[dict[str, Any]] = {
+        "id": "",
+        "from_user_id": 0,
+        "to_user_id": 0,
+        "guild_id": 0,
+        "proof_type": "screenshot",
+        "proof_url": "",
+    }
 
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> Vouch:
-        return cls(
-            id=data.get("id", ""),
-            from_user_id=data.get("from_user_id", 0),
-            to_user_id=data.get("to_user_id", 0),
-            guild_id=data.get("guild_id", 0),
-            proof_type=data.get("proof_type", "screenshot"),
-            proof_url=data.get("proof_url", ""),
-            transaction_type=data.get("transaction_type", "commission"),
-            created_at=data.get("created_at", ""),
-            mutual=data.get("mutual", False),
-            verified_by_mod=data.get("verified_by_mod"),
-            verified_at=data.get("verified_at"),
-        )
-
-
-@dataclass
-class WaitlistEntry:
+
+@_record
+@dataclass(slots=True)
+class WaitlistEntry(_Record):
     """Waitlist entry for commission queue."""
     id: str
     artist_id: int
@@ -407,40 +356,18 @@ class WaitlistEntry:
     notified_at: Optional[str] = None
     timeout_at: Optional[str] = None
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "id": self.id,
-            "artist_id": self.artist_id,
-            "client_id": self.client_id,
-            "guild_id": self.guild_id,
-            "position": self.position,
-            "notes": self.notes,
-            "notify_on_open": self.notify_on_open,
-            "notify_method": self.notify_method,
-            "created_at": self.created_at,
-            "notified_at": self.notified_at,
-            "timeout_at": self.timeout_at,
-        }
+    _FALLBACKS: ClassVar[dict[str, Any]] = {
+        "id": "",
+        "artist_id": 0,
+        "client_id": 0,
+        "guild_id": 0,
+        "position": 0,
+    }
 
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> WaitlistEntry:
-        return cls(
-            id=data.get("id", ""),
-            artist_id=data.get("artist_id", 0),
-            client_id=data.get("client_id", 0),
-            guild_id=data.get("guild_id", 0),
-            position=data.get("position", 0),
-            notes=data.get("notes", ""),
-            notify_on_open=data.get("notify_on_open", True),
-            notify_method=data.get("notify_method", "dm"),
-            created_at=data.get("created_at", ""),
-            notified_at=data.get("notified_at"),
-            timeout_at=data.get("timeout_at"),
-        )
-
-
-@dataclass
-class Bookmark:
+
+@_record
+@dataclass(slots=True)
+class Bookmark(_Record):
     """Bookmarked message for later retrieval."""
     id: str
     user_id: int
@@ -455,35 +382,12 @@ class Bookmark:
     delivery_method: str = "dm"  # dm/channel
     notify_channel_id: Optional[int] = None
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "guild_id": self.guild_id,
-            "channel_id": self.channel_id,
-            "message_id": self.message_id,
-            "message_link": self.message_link,
-            "note": self.note,
-            "created_at": self.created_at,
-            "deliver_at": self.deliver_at,
-            "delivered": self.delivered,
-            "delivery_method": self.delivery_method,
-            "notify_channel_id": self.notify_channel_id,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> Bookmark:
-        return cls(
-            id=data.get("id", ""),
-            user_id=data.get("user_id", 0),
-            guild_id=data.get("guild_id", 0),
-            channel_id=data.get("channel_id", 0),
-            message_id=data.get("message_id", 0),
-            message_link=data.get("message_link", ""),
-            note=data.get("note", ""),
-            created_at=data.get("created_at", ""),
-            deliver_at=data.get("deliver_at"),
-            delivered=data.get("delivered", False),
-            delivery_method=data.get("delivery_method", "dm"),
-            notify_channel_id=data.get("notify_channel_id"),
-        )
+    _FALLBACKS: ClassVar[dict[str, Any]] = {
+        "id": "",
+        "user_id": 0,
+        "guild_id": 0,
+        "channel_id": 0,
+        "message_id": 0,
+        "message_link": "",
+    }
+    _INTERNED: ClassVar[frozenset[str]] = frozenset({"delivery_method"})
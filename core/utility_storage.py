@@ -6,254 +6,411 @@ Provides per-user and per-guild storage for utility features with async-safe ope
 from __future__ import annotations
 
 import asyncio
+import logging
+import secrets
+from collections import OrderedDict
+from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
-from .io_utils import read_json, write_json_atomic
+from .io_utils import read_json, stat_signature, write_json_atomic
 from .paths import BASE_DIR
-from .utils import utcnow, dt_to_iso
+from .utils import utcnow, dt_to_iso, iso_to_dt
 from .types import Bookmark
 
+logger = logging.getLogger("discbot.utility_storage")
+
 # Storage directories
 UTILITY_DIR = BASE_DIR / "data" / "utility"
 GUILD_UTILITY_DIR = BASE_DIR / "data" / "guilds"
 
+# Writes within this window are coalesced into one write per file
+FLUSH_DELAY_SECONDS = 0.1
+
+# Per-user stores kept in memory; beyond this the least recently used idle
+# stores (nothing pending, no lock held) are dropped.
+USER_STORE_CACHE_SIZE = 512
+
+
+def _keyed_by_id(items: List[Any]) -> Dict[str, Dict[str, Any]]:
+    """Convert a legacy list of records into an id-keyed dict (order preserved)."""
+    return {item["id"]: item for item in items if isinstance(item, dict) and "id" in item}
+
+
+def _deliver_ts(bookmark_data: Dict[str, Any]) -> Optional[float]:
+    """Epoch seconds for a bookmark's deliver_at, or None if unscheduled/unparseable."""
+    deliver_dt = iso_to_dt(bookmark_data.get("deliver_at"))
+    return deliver_dt.timestamp() if deliver_dt else None
+
+
+class _CachedJsonStore:
+    """
+    Read-through cache with debounced write-behind for a store's JSON files.
+
+    Each file is parsed once and served from memory until its (mtime_ns, size)
+    changes on disk. _store() replaces the cached contents and schedules a
+    write; flush()/close() write pending changes immediately. Every file has
+    its own lock (_lock_for), held by both its accessors and its flush.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._root_ready = False
+        self._locks: Dict[Path, asyncio.Lock] = {}
+        # Parsed file contents and the (mtime_ns, size) they reflect. Paths in
+        # _dirty are ahead of disk until the debounced flush writes them.
+        self._cache: Dict[Path, Any] = {}
+        self._cache_sig: Dict[Path, Optional[Tuple[int, int]]] = {}
+        self._dirty: Set[Path] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_delay = FLUSH_DELAY_SECONDS
+
+    async def _ensure_root(self) -> None:
+        """Create the storage directory once per store instead of on every initialize()."""
+        if not self._root_ready:
+            await asyncio.to_thread(self.root.mkdir, parents=True, exist_ok=True)
+            self._root_ready = True
+
+    def _lock_for(self, path: Path) -> asyncio.Lock:
+        lock = self._locks.get(path)
+        if lock is None:
+            lock = self._locks[path] = asyncio.Lock()
+        return lock
+
+    async def _load(self, path: Path, normalize: Callable[[Any], Any]) -> Tuple[Any, bool]:
+        """Return (data, reloaded) for path, re-reading only if the file changed on disk."""
+        if path in self._dirty:
+            return self._cache[path], False
+        sig = await stat_signature(path)
+        if path in self._cache and sig == self._cache_sig.get(path):
+            return self._cache[path], False
+        data = normalize(await read_json(path, default=None))
+        self._cache[path] = data
+        self._cache_sig[path] = sig
+        return data, True
+
+    def _store(self, path: Path, data: Any) -> None:
+        """Cache data as the contents of path and schedule it to be written."""
+        self._cache[path] = data
+        self._dirty.add(path)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(self._flush_delay)
+        try:
+            await self._flush_dirty()
+        except Exception as e:
+            # Paths stay dirty; the next mutation or flush() retries.
+            logger.error("Failed to flush %s: %s", self._describe(), e)
+
+    async def flush(self) -> None:
+        """Write any cached changes now."""
+        task = self._flush_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self._flush_dirty()
+
+    async def close(self) -> None:
+        """Flush pending writes (call on shutdown)."""
+        await self.flush()
+
+    async def _flush_dirty(self) -> None:
+        for path in list(self._dirty):
+            # The file's lock keeps its cached dict from changing mid-write
+            async with self._lock_for(path):
+                if path not in self._dirty:
+                    continue
+                await write_json_atomic(path, self._cache[path])
+                self._dirty.discard(path)
+                self._cache_sig[path] = await stat_signature(path)
+
+    def _is_idle(self) -> bool:
+        """True when dropping this store loses nothing: no pending writes, flush or lock holder."""
+        if self._dirty:
+            return False
+        if self._flush_task is not None and not self._flush_task.done():
+            return False
+        return not any(lock.locked() for lock in self._locks.values())
+
+    def _describe(self) -> str:
+        raise NotImplementedError
 
-class UtilityStore:
+
+class UtilityStore(_CachedJsonStore):
     """Per-user storage for utility features (bookmarks, notes, AFK)."""
 
     def __init__(self, user_id: int) -> None:
+        super().__init__(UTILITY_DIR / str(user_id))
         self.user_id = user_id
-        self.root = UTILITY_DIR / str(user_id)
         self.bookmarks_path = self.root / "bookmarks.json"
         self.notes_path = self.root / "notes.json"
         self.afk_path = self.root / "afk.json"
-        self._lock = asyncio.Lock()
-
-    async def initialize(self) -> None:
-        """Ensure storage directory exists."""
-        await asyncio.to_thread(self.root.mkdir, parents=True, exist_ok=True)
+        self._bookmarks_lock = self._lock_for(self.bookmarks_path)
+        self._notes_lock = self._lock_for(self.notes_path)
+        self._afk_lock = self._lock_for(self.afk_path)
+
+    def _describe(self) -> str:
+        return f"utility data for user {self.user_id}"
+
+    async def initialize(self, preload: bool = False) -> None:
+        """
+        Ensure storage directory exists.
+
+        Files are otherwise loaded on first use, so the per-message AFK checks
+        only ever read afk.json. preload=True reads bookmarks, notes and AFK
+        concurrently, for paths that go on to use all of them (data export).
+        """
+        await self._ensure_root()
+        if preload:
+            await asyncio.gather(
+                self._preload(self.bookmarks_path, self._read_bookmarks),
+                self._preload(self.notes_path, self._read_notes),
+                self._preload(self.afk_path, self._read_afk),
+            )
+
+    async def _preload(self, path: Path, read: Callable[[], Awaitable[Any]]) -> None:
+        if path not in self._cache:
+            async with self._lock_for(path):
+                await read()
 
     # ─── Bookmarks ────────────────────────────────────────────────────────────
 
-    async def _read_bookmarks(self) -> Dict[str, Any]:
-        """Read bookmarks file."""
-        default = {"bookmarks": [], "emoji_settings": {}}
-        data = await read_json(self.bookmarks_path, default=default)
+    @staticmethod
+    def _normalize_bookmarks(data: Any) -> Dict[str, Any]:
         if not isinstance(data, dict):
-            return default
-        if "bookmarks" not in data or not isinstance(data.get("bookmarks"), list):
-            data["bookmarks"] = []
+            return {"bookmarks": {}, "emoji_settings": {}}
+        if not isinstance(data.get("bookmarks"), (dict, list)):
+            data["bookmarks"] = {}
         if "emoji_settings" not in data or not isinstance(data.get("emoji_settings"), dict):
             data["emoji_settings"] = {}
         return data
 
-    async def _write_bookmarks(self, data: Dict[str, Any]) -> None:
+    async def _read_bookmarks(self) -> Dict[str, Any]:
+        """Read bookmarks file ({"bookmarks": {id: bookmark}}), migrating the old list form."""
+        data, reloaded = await self._load(self.bookmarks_path, self._normalize_bookmarks)
+        if reloaded:
+            migrated = isinstance(data["bookmarks"], list)
+            if migrated:
+                data["bookmarks"] = _keyed_by_id(data["bookmarks"])
+            # deliver_ts mirrors deliver_at so delivery polls compare floats
+            for bookmark_data in data["bookmarks"].values():
+                if "deliver_ts" not in bookmark_data:
+                    bookmark_data["deliver_ts"] = _deliver_ts(bookmark_data)
+                    migrated = True
+            if migrated:
+                self._write_bookmarks(data)
+        return data
+
+    def _write_bookmarks(self, data: Dict[str, Any]) -> None:
         """Write bookmarks file."""
-        await write_json_atomic(self.bookmarks_path, data)
+        self._store(self.bookmarks_path, data)
 
     async def add_bookmark(self, bookmark: Bookmark) -> None:
         """Add a bookmark."""
-        async with self._lock:
+        async with self._bookmarks_lock:
             data = await self._read_bookmarks()
-            data["bookmarks"].append(bookmark.to_dict())
-            await self._write_bookmarks(data)
+            bookmark_data = asdict(bookmark)
+            bookmark_data["deliver_ts"] = _deliver_ts(bookmark_data)
+            data["bookmarks"][bookmark.id] = bookmark_data
+            self._write_bookmarks(data)
 
     async def get_bookmarks(self) -> List[Bookmark]:
         """Get all bookmarks."""
-        async with self._lock:
+        async with self._bookmarks_lock:
+            data = await self._read_bookmarks()
+            return [Bookmark.from_dict(b) for b in data["bookmarks"].values()]
+
+    async def count_bookmarks(self) -> int:
+        """Number of bookmarks, without building Bookmark objects."""
+        async with self._bookmarks_lock:
             data = await self._read_bookmarks()
-            return [Bookmark.from_dict(b) for b in data["bookmarks"]]
+            return len(data["bookmarks"])
+
+    async def find_bookmark(self, id_prefix: str) -> Optional[Bookmark]:
+        """Get the first bookmark whose id starts with id_prefix (exact ids are a direct lookup)."""
+        async with self._bookmarks_lock:
+            data = await self._read_bookmarks()
+            bookmarks = data["bookmarks"]
+            bookmark_data = bookmarks.get(id_prefix)
+            if bookmark_data is None:
+                bookmark_id = next((bid for bid in bookmarks if bid.startswith(id_prefix)), None)
+                if bookmark_id is None:
+                    return None
+                bookmark_data = bookmarks[bookmark_id]
+            return Bookmark.from_dict(bookmark_data)
 
     async def get_emoji_settings(self) -> Dict[str, Any]:
         """Get bookmark emoji settings."""
-        async with self._lock:
+        async with self._bookmarks_lock:
             data = await self._read_bookmarks()
             return dict(data.get("emoji_settings", {}))
 
     async def set_emoji_setting(self, emoji_key: str, setting: Dict[str, Any]) -> None:
         """Set a bookmark emoji setting."""
-        async with self._lock:
+        async with self._bookmarks_lock:
             data = await self._read_bookmarks()
             data["emoji_settings"][emoji_key] = setting
-            await self._write_bookmarks(data)
+            self._write_bookmarks(data)
 
     async def remove_emoji_setting(self, emoji_key: str) -> bool:
         """Remove a bookmark emoji setting."""
-        async with self._lock:
+        async with self._bookmarks_lock:
             data = await self._read_bookmarks()
             if emoji_key in data["emoji_settings"]:
                 del data["emoji_settings"][emoji_key]
-                await self._write_bookmarks(data)
+                self._write_bookmarks(data)
                 return True
             return False
 
     async def remove_bookmark(self, bookmark_id: str) -> bool:
         """Remove a bookmark."""
-        async with self._lock:
+        async with self._bookmarks_lock:
             data = await self._read_bookmarks()
-            original_len = len(data["bookmarks"])
-
-            data["bookmarks"] = [
-                b for b in data["bookmarks"]
-                if b.get("id") != bookmark_id
-            ]
-
-            if len(data["bookmarks"]) < original_len:
-                await self._write_bookmarks(data)
-                return True
-            return False
+            if data["bookmarks"].pop(bookmark_id, None) is None:
+                return False
+            self._write_bookmarks(data)
+            return True
 
     async def clear_bookmarks(self) -> int:
         """Remove all bookmarks. Returns the number cleared."""
-        async with self._lock:
+        async with self._bookmarks_lock:
             data = await self._read_bookmarks()
-            bookmarks = data.get("bookmarks", [])
-            count = len(bookmarks) if isinstance(bookmarks, list) else 0
-            data["bookmarks"] = []
-            await self._write_bookmarks(data)
+            count = len(data["bookmarks"])
+            data["bookmarks"] = {}
+            self._write_bookmarks(data)
             return count
 
     async def get_pending_deliveries(self) -> List[Bookmark]:
         """Get bookmarks scheduled for delayed delivery."""
-        from .utils import iso_to_dt
-
-        async with self._lock:
+        async with self._bookmarks_lock:
             data = await self._read_bookmarks()
-            now = utcnow()
-            pending = []
-
-            for bookmark_data in data["bookmarks"]:
-                if bookmark_data.get("delivered"):
-                    continue
-
-                deliver_at = bookmark_data.get("deliver_at")
-                if not deliver_at:
-                    continue
-
-                deliver_dt = iso_to_dt(deliver_at)
-                if deliver_dt and deliver_dt <= now:
-                    pending.append(Bookmark.from_dict(bookmark_data))
-
-            return pending
+            now_ts = utcnow().timestamp()
+            return [
+                Bookmark.from_dict(b)
+                for b in data["bookmarks"].values()
+                if not b.get("delivered") and (ts := b.get("deliver_ts")) is not None and ts <= now_ts
+            ]
 
     async def mark_delivered(self, bookmark_id: str) -> bool:
         """Mark bookmark as delivered."""
-        async with self._lock:
+        async with self._bookmarks_lock:
             data = await self._read_bookmarks()
-
-            for bookmark in data["bookmarks"]:
-                if bookmark.get("id") == bookmark_id:
-                    bookmark["delivered"] = True
-                    await self._write_bookmarks(data)
-                    return True
-
-            return False
+            bookmark = data["bookmarks"].get(bookmark_id)
+            if bookmark is None:
+                return False
+            bookmark["delivered"] = True
+            self._write_bookmarks(data)
+            return True
 
     # ─── Personal Notes ───────────────────────────────────────────────────────
 
-    async def _read_notes(self) -> Dict[str, Any]:
-        """Read notes file."""
-        default = {"notes": []}
-        data = await read_json(self.notes_path, default=default)
+    @staticmethod
+    def _normalize_notes(data: Any) -> Dict[str, Any]:
         if not isinstance(data, dict):
-            return default
+            return {"notes": {}}
+        if not isinstance(data.get("notes"), (dict, list)):
+            data["notes"] = {}
+        return data
+
+    async def _read_notes(self) -> Dict[str, Any]:
+        """Read notes file ({"notes": {id: note}}), migrating the old list form."""
+        data, reloaded = await self._load(self.notes_path, self._normalize_notes)
+        if reloaded and isinstance(data["notes"], list):
+            data["notes"] = _keyed_by_id(data["notes"])
+            self._write_notes(data)
         return data
 
-    async def _write_notes(self, data: Dict[str, Any]) -> None:
+    def _write_notes(self, data: Dict[str, Any]) -> None:
         """Write notes file."""
-        await write_json_atomic(self.notes_path, data)
+        self._store(self.notes_path, data)
 
     async def add_note(self, content: str) -> Dict[str, Any]:
         """Add a personal note."""
-        import uuid
-
-        async with self._lock:
+        async with self._notes_lock:
             data = await self._read_notes()
 
             note = {
-                "id": str(uuid.uuid4()),
+                "id": secrets.token_hex(8),
                 "content": content,
                 "created_at": dt_to_iso(utcnow()),
             }
 
-            data["notes"].append(note)
-            await self._write_notes(data)
+            data["notes"][note["id"]] = note
+            self._write_notes(data)
             return note
 
     async def get_notes(self) -> List[Dict[str, Any]]:
         """Get all notes."""
-        async with self._lock:
+        async with self._notes_lock:
             data = await self._read_notes()
-            return data["notes"]
+            return list(data["notes"].values())
 
     async def update_note(self, note_id: str, content: str) -> bool:
         """Update a note by exact ID."""
-        async with self._lock:
+        async with self._notes_lock:
             data = await self._read_notes()
-            notes = data.get("notes", [])
-            if not isinstance(notes, list):
+            note = data["notes"].get(note_id)
+            if note is None:
                 return False
-            for note in notes:
-                if not isinstance(note, dict):
-                    continue
-                if note.get("id") == note_id:
-                    note["content"] = content
-                    await self._write_notes(data)
-                    return True
-            return False
+            note["content"] = content
+            self._write_notes(data)
+            return True
 
     async def remove_note(self, note_id: str) -> bool:
         """Remove a note."""
-        async with self._lock:
+        async with self._notes_lock:
             data = await self._read_notes()
-            original_len = len(data["notes"])
-
-            data["notes"] = [n for n in data["notes"] if n.get("id") != note_id]
-
-            if len(data["notes"]) < original_len:
-                await self._write_notes(data)
-                return True
-            return False
+            if data["notes"].pop(note_id, None) is None:
+                return False
+            self._write_notes(data)
+            return True
 
     # ─── AFK System ───────────────────────────────────────────────────────────
 
+    @staticmethod
+    def _normalize_afk(data: Any) -> Dict[str, Any]:
+        if not isinstance(data, dict):
+            return {
+                "active": False,
+                "message": None,
+                "set_at": None,
+                "mentions": [],
+            }
+        return data
+
     async def _read_afk(self) -> Dict[str, Any]:
         """Read AFK data."""
-        default = {
-            "active": False,
-            "message": None,
-            "set_at": None,
-            "mentions": [],
-        }
-        data = await read_json(self.afk_path, default=default)
-        if not isinstance(data, dict):
-            return default
+        data, _ = await self._load(self.afk_path, self._normalize_afk)
         return data
 
-    async def _write_afk(self, data: Dict[str, Any]) -> None:
+    def _write_afk(self, data: Dict[str, Any]) -> None:
         """Write AFK data."""
-        await write_json_atomic(self.afk_path, data)
+        self._store(self.afk_path, data)
 
     async def set_afk(self, message: Optional[str] = None) -> None:
         """Set AFK status."""
-        async with self._lock:
+        async with self._afk_lock:
             data = {
                 "active": True,
                 "message": message,
                 "set_at": dt_to_iso(utcnow()),
                 "mentions": [],
             }
-            await self._write_afk(data)
+            self._write_afk(data)
 
     async def clear_afk(self) -> Dict[str, Any]:
         """Clear AFK status and return collected mentions."""
-        async with self._lock:
+        async with self._afk_lock:
             data = await self._read_afk()
             mentions = data.get("mentions", [])
 
             # Clear AFK
-            await self._write_afk({
+            self._write_afk({
                 "active": False,
                 "message": None,
                 "set_at": None,
@@ -264,72 +421,130 @@ class UtilityStore:
 
     async def is_afk(self) -> tuple[bool, Optional[str]]:
         """Check if user is AFK."""
-        async with self._lock:
+        async with self._afk_lock:
             data = await self._read_afk()
             return data.get("active", False), data.get("message")
 
     async def add_mention(self, mention_data: Dict[str, Any]) -> None:
         """Add a mention to AFK collection."""
-        async with self._lock:
+        async with self._afk_lock:
             data = await self._read_afk()
             if data.get("active"):
                 data["mentions"].append(mention_data)
-                await self._write_afk(data)
+                self._write_afk(data)
 
 
-class GuildUtilityStore:
+class GuildUtilityStore(_CachedJsonStore):
     """Per-guild storage for utility features (aliases)."""
 
     def __init__(self, guild_id: int) -> None:
+        super().__init__(GUILD_UTILITY_DIR / str(guild_id))
         self.guild_id = guild_id
-        self.root = GUILD_UTILITY_DIR / str(guild_id)
         self.aliases_path = self.root / "aliases.json"
-        self._lock = asyncio.Lock()
+        self._aliases_lock = self._lock_for(self.aliases_path)
+
+    def _describe(self) -> str:
+        return f"aliases for guild {self.guild_id}"
 
     async def initialize(self) -> None:
         """Ensure storage directory exists."""
-        await asyncio.to_thread(self.root.mkdir, parents=True, exist_ok=True)
+        await self._ensure_root()
 
     # ─── Command Aliases ──────────────────────────────────────────────────────
 
+    @staticmethod
+    def _normalize_aliases(data: Any) -> Dict[str, Any]:
+        if not isinstance(data, dict):
+            return {"aliases": {}}
+        return data
+
     async def _read_aliases(self) -> Dict[str, Any]:
         """Read aliases file."""
-        default = {"aliases": {}}
-        data = await read_json(self.aliases_path, default=default)
-        if not isinstance(data, dict):
-            return default
+        data, _ = await self._load(self.aliases_path, self._normalize_aliases)
         return data
 
-    async def _write_aliases(self, data: Dict[str, Any]) -> None:
+    def _write_aliases(self, data: Dict[str, Any]) -> None:
         """Write aliases file."""
-        await write_json_atomic(self.aliases_path, data)
+        self._store(self.aliases_path, data)
 
     async def add_alias(self, shortcut: str, full_command: str) -> None:
         """Add a command alias."""
-        async with self._lock:
+        async with self._aliases_lock:
             data = await self._read_aliases()
             data["aliases"][shortcut] = full_command
-            await self._write_aliases(data)
+            self._write_aliases(data)
 
     async def remove_alias(self, shortcut: str) -> bool:
         """Remove an alias."""
-        async with self._lock:
+        async with self._aliases_lock:
             data = await self._read_aliases()
 
             if shortcut in data["aliases"]:
                 del data["aliases"][shortcut]
-                await self._write_aliases(data)
+                self._write_aliases(data)
                 return True
             return False
 
     async def get_alias(self, shortcut: str) -> Optional[str]:
         """Get alias expansion."""
-        async with self._lock:
+        async with self._aliases_lock:
             data = await self._read_aliases()
             return data["aliases"].get(shortcut)
 
     async def get_all_aliases(self) -> Dict[str, str]:
         """Get all aliases."""
-        async with self._lock:
+        async with self._aliases_lock:
             data = await self._read_aliases()
-            return data["aliases"]
+            return dict(data["aliases"])
+
+
+# LRU of per-user stores (on_message touches one per speaker/mention, so it
+# must stay bounded); guild stores are bounded by the guild count.
+_user_stores: "OrderedDict[int, UtilityStore]" = OrderedDict()
+_guild_stores: Dict[int, GuildUtilityStore] = {}
+
+
+def get_utility_store(user_id: int) -> UtilityStore:
+    """Get the process-wide UtilityStore for a user, so its cache and lock are shared."""
+    store = _user_stores.get(user_id)
+    if store is None:
+        store = _user_stores[user_id] = UtilityStore(user_id)
+        _evict_idle_user_stores()
+    else:
+        _user_stores.move_to_end(user_id)
+    return store
+
+
+def _evict_idle_user_stores() -> None:
+    """Drop least recently used idle stores until the registry fits USER_STORE_CACHE_SIZE."""
+    excess = len(_user_stores) - USER_STORE_CACHE_SIZE
+    if excess <= 0:
+        return
+    # Busy stores stay put (they become idle after their debounced flush and
+    # are picked up by a later call); the newest entry is never a candidate.
+    newest = next(reversed(_user_stores))
+    victims: List[int] = []
+    for user_id, store in _user_stores.items():
+        if len(victims) >= excess:
+            break
+        if user_id != newest and store._is_idle():
+            victims.append(user_id)
+    for user_id in victims:
+        del _user_stores[user_id]
+
+
+def get_guild_utility_store(guild_id: int) -> GuildUtilityStore:
+    """Get the process-wide GuildUtilityStore for a guild, so its cache and lock are shared."""
+    store = _guild_stores.get(guild_id)
+    if store is None:
+        store = _guild_stores[guild_id] = GuildUtilityStore(guild_id)
+    return store
+
+
+async def close_all() -> None:
+    """Flush pending writes for every utility store (call on shutdown)."""
+    for store in [*_user_stores.values(), *_guild_stores.values()]:
+        try:
+            await store.close()
+        except Exception as e:
+            logger.error("Failed to flush %s: %s", store._describe(), e)
@@ -8,8 +8,11 @@ from __future__ import annotations
 import datetime as dt
 import hashlib
 import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable, Optional, Tuple
+from typing import Any, Iterable, Iterator, Optional, Tuple
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 UTC = dt.timezone.utc
@@ -18,7 +21,7 @@ CONTROL_RE = re.compile(r"[\x00-\x1f\x7f]")
 SHA256_RE = re.compile(r"^[0-9a-fA-F]{64}$")
 
 MESSAGE_LINK_RE = re.compile(
-    r"https://(?:discord\\.com|discordapp\\.com)/channels/(\\d+)/(\\d+)/(\\d+)",
+    r"https://(?:discord\.com|discordapp\.com)/channels/(\d+)/(\d+)/(\d+)",
     re.IGNORECASE,
 )
 
@@ -28,12 +31,62 @@ def utcnow() -> dt.datetime:
 
 
 def dt_to_iso(value: Optional[dt.datetime]) -> Optional[str]:
+    # Always "YYYY-MM-DDTHH:MM:SSZ": fixed width, so string order is time order.
     if value is None:
         return None
     value = value.astimezone(UTC).replace(microsecond=0)
     return value.isoformat().replace("+00:00", "Z")
 
 
+_scoped_now_iso: ContextVar[Optional[str]] = ContextVar("scoped_now_iso", default=None)
+
+
+@contextmanager
+def timestamp_scope() -> Iterator[str]:
+    """
+    Pin dt_to_iso_now() to a single value for the duration of the block.
+
+    Scopes are per task/context; nested scopes reuse the outer timestamp.
+    """
+    current = _scoped_now_iso.get()
+    if current is not None:
+        yield current
+        return
+    now_iso = dt_to_iso(utcnow())
+    token = _scoped_now_iso.set(now_iso)
+    try:
+        yield now_iso
+    finally:
+        _scoped_now_iso.reset(token)
+
+
+def dt_to_iso_now() -> str:
+    """dt_to_iso(utcnow()), or the pinned value inside a timestamp_scope()."""
+    current = _scoped_now_iso.get()
+    if current is not None:
+        return current
+    return dt_to_iso(utcnow())
+
+
+def iso_sort_key(value: Any) -> Optional[str]:
+    """
+    Return value in dt_to_iso form for string comparisons, or None if unparseable.
+
+    Strings already in that form are returned as-is without parsing.
+    """
+    if not isinstance(value, str):
+        return None
+    if len(value) == 20 and value[19] == "Z" and value[10] == "T":
+        return value
+    return _normalize_iso(value)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_iso(value: str) -> Optional[str]:
+    # Legacy/foreign formats are re-seen on every index rebuild; parse each once.
+    return dt_to_iso(iso_to_dt(value))
+
+
 def iso_to_dt(value: Optional[str]) -> Optional[dt.datetime]:
     if not value:
         return None
@@ -96,6 +149,12 @@ def is_safe_relative_path(path_str: str) -> bool:
 
 
 def build_cdn_regex(allowed_domains: Iterable[str]) -> re.Pattern[str]:
+    return _compile_cdn_regex(tuple(allowed_domains))
+
+
+@lru_cache(maxsize=256)
+def _compile_cdn_regex(allowed_domains: Tuple[str, ...]) -> re.Pattern[str]:
+    # Guilds mostly share the default domain list; compile each distinct list once.
     domains = [re.escape(domain) for domain in allowed_domains]
     if not domains:
         domains = ["cdn\\.discordapp\\.com", "media\\.discordapp\\.net"]
@@ -104,7 +163,8 @@ def build_cdn_regex(allowed_domains: Iterable[str]) -> re.Pattern[str]:
 
 
 def extract_first_cdn_url(content: str, cdn_regex: re.Pattern[str]) -> Optional[str]:
-    if not content:
+    # Cheap substring test first: most messages contain no URL at all.
+    if not content or "://" not in content:
         return None
     match = cdn_regex.search(content)
     if not match:
@@ -113,46 +173,63 @@ def extract_first_cdn_url(content: str, cdn_regex: re.Pattern[str]) -> Optional[
 
 
 def extract_first_message_link(content: str, guild_id: int) -> Optional[Tuple[str, str, str]]:
-    if not content:
+    # MESSAGE_LINK_RE is case-insensitive, so the pre-filter must be too.
+    if not content or "/channels/" not in content.lower():
         return None
+    guild_key = str(guild_id)
     for match in MESSAGE_LINK_RE.finditer(content):
-        if int(match.group(1)) == guild_id:
-            return match.group(1), match.group(2), match.group(3)
+        if match.group(1) == guild_key:
+            return match.groups()
     return None
 
 
+# Image signatures grouped by first byte, so a check is one dict lookup plus
+# one startswith. WEBP (RIFF....WEBP) is handled separately.
+_MAGIC_BY_FIRST_BYTE: dict[int, Tuple[bytes, ...]] = {
+    0x89: (b"\x89PNG\r\n\x1a\n",),  # PNG
+    0xFF: (b"\xFF\xD8\xFF",),  # JPEG
+    0x47: (b"GIF87a", b"GIF89a"),  # GIF
+    0x42: (b"BM",),  # BMP
+    0x49: (b"II*\x00",),  # TIFF (little-endian)
+    0x4D: (b"MM\x00*",),  # TIFF (big-endian)
+    0x00: (b"\x00\x00\x01\x00",),  # ICO
+}
+
+
 def magic_bytes_valid(data: bytes) -> bool:
     if len(data) < 12:
         return False
     # Allow optional UTF-8 BOM before PNG signature.
     if data.startswith(b"\xEF\xBB\xBF"):
         data = data[3:]
-    
-    # Check signatures at correct offsets (use startswith to avoid false positives)
-    if data.startswith(b"\x89PNG\r\n\x1a\n"):  # PNG
-        return True
-    if data.startswith(b"\xFF\xD8\xFF"):  # JPEG
-        return True
-    if data.startswith(b"GIF87a") or data.startswith(b"GIF89a"):  # GIF
-        return True
-    if data.startswith(b"BM"):  # BMP
-        return True
-    if data.startswith(b"II*\x00") or data.startswith(b"MM\x00*"):  # TIFF
-        return True
-    if data.startswith(b"\x00\x00\x01\x00"):  # ICO
-        return True
-    
-    # WEBP: RIFF header at start, WEBP signature at offset 8
-    if len(data) >= 12 and data.startswith(b"RIFF") and data[8:12] == b"WEBP":
-        return True
-    
-    return False
+
+    first = data[0]
+    if first == 0x52:
+        # WEBP: RIFF header at start, WEBP signature at offset 8
+        return data.startswith(b"RIFF") and data[8:12] == b"WEBP"
+    signatures = _MAGIC_BY_FIRST_BYTE.get(first)
+    return signatures is not None and data.startswith(signatures)
 
 
 def hash_bytes(data: bytes) -> str:
+    # Hash lists are published as SHA-256 digests, so the algorithm is fixed.
+    # hashlib's OpenSSL backend already uses SHA-NI/ARMv8 SHA instructions when present.
     return hashlib.sha256(data).hexdigest()
 
 
+def new_hasher() -> "hashlib._Hash":
+    """Incremental counterpart of hash_bytes for streamed payloads."""
+    return hashlib.sha256()
+
+
+def hash_backend() -> str:
+    """Describe the SHA-256 implementation behind hash_bytes (for startup logs)."""
+    if getattr(hashlib.sha256, "__name__", "").startswith("openssl_"):
+        import ssl
+        return f"OpenSSL ({ssl.OPENSSL_VERSION})"
+    return "builtin"
+
+
 # ─── Enhanced Utility Functions ───────────────────────────────────────────
 
 
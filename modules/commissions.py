@@ -8,6 +8,7 @@ from __future__ import annotations
 import logging
 import json
 import io
+from dataclasses import asdict
 from typing import Optional
 
 import discord
@@ -937,7 +938,7 @@ async def _handle_export(message: discord.Message, parts: list[str]) -> None:
         await message.reply(f" No commission found with ID starting with `{commission_id}`")
         return
 
-    payload = commission.to_dict()
+    payload = asdict(commission)
     payload["_export"] = {"source": "history" if in_history else "active"}
     data = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
     file = discord.File(fp=io.BytesIO(data), filename=f"commission_{commission.id[:8]}.json")
@@ -12,6 +12,8 @@ import discord
 
 from core.help_system import help_system
 from core.permissions import can_use_command, is_module_enabled
+from core.types import UserReport
+from core.utils import timestamp_scope
 from services.report_service import report_service
 
 logger = logging.getLogger("discbot.reports")
@@ -66,37 +68,39 @@ async def handle_report_command(message: discord.Message, bot: discord.Client) -
     if command != "report":
         return False
 
-    if subcommand == "categories":
-        await _handle_categories(message, parts)
-        return True
-
-    # Handle user report submission (doesn't require mod permissions)
-    if subcommand in ("submit", "@") or (message.mentions and len(parts) >= 3):
-        await _handle_submit(message, parts)
-        return True
-
-    # Route to handlers (all require mod permissions)
-    if subcommand == "list":
-        await _handle_list(message, parts)
-        return True
-    elif subcommand == "view":
-        await _handle_view(message, parts)
-        return True
-    elif subcommand == "assign":
-        await _handle_assign(message, parts)
-        return True
-    elif subcommand == "resolve":
-        await _handle_resolve(message, parts)
-        return True
-    elif subcommand == "dismiss":
-        await _handle_dismiss(message, parts)
-        return True
-    elif subcommand == "stats":
-        await _handle_stats(message)
-        return True
-    elif subcommand == "help":
-        await _handle_help(message)
-        return True
+    # One timestamp for everything a single command writes.
+    with timestamp_scope():
+        if subcommand == "categories":
+            await _handle_categories(message, parts)
+            return True
+
+        # Handle user report submission (doesn't require mod permissions)
+        if subcommand in ("submit", "@") or (message.mentions and len(parts) >= 3):
+            await _handle_submit(message, parts)
+            return True
+
+        # Route to handlers (all require mod permissions)
+        if subcommand == "list":
+            await _handle_list(message, parts)
+            return True
+        elif subcommand == "view":
+            await _handle_view(message, parts)
+            return True
+        elif subcommand == "assign":
+            await _handle_assign(message, parts)
+            return True
+        elif subcommand == "resolve":
+            await _handle_resolve(message, parts)
+            return True
+        elif subcommand == "dismiss":
+            await _handle_dismiss(message, parts)
+            return True
+        elif subcommand == "stats":
+            await _handle_stats(message)
+            return True
+        elif subcommand == "help":
+            await _handle_help(message)
+            return True
 
     return False
 
@@ -232,9 +236,9 @@ async def _handle_list(message: discord.Message, parts: list[str]) -> None:
 
     guild_id = message.guild.id
 
-    reports = await report_service.get_reports(guild_id, status=status_filter)
+    report_dicts = await report_service.get_report_dicts(guild_id, status=status_filter)
 
-    if not reports:
+    if not report_dicts:
         msg = " No reports found"
         if status_filter:
             msg += f" with status '{status_filter}'"
@@ -248,13 +252,13 @@ async def _handle_list(message: discord.Message, parts: list[str]) -> None:
 
     embed = discord.Embed(
         title=title,
-        description=f"Total: {len(reports)}",
+        description=f"Total: {len(report_dicts)}",
         color=discord.Color.orange(),
         timestamp=discord.utils.utcnow(),
     )
 
     # Show first 10 reports
-    for report in reports[:10]:
+    for report in map(UserReport.from_dict, report_dicts[:10]):
         status_emoji = {
             "open": "",
             "assigned": "",
@@ -305,15 +309,12 @@ async def _handle_view(message: discord.Message, parts: list[str]) -> None:
     guild_id = message.guild.id
 
     # Find report by partial ID
-    reports = await report_service.get_reports(guild_id)
-    matching = [r for r in reports if r.id.startswith(report_id)]
+    report = await report_service.find_report(guild_id, report_id)
 
-    if not matching:
+    if report is None:
         await message.reply(f" No report found with ID starting with `{report_id}`")
         return
 
-    report = matching[0]
-
     # Build detailed embed
     embed = discord.Embed(
         title=f"Report Details - {report.id[:8]}",
@@ -420,15 +421,12 @@ async def _handle_assign(message: discord.Message, parts: list[str]) -> None:
     guild_id = message.guild.id
 
     # Find report
-    reports = await report_service.get_reports(guild_id)
-    matching = [r for r in reports if r.id.startswith(report_id)]
+    report = await report_service.find_report(guild_id, report_id)
 
-    if not matching:
+    if report is None:
         await message.reply(f" No report found with ID starting with `{report_id}`")
         return
 
-    report = matching[0]
-
     success = await report_service.assign_report(guild_id, report.id, mod.id)
 
     if success:
@@ -455,15 +453,12 @@ async def _handle_resolve(message: discord.Message, parts: list[str]) -> None:
     guild_id = message.guild.id
 
     # Find report
-    reports = await report_service.get_reports(guild_id)
-    matching = [r for r in reports if r.id.startswith(report_id)]
+    report = await report_service.find_report(guild_id, report_id)
 
-    if not matching:
+    if report is None:
         await message.reply(f" No report found with ID starting with `{report_id}`")
         return
 
-    report = matching[0]
-
     success = await report_service.resolve_report(
         guild_id,
         report.id,
@@ -495,15 +490,12 @@ async def _handle_dismiss(message: discord.Message, parts: list[str]) -> None:
     guild_id = message.guild.id
 
     # Find report
-    reports = await report_service.get_reports(guild_id)
-    matching = [r for r in reports if r.id.startswith(report_id)]
+    report = await report_service.find_report(guild_id, report_id)
 
-    if not matching:
+    if report is None:
         await message.reply(f" No report found with ID starting with `{report_id}`")
         return
 
-    report = matching[0]
-
     success = await report_service.dismiss_report(guild_id, report.id, reason)
 
     if success:
@@ -13,8 +13,15 @@ import discord
 
 from core.help_system import help_system
 from core.permissions import is_module_enabled
-from core.roles_storage import RolesStore
-from core.utils import dt_to_iso, extract_first_message_link, iso_to_dt, parse_deadline, parse_duration_extended
+from core.roles_storage import get_roles_store
+from core.utils import (
+    dt_to_iso,
+    extract_first_message_link,
+    iso_to_dt,
+    parse_deadline,
+    parse_duration_extended,
+    timestamp_scope,
+)
 
 logger = logging.getLogger("discbot.roles")
 
@@ -153,22 +160,24 @@ async def handle_roles_command(message: discord.Message, bot: discord.Client) ->
                 await message.reply(" Help information not available.")
             return True
 
-    # Route to handlers
-    if command == "temprole":
-        await _handle_temprole(message, parts, bot)
-        return True
-    elif command == "requestrole":
-        await _handle_requestrole(message, parts)
-        return True
-    elif command == "approverole":
-        await _handle_approverole(message, parts, bot)
-        return True
-    elif command == "rolebundle":
-        await _handle_rolebundle(message, parts, bot)
-        return True
-    elif command == "reactionrole":
-        await _handle_reactionrole(message, parts, bot)
-        return True
+    # One timestamp for everything a single command writes.
+    with timestamp_scope():
+        # Route to handlers
+        if command == "temprole":
+            await _handle_temprole(message, parts, bot)
+            return True
+        elif command == "requestrole":
+            await _handle_requestrole(message, parts)
+            return True
+        elif command == "approverole":
+            await _handle_approverole(message, parts, bot)
+            return True
+        elif command == "rolebundle":
+            await _handle_rolebundle(message, parts, bot)
+            return True
+        elif command == "reactionrole":
+            await _handle_reactionrole(message, parts, bot)
+            return True
 
     return False
 
@@ -224,7 +233,7 @@ async def _handle_temprole_add(
         return
 
     guild_id = message.guild.id
-    store = RolesStore(guild_id)
+    store = get_roles_store(guild_id)
     await store.initialize()
 
     # Add role to user
@@ -252,7 +261,7 @@ async def _handle_temprole_add(
 async def _handle_temprole_list(message: discord.Message) -> None:
     """List temporary roles."""
     guild_id = message.guild.id
-    store = RolesStore(guild_id)
+    store = get_roles_store(guild_id)
     await store.initialize()
 
     temp_roles = await store.get_temp_roles()
@@ -296,7 +305,7 @@ async def _handle_temprole_remove(
         return
 
     temp_id = parts[2].strip()
-    store = RolesStore(message.guild.id)
+    store = get_roles_store(message.guild.id)
     await store.initialize()
     removed = await store.remove_temp_role_by_id(temp_id)
     if not removed:
@@ -338,7 +347,7 @@ async def _handle_temprole_extend(message: discord.Message, parts: list[str]) ->
         await message.reply(" Invalid duration. Try: `3d`, `2w`, `1mo`")
         return
 
-    store = RolesStore(message.guild.id)
+    store = get_roles_store(message.guild.id)
     await store.initialize()
     tr = await store.get_temp_role(temp_id)
     if not tr:
@@ -379,7 +388,7 @@ async def _handle_requestrole(message: discord.Message, parts: list[str]) -> Non
     reason = " ".join(parts[2:]).strip() if len(parts) > 2 else ""
 
     guild_id = message.guild.id
-    store = RolesStore(guild_id)
+    store = get_roles_store(guild_id)
     await store.initialize()
 
     request_id = str(uuid.uuid4())
@@ -402,7 +411,7 @@ async def _handle_requestrole_list(message: discord.Message) -> None:
         await message.reply(" You need Manage Roles permission to list role requests.")
         return
 
-    store = RolesStore(message.guild.id)
+    store = get_roles_store(message.guild.id)
     await store.initialize()
     pending = await store.get_pending_requests()
     if not pending:
@@ -451,7 +460,7 @@ async def _handle_approverole(
         return
 
     guild_id = message.guild.id
-    store = RolesStore(guild_id)
+    store = get_roles_store(guild_id)
     await store.initialize()
 
     # Update request status
@@ -529,7 +538,7 @@ async def _handle_rolebundle_create(message: discord.Message, parts: list[str])
     role_ids = [r.id for r in message.role_mentions]
 
     guild_id = message.guild.id
-    store = RolesStore(guild_id)
+    store = get_roles_store(guild_id)
     await store.initialize()
 
     bundle_id = str(uuid.uuid4())
@@ -562,7 +571,7 @@ async def _handle_rolebundle_give(
     bundle_name = parts[3]
 
     guild_id = message.guild.id
-    store = RolesStore(guild_id)
+    store = get_roles_store(guild_id)
     await store.initialize()
 
     bundle = await store.get_bundle(bundle_name)
@@ -592,7 +601,7 @@ async def _handle_rolebundle_remove(message: discord.Message, parts: list[str])
         return
 
     target = parts[2]
-    store = RolesStore(message.guild.id)
+    store = get_roles_store(message.guild.id)
     await store.initialize()
     removed = await store.remove_bundle(target)
     if not removed:
@@ -604,7 +613,7 @@ async def _handle_rolebundle_remove(message: discord.Message, parts: list[str])
 async def _handle_rolebundle_list(message: discord.Message) -> None:
     """List role bundles."""
     guild_id = message.guild.id
-    store = RolesStore(guild_id)
+    store = get_roles_store(guild_id)
     await store.initialize()
 
     bundles = await store.get_all_bundles()
@@ -694,7 +703,7 @@ async def _handle_reactionrole_add(message: discord.Message, parts: list[str]) -
     emoji = parts[3]
     role = message.role_mentions[0]
 
-    store = RolesStore(message.guild.id)
+    store = get_roles_store(message.guild.id)
     await store.initialize()
     await store.add_reaction_role(message_id, emoji, role.id)
     await message.reply(f" Reaction role added: {emoji} → {role.mention} (message `{message_id}`)")
@@ -712,7 +721,7 @@ async def _handle_reactionrole_remove(message: discord.Message, parts: list[str]
         return
 
     emoji = parts[3]
-    store = RolesStore(message.guild.id)
+    store = get_roles_store(message.guild.id)
     await store.initialize()
     ok = await store.remove_reaction_role(message_id, emoji)
     if ok:
@@ -732,7 +741,7 @@ async def _handle_reactionrole_list(message: discord.Message, parts: list[str])
         await message.reply(" Invalid message link or message ID.")
         return
 
-    store = RolesStore(message.guild.id)
+    store = get_roles_store(message.guild.id)
     await store.initialize()
     mappings = await store.get_all_reaction_roles(message_id)
     if not mappings:
@@ -777,7 +786,7 @@ async def handle_reaction_role_event(
 
     emoji_key = str(payload.emoji)
 
-    store = RolesStore(guild.id)
+    store = get_roles_store(guild.id)
     await store.initialize()
     role_id = await store.get_reaction_role(payload.message_id, emoji_key)
     if not role_id:
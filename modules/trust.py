@@ -13,7 +13,7 @@ from typing import Optional
 import discord
 
 from core.help_system import help_system
-from core.trust_storage import TrustStore
+from core.trust_storage import get_trust_store
 from core.permissions import can_use_command, is_module_enabled
 from core.types import Vouch
 from core.utils import utcnow, dt_to_iso, iso_to_dt
@@ -192,7 +192,7 @@ async def _handle_trust_history(
             return
 
     try:
-        store = TrustStore(message.guild.id)
+        store = get_trust_store(message.guild.id)
         await store.initialize()
 
         events = await store.get_events(target_user.id)
@@ -264,7 +264,7 @@ async def _handle_vouch_create(message: discord.Message, parts: list[str]) -> No
             return
 
         # Check cooldown
-        store = TrustStore(message.guild.id)
+        store = get_trust_store(message.guild.id)
         await store.initialize()
 
         cooldown_expires = await store.check_vouch_cooldown(message.author.id, target_user.id)
@@ -337,7 +337,7 @@ async def _handle_vouch_list(message: discord.Message, parts: list[str]) -> None
         target_user = message.mentions[0]
 
     try:
-        store = TrustStore(message.guild.id)
+        store = get_trust_store(message.guild.id)
         await store.initialize()
 
         vouches = await store.get_vouches_for(target_user.id)
@@ -385,7 +385,7 @@ async def _handle_vouch_given(message: discord.Message, parts: list[str]) -> Non
         target_user = message.mentions[0]
 
     try:
-        store = TrustStore(message.guild.id)
+        store = get_trust_store(message.guild.id)
         await store.initialize()
 
         vouches = await store.get_vouches_given(target_user.id)
@@ -443,7 +443,7 @@ async def _handle_vouch_verify(
     vouch_id = parts[2]
 
     try:
-        store = TrustStore(message.guild.id)
+        store = get_trust_store(message.guild.id)
         await store.initialize()
 
         vouch = await store.get_vouch(vouch_id)
@@ -494,7 +494,7 @@ async def _handle_vouch_remove(message: discord.Message, parts: list[str]) -> No
     vouch_id = parts[2]
 
     try:
-        store = TrustStore(message.guild.id)
+        store = get_trust_store(message.guild.id)
         await store.initialize()
 
         success = await store.remove_vouch(vouch_id)
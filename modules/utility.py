@@ -6,17 +6,17 @@ Provides utility commands for user convenience and productivity.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-import uuid
+import secrets
 from datetime import timedelta
 from typing import Optional
 
 import discord
 
 from core.help_system import help_system
+from core.io_utils import dumps_json_document
 from core.permissions import can_use_command, is_module_enabled
-from core.utility_storage import UtilityStore, GuildUtilityStore
+from core.utility_storage import UtilityStore, get_guild_utility_store, get_utility_store
 from core.types import Bookmark
 from core.utils import utcnow, dt_to_iso, iso_to_dt, parse_duration_extended
 
@@ -230,7 +230,7 @@ async def _handle_bookmark_add(
     note: Optional[str],
 ) -> None:
     """Add a bookmark."""
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
 
     # If no link provided, bookmark the message being replied to
@@ -243,7 +243,7 @@ async def _handle_bookmark_add(
         return
 
     bookmark = Bookmark(
-        id=str(uuid.uuid4()),
+        id=secrets.token_hex(8),
         user_id=message.author.id,
         guild_id=message.guild.id,
         channel_id=message.channel.id,
@@ -260,7 +260,7 @@ async def _handle_bookmark_add(
 
 async def _handle_bookmark_list(message: discord.Message) -> None:
     """List bookmarks."""
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
 
     bookmarks = await store.get_bookmarks()
@@ -297,18 +297,16 @@ async def _handle_bookmark_remove(message: discord.Message, parts: list[str]) ->
 
     bookmark_id = parts[2]
 
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
 
     # Find bookmark by partial ID
-    bookmarks = await store.get_bookmarks()
-    matching = [b for b in bookmarks if b.id.startswith(bookmark_id)]
+    bookmark = await store.find_bookmark(bookmark_id)
 
-    if not matching:
+    if bookmark is None:
         await message.reply(f" No bookmark found with ID starting with `{bookmark_id}`")
         return
 
-    bookmark = matching[0]
     success = await store.remove_bookmark(bookmark.id)
 
     if success:
@@ -322,14 +320,12 @@ async def _handle_bookmark_view(message: discord.Message, parts: list[str]) -> N
         await message.reply(" Usage: `bookmark view <id>`")
         return
     bookmark_id = parts[2].strip()
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
-    bookmarks = await store.get_bookmarks()
-    matching = [b for b in bookmarks if b.id.startswith(bookmark_id)]
-    if not matching:
+    b = await store.find_bookmark(bookmark_id)
+    if b is None:
         await message.reply(f" No bookmark found with ID starting with `{bookmark_id}`")
         return
-    b = matching[0]
     link = f"https://discord.com/channels/{b.guild_id}/{b.channel_id}/{b.message_id}" if b.guild_id and b.channel_id and b.message_id else ""
     embed = discord.Embed(
         title=f"Bookmark `{b.id[:8]}`",
@@ -348,7 +344,7 @@ async def _handle_bookmark_view(message: discord.Message, parts: list[str]) -> N
 
 async def _handle_bookmark_clear(message: discord.Message) -> None:
     """Clear all bookmarks."""
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
     count = await store.clear_bookmarks()
     await message.reply(f" Cleared {count} bookmark(s).")
@@ -376,11 +372,11 @@ async def _handle_bookmark_delay(message: discord.Message, parts: list[str], bot
 
     deliver_at = utcnow() + duration
 
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
 
     bookmark = Bookmark(
-        id=str(uuid.uuid4()),
+        id=secrets.token_hex(8),
         user_id=message.author.id,
         guild_id=message.guild.id,
         channel_id=message.channel.id,
@@ -451,7 +447,7 @@ async def _handle_bookmark_emoji_set(message: discord.Message, args: str) -> Non
         await message.reply(" Delivery method must be `dm` or `channel`.")
         return
 
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
     await store.set_emoji_setting(
         emoji_key,
@@ -480,7 +476,7 @@ async def _handle_bookmark_emoji_delay(message: discord.Message, args: str) -> N
         await message.reply(" Invalid time format. Try: `3d`, `2w`, `1mo`")
         return
 
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
     await store.set_emoji_setting(
         emoji_key,
@@ -494,7 +490,7 @@ async def _handle_bookmark_emoji_delay(message: discord.Message, args: str) -> N
 
 async def _handle_bookmark_emoji_remove(message: discord.Message, emoji_key: str) -> None:
     """Remove reaction emoji bookmark."""
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
     removed = await store.remove_emoji_setting(emoji_key)
     if removed:
@@ -505,7 +501,7 @@ async def _handle_bookmark_emoji_remove(message: discord.Message, emoji_key: str
 
 async def _handle_bookmark_emoji_list(message: discord.Message) -> None:
     """List reaction emoji bookmark settings."""
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
     settings = await store.get_emoji_settings()
     if not settings:
@@ -537,7 +533,7 @@ async def handle_bookmark_reaction(
     if not await is_module_enabled(payload.guild_id, MODULE_NAME):
         return
 
-    store = UtilityStore(payload.user_id)
+    store = get_utility_store(payload.user_id)
     await store.initialize()
     settings = await store.get_emoji_settings()
     emoji_key = str(payload.emoji)
@@ -555,7 +551,7 @@ async def handle_bookmark_reaction(
         deliver_at = dt_to_iso(now + timedelta(seconds=delay_seconds))
 
     bookmark = Bookmark(
-        id=str(uuid.uuid4()),
+        id=secrets.token_hex(8),
         user_id=payload.user_id,
         guild_id=payload.guild_id,
         channel_id=payload.channel_id,
@@ -699,7 +695,7 @@ def _schedule_delayed_bookmark(
             if delay > 0:
                 await asyncio.sleep(delay)
             delivered, permanent_fail = await _deliver_bookmark_now(bot, bookmark)
-            user_store = store or UtilityStore(bookmark.user_id)
+            user_store = store or get_utility_store(bookmark.user_id)
             await user_store.initialize()
             if delivered or permanent_fail:
                 await user_store.remove_bookmark(bookmark.id)
@@ -708,7 +704,7 @@ def _schedule_delayed_bookmark(
         except Exception:
             # Best effort cleanup so stuck deliveries don't churn CPU.
             try:
-                user_store = store or UtilityStore(bookmark.user_id)
+                user_store = store or get_utility_store(bookmark.user_id)
                 await user_store.initialize()
                 await user_store.remove_bookmark(bookmark.id)
             except Exception:
@@ -741,7 +737,7 @@ async def schedule_existing_delayed_bookmarks(bot: discord.Client) -> int:
         except ValueError:
             continue
 
-        store = UtilityStore(user_id)
+        store = get_utility_store(user_id)
         await store.initialize()
         bookmarks = await store.get_bookmarks()
         for bookmark in bookmarks:
@@ -772,7 +768,7 @@ async def _handle_afk(message: discord.Message, parts: list[str]) -> None:
     # Status lookup (self or mentioned user)
     if len(parts) > 1 and parts[1].lower() == "status":
         target = message.mentions[0] if message.mentions else message.author
-        target_store = UtilityStore(target.id)
+        target_store = get_utility_store(target.id)
         await target_store.initialize()
         is_afk, afk_message = await target_store.is_afk()
         if not is_afk:
@@ -784,7 +780,7 @@ async def _handle_afk(message: discord.Message, parts: list[str]) -> None:
         await message.reply(msg)
         return
 
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
 
     if len(parts) > 1 and parts[1].lower() == "off":
@@ -869,7 +865,7 @@ async def _handle_note_add(message: discord.Message, parts: list[str]) -> None:
 
     content = parts[2]
 
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
 
     note = await store.add_note(content)
@@ -879,7 +875,7 @@ async def _handle_note_add(message: discord.Message, parts: list[str]) -> None:
 
 async def _handle_notes_list(message: discord.Message) -> None:
     """List personal notes."""
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
 
     notes = await store.get_notes()
@@ -914,7 +910,7 @@ async def _handle_note_remove(message: discord.Message, parts: list[str]) -> Non
 
     note_id = parts[2]
 
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
 
     # Find note by partial ID
@@ -940,7 +936,7 @@ async def _handle_note_view(message: discord.Message, parts: list[str]) -> None:
         await message.reply(" Usage: `note view <id>`")
         return
     note_id = parts[2].strip()
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
     notes = await store.get_notes()
     matching = [n for n in notes if isinstance(n, dict) and str(n.get("id", "")).startswith(note_id)]
@@ -973,7 +969,7 @@ async def _handle_note_edit(message: discord.Message, parts: list[str]) -> None:
         await message.reply(" Please provide new text.")
         return
 
-    store = UtilityStore(message.author.id)
+    store = get_utility_store(message.author.id)
     await store.initialize()
     notes = await store.get_notes()
     matching = [n for n in notes if isinstance(n, dict) and str(n.get("id", "")).startswith(note_id_prefix)]
@@ -1028,7 +1024,7 @@ async def _handle_alias_add(message: discord.Message, parts: list[str]) -> None:
     shortcut = args[0]
     full_command = args[1]
 
-    store = GuildUtilityStore(message.guild.id)
+    store = get_guild_utility_store(message.guild.id)
     await store.initialize()
 
     await store.add_alias(shortcut, full_command)
@@ -1049,7 +1045,7 @@ async def _handle_alias_remove(message: discord.Message, parts: list[str]) -> No
 
     shortcut = parts[2]
 
-    store = GuildUtilityStore(message.guild.id)
+    store = get_guild_utility_store(message.guild.id)
     await store.initialize()
 
     success = await store.remove_alias(shortcut)
@@ -1062,7 +1058,7 @@ async def _handle_alias_remove(message: discord.Message, parts: list[str]) -> No
 
 async def _handle_alias_list(message: discord.Message) -> None:
     """List all aliases."""
-    store = GuildUtilityStore(message.guild.id)
+    store = get_guild_utility_store(message.guild.id)
     await store.initialize()
 
     aliases = await store.get_all_aliases()
@@ -1116,23 +1112,23 @@ async def _handle_export(message: discord.Message) -> None:
     # Portfolio
     try:
         portfolio = await portfolio_service.get_portfolio(user_id)
-        export_data["data"]["portfolio"] = [e.to_dict() for e in portfolio]
+        export_data["data"]["portfolio"] = portfolio
     except Exception:
         pass
 
     # Commissions
     try:
         commissions = await commission_service.get_active_commissions(user_id, guild_id)
-        export_data["data"]["commissions"] = [c.to_dict() for c in commissions]
+        export_data["data"]["commissions"] = commissions
     except Exception:
         pass
 
     # Bookmarks
     try:
-        store = UtilityStore(user_id)
-        await store.initialize()
+        store = get_utility_store(user_id)
+        await store.initialize(preload=True)
         bookmarks = await store.get_bookmarks()
-        export_data["data"]["bookmarks"] = [b.to_dict() for b in bookmarks]
+        export_data["data"]["bookmarks"] = bookmarks
     except Exception:
         pass
 
@@ -1143,13 +1139,13 @@ async def _handle_export(message: discord.Message) -> None:
     except Exception:
         pass
 
-    # Convert to JSON
-    json_data = json.dumps(export_data, indent=2)
+    # Records serialize directly; no per-item to_dict() needed
+    json_data = dumps_json_document(export_data)
 
     # Send as file
     import io
     file = discord.File(
-        fp=io.BytesIO(json_data.encode()),
+        fp=io.BytesIO(json_data),
         filename=f"user_data_{user_id}.json"
     )
 
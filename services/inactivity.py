@@ -816,13 +816,10 @@ async def run_enforcement_step(
     bot_top_role = bot_member.top_role if bot_member else None
 
     for shard in shards:
-        data = await state.storage._read_shard_file(state.storage.shard_path(shard))
-        parsed_ids: list[tuple[int, str]] = []
-        for uid in data.keys():
-            uid_int = safe_int(uid)
-            if uid_int is not None:
-                parsed_ids.append((uid_int, uid))
-        parsed_ids.sort(key=lambda item: item[0])
+        data = await state.storage.read_shard(shard)
+        parsed_ids: list[tuple[int, str]] = sorted(
+            (int(uid), uid) for uid in data if uid.isdecimal()
+        )
 
         for user_id_int, user_id in parsed_ids:
             # Skip users we've already processed in this shard
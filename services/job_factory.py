@@ -5,14 +5,19 @@ Centralizes job creation logic that was previously duplicated in bot.py.
 """
 from __future__ import annotations
 
-import re
 from typing import Any, Optional
 
 import discord
 
 from core.constants import K, JobSource
 from core.types import AttachmentInfo, LinkedMessage, ScanJob
-from core.utils import dt_to_iso, utcnow
+from core.utils import (
+    build_cdn_regex,
+    dt_to_iso,
+    extract_first_cdn_url,
+    extract_first_message_link,
+    utcnow,
+)
 
 
 class JobFactory:
@@ -27,9 +32,7 @@ class JobFactory:
         self._max_image_bytes = int(config.get(K.MAX_IMAGE_BYTES, 0))
         self._enable_cdn_scan = bool(config.get(K.ENABLE_DISCORD_CDN_URL_SCAN, False))
         self._enable_link_scan = bool(config.get(K.ENABLE_DISCORD_MESSAGE_LINK_SCAN, False))
-        self._cdn_regex = self._build_cdn_regex(
-            config.get(K.ALLOWED_DISCORD_CDN_DOMAINS, [])
-        )
+        self._cdn_regex = build_cdn_regex(config.get(K.ALLOWED_DISCORD_CDN_DOMAINS, []))
         self._guild_id = int(config.get(K.GUILD_ID, 0))
 
     def update_config(self, config: dict[str, Any]) -> None:
@@ -38,20 +41,9 @@ class JobFactory:
         self._max_image_bytes = int(config.get(K.MAX_IMAGE_BYTES, 0))
         self._enable_cdn_scan = bool(config.get(K.ENABLE_DISCORD_CDN_URL_SCAN, False))
         self._enable_link_scan = bool(config.get(K.ENABLE_DISCORD_MESSAGE_LINK_SCAN, False))
-        self._cdn_regex = self._build_cdn_regex(
-            config.get(K.ALLOWED_DISCORD_CDN_DOMAINS, [])
-        )
+        self._cdn_regex = build_cdn_regex(config.get(K.ALLOWED_DISCORD_CDN_DOMAINS, []))
         self._guild_id = int(config.get(K.GUILD_ID, 0))
 
-    @staticmethod
-    def _build_cdn_regex(allowed_domains: list[str]) -> re.Pattern[str]:
-        """Build regex for matching Discord CDN URLs."""
-        domains = [re.escape(domain) for domain in allowed_domains]
-        if not domains:
-            domains = [r"cdn\.discordapp\.com", r"media\.discordapp\.net"]
-        pattern = r"https://(?:" + "|".join(domains) + r")/[^\s>]+"
-        return re.compile(pattern, re.IGNORECASE)
-
     @staticmethod
     def _create_base(message: discord.Message, source: str) -> ScanJob:
         """Create a base job with common fields."""
@@ -106,25 +98,11 @@ class JobFactory:
 
     def extract_cdn_url(self, content: str) -> Optional[str]:
         """Extract first Discord CDN URL from content."""
-        if not content:
-            return None
-        match = self._cdn_regex.search(content)
-        return match.group(0) if match else None
+        return extract_first_cdn_url(content, self._cdn_regex)
 
     def extract_message_link(self, content: str) -> Optional[tuple[str, str, str]]:
         """Extract first message link pointing to current guild."""
-        if not content:
-            return None
-        
-        pattern = re.compile(
-            r"https://(?:discord\.com|discordapp\.com)/channels/(\d+)/(\d+)/(\d+)",
-            re.IGNORECASE,
-        )
-        
-        for match in pattern.finditer(content):
-            if int(match.group(1)) == self._guild_id:
-                return match.group(1), match.group(2), match.group(3)
-        return None
+        return extract_first_message_link(content, self._guild_id)
 
     def build_job_for_message(self, message: discord.Message) -> Optional[ScanJob]:
         """Build a scan job for a message if applicable (for first attachment/url)."""
@@ -6,11 +6,11 @@ Handles report creation, assignment, resolution, and auto-closing.
 from __future__ import annotations
 
 import uuid
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Mapping, Optional, Tuple, TYPE_CHECKING
 
-from core.report_storage import ReportStore
+from core.report_storage import ReportStore, get_report_store
 from core.types import UserReport
-from core.utils import utcnow, dt_to_iso
+from core.utils import dt_to_iso_now
 
 if TYPE_CHECKING:
     import discord
@@ -19,14 +19,9 @@ if TYPE_CHECKING:
 class ReportService:
     """Business logic for report management."""
 
-    def __init__(self) -> None:
-        self._stores: Dict[int, ReportStore] = {}
-
     def _get_store(self, guild_id: int) -> ReportStore:
-        """Get or create a report store for a guild."""
-        if guild_id not in self._stores:
-            self._stores[guild_id] = ReportStore(guild_id)
-        return self._stores[guild_id]
+        """Get the report store for a guild."""
+        return get_report_store(guild_id)
 
     async def initialize_store(self, guild_id: int) -> None:
         """Initialize storage for a guild."""
@@ -75,7 +70,7 @@ class ReportService:
             category=category,
             priority=priority,
             status="open",
-            created_at=dt_to_iso(utcnow()),
+            created_at=dt_to_iso_now(),
         )
 
         await store.add_report(report)
@@ -91,10 +86,26 @@ class ReportService:
         guild_id: int,
         status: Optional[str] = None,
         category: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> List[UserReport]:
         """Get reports with optional filters."""
         store = self._get_store(guild_id)
-        return await store.get_reports(status, category)
+        return await store.get_reports(status, category, limit)
+
+    async def get_report_dicts(
+        self,
+        guild_id: int,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get raw report records with optional filters (read-only)."""
+        store = self._get_store(guild_id)
+        return await store.get_report_dicts(status, category)
+
+    async def find_report(self, guild_id: int, id_prefix: str) -> Optional[UserReport]:
+        """Find a report by ID or ID prefix."""
+        store = self._get_store(guild_id)
+        return await store.find_report(id_prefix)
 
     async def assign_report(
         self,
@@ -145,7 +156,7 @@ class ReportService:
         self,
         guild_id: int,
         user_id: int,
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """Get reporter statistics."""
         store = self._get_store(guild_id)
         return await store.get_reporter_stats(user_id)
@@ -237,7 +248,7 @@ class ReportService:
 
     # ─── Configuration ────────────────────────────────────────────────────────
 
-    async def get_categories(self, guild_id: int) -> List[str]:
+    async def get_categories(self, guild_id: int) -> Tuple[str, ...]:
         """Get available report categories."""
         store = self._get_store(guild_id)
         return await store.get_categories()
@@ -251,8 +262,7 @@ class ReportService:
         categories = await store.get_categories()
         if category in [c.lower() for c in categories]:
             return False
-        categories.append(category)
-        await store.update_config({"categories": categories})
+        await store.update_config({"categories": [*categories, category]})
         return True
 
     async def remove_category(self, guild_id: int, category: str) -> bool:
@@ -17,7 +17,12 @@ import discord
 from core.constants import K
 from core.config import ConfigError, load_guild_config
 from core.link_storage import get_link_storage
-from core.sync_protection import get_sync_protection
+from core.sync_protection import (
+    CIRCUIT_OPEN,
+    CIRCUIT_PENDING_APPROVAL,
+    TRACKED_ACTIONS,
+    get_sync_protection,
+)
 from core.utils import utcnow, dt_to_iso
 
 logger = logging.getLogger("discbot.sync")
@@ -260,7 +265,7 @@ class SyncService:
             allowed, reason = await protection.is_sync_allowed(origin_guild_id, child_guild_id)
             if not allowed:
                 cb = await protection.get_circuit_state(origin_guild_id, child_guild_id)
-                if cb.state == "pending_approval":
+                if cb.state == CIRCUIT_PENDING_APPROVAL:
                     await protection.queue_action(
                         origin_guild_id,
                         child_guild_id,
@@ -394,7 +399,7 @@ class SyncService:
         allowed, reason = await protection.is_sync_allowed(child_guild_id, parent_guild_id)
         if not allowed:
             cb = await protection.get_circuit_state(child_guild_id, parent_guild_id)
-            if cb.state == "pending_approval":
+            if cb.state == CIRCUIT_PENDING_APPROVAL:
                 await protection.queue_action(
                     child_guild_id,
                     parent_guild_id,
@@ -577,10 +582,10 @@ class SyncService:
                 continue
 
             cb = await protection.get_circuit_state(origin_guild.id, child_guild_id)
-            if cb.state == "open":
+            if cb.state == CIRCUIT_OPEN:
                 continue
 
-            if cb.state != "pending_approval":
+            if cb.state != CIRCUIT_PENDING_APPROVAL:
                 reason = self._format_burst_reason(count, max_actions, window_seconds)
                 await protection.trip_circuit(origin_guild.id, child_guild_id, reason=reason)
 
@@ -628,10 +633,10 @@ class SyncService:
         _child_link, parent_guild, channel = context
 
         cb = await protection.get_circuit_state(child_guild.id, parent_guild_id)
-        if cb.state == "open":
+        if cb.state == CIRCUIT_OPEN:
             return
 
-        if cb.state != "pending_approval":
+        if cb.state != CIRCUIT_PENDING_APPROVAL:
             reason = self._format_burst_reason(count, max_actions, window_seconds)
             await protection.trip_circuit(child_guild.id, parent_guild_id, reason=reason)
 
@@ -931,7 +936,8 @@ async def sync_action_downstream(
     )
 
     protection = await get_sync_protection()
-    await protection.record_action(origin_guild.id, action_type, user_id)
+    if action_type in TRACKED_ACTIONS:
+        await protection.record_action(origin_guild.id, action_type, user_id)
     is_burst, count, max_actions = await protection.check_burst(origin_guild.id)
     if is_burst:
         window_seconds, _ = await protection.get_guild_thresholds(origin_guild.id)
@@ -972,7 +978,7 @@ async def request_upstream(
     )
 
     protection = await get_sync_protection()
-    if record_action:
+    if record_action and action_type in TRACKED_ACTIONS:
         await protection.record_action(origin_guild.id, action_type, user_id)
     is_burst, count, max_actions = await protection.check_burst(origin_guild.id)
     window_seconds, _ = await protection.get_guild_thresholds(origin_guild.id)
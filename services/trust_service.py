@@ -17,7 +17,7 @@ from typing import Dict, List, Optional
 
 import discord
 
-from core.trust_storage import TrustStore
+from core.trust_storage import TrustStore, get_trust_store
 from core.types import TrustScore, Vouch
 from core.utils import utcnow, dt_to_iso, iso_to_dt
 from core.link_storage import get_link_storage
@@ -81,7 +81,7 @@ class TrustService:
         - approval_rate: 25%
         """
         if store is None:
-            store = TrustStore(guild_id)
+            store = get_trust_store(guild_id)
             await store.initialize()
 
         async with self._calculation_lock:
@@ -272,7 +272,7 @@ class TrustService:
         details: Optional[str] = None,
     ) -> None:
         """Record a positive trust event."""
-        store = TrustStore(guild_id)
+        store = get_trust_store(guild_id)
         await store.initialize()
         await store.add_event(user_id, event_type, weight, positive=True, details=details)
 
@@ -288,7 +288,7 @@ class TrustService:
         details: Optional[str] = None,
     ) -> None:
         """Record a negative trust event."""
-        store = TrustStore(guild_id)
+        store = get_trust_store(guild_id)
         await store.initialize()
         await store.add_event(user_id, event_type, weight, positive=False, details=details)
 
@@ -302,7 +302,7 @@ class TrustService:
 
         Returns number of scores recalculated.
         """
-        store = TrustStore(guild_id)
+        store = get_trust_store(guild_id)
         await store.initialize()
 
         scores = await store.get_all_scores()
@@ -317,7 +317,7 @@ class TrustService:
 
     async def get_score(self, user_id: int, guild_id: int) -> Optional[TrustScore]:
         """Get trust score for a user, calculating if needed."""
-        store = TrustStore(guild_id)
+        store = get_trust_store(guild_id)
         await store.initialize()
 
         score = await store.get_score(user_id)
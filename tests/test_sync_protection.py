@@ -0,0 +1,76 @@
+"""
+Checks for SyncProtection's migration from the pre-sharding protection_state.json.
+
+Run from the repository root: python -m unittest tests.test_sync_protection
+"""
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import core.sync_protection as sp
+
+
+class LegacyMigrationTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self._saved = (sp.PROTECTION_DIR, sp.HISTORY_DIR, sp.CIRCUITS_DIR)
+        sp.PROTECTION_DIR = root
+        sp.HISTORY_DIR = root / "action_history"
+        sp.CIRCUITS_DIR = root / "circuits"
+        legacy = {
+            "action_history": {},
+            "circuit_breakers": {
+                "1:2": {
+                    "state": "pending_approval",
+                    "trigger_reason": "burst",
+                    "approval_message_id": 99,
+                    "queued_actions": [],
+                },
+            },
+        }
+        (root / "protection_state.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    def tearDown(self) -> None:
+        sp.PROTECTION_DIR, sp.HISTORY_DIR, sp.CIRCUITS_DIR = self._saved
+        self._tmp.cleanup()
+
+    async def test_pending_circuit_blocks_sync_on_first_boot(self) -> None:
+        protection = sp.SyncProtection()
+        await protection.initialize()
+        try:
+            allowed, reason = await protection.is_sync_allowed(1, 2)
+            self.assertFalse(allowed)
+            self.assertIn("Awaiting approval", reason or "")
+
+            tripped = await protection.get_all_tripped_circuits(2)
+            self.assertEqual([from_id for from_id, _ in tripped], [1])
+
+            found = await protection.find_circuit_by_message_id(99)
+            self.assertIsNotNone(found)
+            self.assertEqual(found[:2], (1, 2))
+        finally:
+            await protection.flush()
+
+        self.assertFalse((sp.PROTECTION_DIR / "protection_state.json").exists())
+        self.assertTrue(sp.CIRCUITS_DIR.is_dir())
+
+    async def test_pending_circuit_survives_restart(self) -> None:
+        first = sp.SyncProtection()
+        await first.initialize()
+        await first.flush()
+
+        restarted = sp.SyncProtection()
+        await restarted.initialize()
+        try:
+            allowed, _ = await restarted.is_sync_allowed(1, 2)
+            self.assertFalse(allowed)
+        finally:
+            await restarted.flush()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Checks for the bounded per-user UtilityStore registry.
+
+Run from the repository root: python -m unittest tests.test_utility_storage
+"""
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import core.utility_storage as us
+
+
+class UserStoreRegistryTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self._saved = (us.UTILITY_DIR, us.USER_STORE_CACHE_SIZE, dict(us._user_stores))
+        us.UTILITY_DIR = Path(self._tmp.name)
+        us.USER_STORE_CACHE_SIZE = 3
+        us._user_stores.clear()
+
+    async def asyncTearDown(self) -> None:
+        await us.close_all()
+
+    def tearDown(self) -> None:
+        us.UTILITY_DIR, us.USER_STORE_CACHE_SIZE, saved = self._saved
+        us._user_stores.clear()
+        us._user_stores.update(saved)
+        self._tmp.cleanup()
+
+    async def test_idle_stores_are_evicted_least_recently_used_first(self) -> None:
+        for user_id in (1, 2, 3):
+            await us.get_utility_store(user_id).is_afk()
+        us.get_utility_store(1)  # touch: 2 is now the least recently used
+        us.get_utility_store(4)
+        us.get_utility_store(5)
+
+        self.assertEqual(list(us._user_stores), [1, 4, 5])
+
+    async def test_store_with_pending_writes_is_kept_until_flushed(self) -> None:
+        busy = us.get_utility_store(1)
+        await busy.set_afk("away")
+        for user_id in (2, 3, 4, 5):
+            us.get_utility_store(user_id)
+
+        # The idle stores 2 and 3 made room; the dirty store 1 was skipped.
+        self.assertIs(us._user_stores.get(1), busy)
+        self.assertEqual(list(us._user_stores), [1, 4, 5])
+
+        await busy.flush()
+        us.get_utility_store(6)
+
+        self.assertEqual(list(us._user_stores), [4, 5, 6])
+        # The write reached disk before the store was dropped.
+        self.assertEqual(await us.get_utility_store(1).is_afk(), (True, "away"))
+
+    async def test_afk_check_reads_only_afk_file(self) -> None:
+        store = us.get_utility_store(1)
+        await store.initialize()
+        await store.is_afk()
+        self.assertEqual(list(store._cache), [store.afk_path])
+
+        await store.initialize(preload=True)
+        self.assertEqual(
+            set(store._cache), {store.bookmarks_path, store.notes_path, store.afk_path}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()